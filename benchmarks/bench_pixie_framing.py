@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+import socket
+import threading
+import time
+
+from bidfx.pricing._pixie.util.frame_reader import FrameReader
+from bidfx.pricing._pixie.util.varint import (
+    encode_varint,
+    decode_varint_from_socket,
+    read_bytes,
+)
+
+"""
+Micro-benchmark of Pixie message framing. Streams a sequence of price sync sized messages
+over a local socket pair and compares reading them byte-wise with socket recv calls
+against the buffered FrameReader.
+"""
+
+MESSAGE_COUNT = 20000
+
+
+class CountingSocket:
+    def __init__(self, opened_socket):
+        self._opened_socket = opened_socket
+        self.calls = 0
+
+    def recv(self, size):
+        self.calls += 1
+        return self._opened_socket.recv(size)
+
+    def recv_into(self, view):
+        self.calls += 1
+        return self._opened_socket.recv_into(view)
+
+
+def message_stream(body_size):
+    body = b"P" + bytes(body_size)
+    return (encode_varint(len(body)) + body) * MESSAGE_COUNT
+
+
+def read_with_recv(opened_socket):
+    for _ in range(MESSAGE_COUNT):
+        length = decode_varint_from_socket(opened_socket)
+        read_bytes(opened_socket, 1)
+        bytearray(read_bytes(opened_socket, length - 1))
+
+
+def read_with_frame_reader(opened_socket):
+    frame_reader = FrameReader(opened_socket)
+    for _ in range(MESSAGE_COUNT):
+        frame_reader.read_frame()
+
+
+def run(read_fn, stream):
+    reader_socket, writer_socket = socket.socketpair()
+    writer = threading.Thread(target=writer_socket.sendall, args=(stream,))
+    counting_socket = CountingSocket(reader_socket)
+    start = time.perf_counter()
+    writer.start()
+    read_fn(counting_socket)
+    seconds = time.perf_counter() - start
+    writer.join()
+    reader_socket.close()
+    writer_socket.close()
+    return seconds, counting_socket.calls
+
+
+def main():
+    print(f"{'body':>6} {'path':>12} {'ms':>9} {'us/msg':>8} {'recv calls':>11}")
+    for body_size in (50, 500, 5000):
+        stream = message_stream(body_size)
+        for name, read_fn in (
+            ("recv", read_with_recv),
+            ("FrameReader", read_with_frame_reader),
+        ):
+            seconds, calls = run(read_fn, stream)
+            print(
+                f"{body_size:>6} {name:>12} {seconds * 1e3:>9.1f} "
+                f"{seconds * 1e6 / MESSAGE_COUNT:>8.2f} {calls:>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+import timeit
+
+from bidfx.pricing._field_selection import FieldSelection
+from bidfx.pricing._pixie.data_dictionary import DataDictionary
+from bidfx.pricing._pixie.message.field_def_message import FieldDefMessage
+from bidfx.pricing._pixie.message.price_sync_message import PriceSyncMessage
+from bidfx.pricing._pixie.util.buffer_reader import BufferReader
+from bidfx.pricing._pixie.util.buffer_reads import read_double_fixed8, read_long_fixed8
+from bidfx.pricing._pixie.util.varint import (
+    encode_varint,
+    encode_zigzag,
+    decode_varint,
+    decode_zigzag,
+)
+from bidfx.pricing.callbacks import Callbacks
+
+"""
+Benchmark of Pixie PriceSync decoding. Decodes uncompressed price syncs of increasing size
+and reports the cost per price update, which should remain flat as the sync size grows.
+The syncs are decoded once with all fields and once with a selection of just the Bid and Ask fields.
+"""
+
+DATA_DICTIONARY = DataDictionary(
+    [
+        FieldDefMessage(0, read_double_fixed8, decode_varint, 6, "Bid"),
+        FieldDefMessage(1, read_double_fixed8, decode_varint, 6, "Ask"),
+        FieldDefMessage(2, read_long_fixed8, decode_varint, 0, "BidSize"),
+        FieldDefMessage(3, read_long_fixed8, decode_varint, 0, "AskSize"),
+        FieldDefMessage(4, read_long_fixed8, decode_varint, 0, "OriginTime"),
+        FieldDefMessage(5, read_double_fixed8, decode_zigzag, 4, "NetChange"),
+    ]
+)
+
+
+def price_sync_bytes(size):
+    buffer = bytearray()
+    buffer += encode_varint(0)  # not compressed
+    buffer += encode_varint(1)  # revision
+    buffer += encode_varint(1575017707401)  # revision time
+    buffer += encode_varint(0)  # conflation latency
+    buffer += encode_varint(1)  # edition
+    buffer += encode_varint(size)
+    for sid in range(size):
+        buffer += b"f"
+        buffer += encode_varint(sid)
+        buffer += encode_varint(len(DATA_DICTIONARY))
+        for fid, value in (
+            (0, 1123450 + sid),
+            (1, 1123470 + sid),
+            (2, 1000000),
+            (3, 2000000),
+            (4, 1575017707401),
+            (5, encode_zigzag(-25 - sid)),
+        ):
+            buffer += encode_varint(fid)
+            buffer += encode_varint(value)
+    return bytes(buffer)
+
+
+def decode(message_bytes, subjects, callbacks, field_selection):
+    price_sync = PriceSyncMessage(BufferReader(message_bytes), None)
+    price_sync.visit_updates(subjects, DATA_DICTIONARY, callbacks, field_selection)
+
+
+def main():
+    all_fields = FieldSelection()
+    bid_ask = FieldSelection()
+    bid_ask.select(["Bid", "Ask"])
+    for title, field_selection in (("all fields", all_fields), ("Bid/Ask", bid_ask)):
+        print(title)
+        run(field_selection)
+
+
+def run(field_selection):
+    callbacks = Callbacks()
+    print(f"{'updates':>8} {'bytes':>9} {'ms/sync':>9} {'us/update':>10}")
+    for size in (10, 100, 1000, 10000):
+        message_bytes = price_sync_bytes(size)
+        subjects = [f"subject-{sid}" for sid in range(size)]
+        repeat = max(1, 20000 // size)
+        seconds = min(
+            timeit.repeat(
+                lambda: decode(message_bytes, subjects, callbacks, field_selection),
+                number=repeat,
+                repeat=5,
+            )
+        )
+        per_sync = seconds / repeat
+        print(
+            f"{size:>8} {len(message_bytes):>9} {per_sync * 1e3:>9.3f} "
+            f"{per_sync * 1e6 / size:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
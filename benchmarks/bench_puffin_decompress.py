@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+import time
+
+from bidfx.pricing._puffin.element import Element
+from bidfx.pricing._puffin.message_compressor import MessageCompressor
+from bidfx.pricing._puffin.message_decompressor import MessageDecompressor
+from bidfx.pricing._puffin.token_dictionary import Token, TokenType
+
+"""
+Benchmark of Puffin message decompression. Records a stream of shared pricing updates,
+compressed as a Puffin server would send them, and reports the throughput of decompressing
+the stream back into price update messages.
+"""
+
+MESSAGE_COUNT = 50000
+CHUNK_SIZE = 16384
+
+
+class RecordingSocket:
+    def __init__(self):
+        self.data = bytearray()
+
+    def sendall(self, data):
+        self.data += data
+
+
+class ReplaySocket:
+    def __init__(self, data):
+        self._view = memoryview(data)
+        self._position = 0
+
+    def recv_into(self, buffer):
+        size = min(len(buffer), CHUNK_SIZE, len(self._view) - self._position)
+        buffer[:size] = self._view[self._position : self._position + size]
+        self._position += size
+        return size
+
+
+class ServerCompressor(MessageCompressor):
+    # Compresses nested elements with typed attribute values, in the way of a Puffin server.
+    def compress_element(self, element: Element):
+        self.write_token(Token(TokenType.START, element.tag))
+        for name, value in element.attributes():
+            self.write_token(Token(TokenType.NAME, name))
+            self.write_token(Token(value_type(value), value))
+        if element._sub_elements:
+            for sub_element in element._sub_elements:
+                self.compress_element(sub_element)
+            self._write_type(TokenType.END)
+        else:
+            self._write_type(TokenType.EMPTY)
+
+
+def value_type(value):
+    if value.isdigit():
+        return TokenType.INTEGER
+    if value.replace(".", "", 1).isdigit():
+        return TokenType.DOUBLE
+    return TokenType.STRING
+
+
+def price_update(i):
+    symbol = ("EURUSD", "GBPUSD", "USDJPY", "AUDUSD", "USDCHF")[i % 5]
+    return (
+        Element("Update")
+        .set(
+            "Subject", f"AssetClass=Fx,Exchange=OTC,Level=1,Source=Indi,Symbol={symbol}"
+        )
+        .nest(
+            Element("Price")
+            .set("Bid", f"1.{10000 + i % 997}")
+            .set("Ask", f"1.{10020 + i % 991}")
+            .set("BidSize", str(1000000 * (1 + i % 5)))
+            .set("AskSize", str(1000000 * (1 + i % 7)))
+            .set("OriginTime", str(1575017707401 + i))
+        )
+    )
+
+
+def recorded_stream():
+    recording = RecordingSocket()
+    compressor = ServerCompressor(recording)
+    for i in range(MESSAGE_COUNT):
+        compressor.compress_element(price_update(i))
+    compressor.flush()
+    return bytes(recording.data)
+
+
+def main():
+    stream = recorded_stream()
+    decompressor = MessageDecompressor(ReplaySocket(stream))
+    start = time.perf_counter()
+    for _ in range(MESSAGE_COUNT):
+        decompressor.decompress_message()
+    seconds = time.perf_counter() - start
+    print(f"{'messages':>9} {'bytes':>9} {'us/message':>11} {'MB/s':>7}")
+    print(
+        f"{MESSAGE_COUNT:>9} {len(stream):>9} {seconds * 1e6 / MESSAGE_COUNT:>11.2f} "
+        f"{len(stream) / seconds / 1e6:>7.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,26 @@
+from .async_pricing import AsyncPricingAPI, EventStream
+from .best_price import BestPriceAggregator
 from .callbacks import Callbacks
+from .depth_book import DepthBookCache, DepthBook, BookSide
+from .dispatcher import CallbackDispatcher
 from .events import (
     PriceEvent,
+    PriceBatchEvent,
+    BestPriceEvent,
+    DepthEvent,
     SubscriptionEvent,
     ProviderEvent,
     SubscriptionStatus,
     ProviderStatus,
 )
 from .field import Field
+from .price_cache import PriceCache
 from .pricing import PricingAPI
+from .quote_table import QuoteTable
 from .provider import PriceProvider
+from .scaled_value import ScaledValue
 from .subject import Subject
+from .tick_history import TickHistory
 from .tenor import Tenor
 
 __all__ = [
@@ -17,9 +28,23 @@ __all__ = [
     "Subject",
     "Tenor",
     "PricingAPI",
+    "AsyncPricingAPI",
+    "EventStream",
     "Callbacks",
+    "CallbackDispatcher",
+    "PriceCache",
+    "QuoteTable",
+    "TickHistory",
+    "BestPriceAggregator",
+    "DepthBookCache",
+    "DepthBook",
+    "BookSide",
     "PriceProvider",
     "PriceEvent",
+    "PriceBatchEvent",
+    "BestPriceEvent",
+    "DepthEvent",
+    "ScaledValue",
     "SubscriptionEvent",
     "ProviderEvent",
     "SubscriptionStatus",
@@ -0,0 +1,87 @@
+class CallbackStage:
+    """
+    A stage that maintains some state from the events published to a set of `Callbacks`,
+    and forwards every event to them. A stage has the same callback function attributes as `Callbacks`,
+    so stages can be chained in front of the API user's callbacks.
+
+    Price batches are always requested from the upstream publisher, so that a stage applies each batch as a whole,
+    and are forwarded as single price events when the downstream callbacks have no batch function.
+    Subclasses override the `_before_publish` and `_after_publish` hooks to apply price updates,
+    and `_on_subscription` to act on subscription events.
+    """
+
+    def __init__(self, callbacks):
+        """
+        :param callbacks: The callback functions to forward events to.
+        :type callbacks: Callbacks
+        """
+        self._callbacks = callbacks
+
+    def discard(self, subject):
+        """
+        Drops the state held for a subject, which is called when the subject is unsubscribed.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        """
+
+    @property
+    def price_event_fn(self):
+        return self._on_price
+
+    @property
+    def price_batch_fn(self):
+        return self._on_price_batch
+
+    @property
+    def subscription_event_fn(self):
+        return self._on_subscription
+
+    @property
+    def provider_event_fn(self):
+        return self._callbacks.provider_event_fn
+
+    @property
+    def best_price_fn(self):
+        return self._callbacks.best_price_fn
+
+    @property
+    def depth_event_fn(self):
+        return self._callbacks.depth_event_fn
+
+    def _on_price(self, event):
+        events = (event,)
+        applied = self._before_publish(events, None)
+        self._callbacks.price_event_fn(event)
+        self._after_publish(events, applied)
+
+    def _on_price_batch(self, batch):
+        applied = self._before_publish(batch.events, batch)
+        if self._callbacks.price_batch_fn:
+            self._callbacks.price_batch_fn(batch)
+        else:
+            publish = self._callbacks.price_event_fn
+            for event in batch.events:
+                publish(event)
+        self._after_publish(batch.events, applied)
+
+    def _on_subscription(self, event):
+        self._callbacks.subscription_event_fn(event)
+
+    def _before_publish(self, events, batch):
+        """
+        Applies price updates before they are forwarded.
+
+        :param events: The price events.
+        :param batch: The `PriceBatchEvent` holding the events, or None for a single price event.
+        :return: A value passed on to `_after_publish`.
+        """
+        return None
+
+    def _after_publish(self, events, applied):
+        """
+        Applies price updates after they have been forwarded.
+
+        :param events: The price events.
+        :param applied: The value returned by `_before_publish`.
+        """
@@ -0,0 +1,33 @@
+import threading
+
+
+class FieldSelection:
+    """
+    The allow-list of price fields that the application wants published, set globally and per subject.
+    A subject's own selection takes precedence over the global one, and a selection of None means all fields.
+    Selections are replaced copy-on-write so the price reading threads can look them up without locking.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._global_fields = None
+        self._subject_fields = {}
+
+    def select(self, fields, subject=None):
+        fields = None if fields is None else frozenset(fields)
+        with self._lock:
+            if subject is None:
+                self._global_fields = fields
+            else:
+                subject_fields = dict(self._subject_fields)
+                if fields is None:
+                    subject_fields.pop(subject, None)
+                else:
+                    subject_fields[subject] = fields
+                self._subject_fields = subject_fields
+
+    def fields_for(self, subject):
+        return self._subject_fields.get(subject, self._global_fields)
+
+    def is_empty(self):
+        return self._global_fields is None and not self._subject_fields
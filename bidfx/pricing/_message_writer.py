@@ -0,0 +1,115 @@
+__all__ = ["MessageWriter"]
+
+import logging
+import threading
+import time
+from collections import deque
+
+log = logging.getLogger("bidfx.pricing.writer")
+
+SLOW_WRITE_SECONDS = 1.0
+
+
+class MessageWriter:
+    """
+    Writes the outbound messages of a connection from a dedicated thread, so that a stalled socket write
+    never holds up the reading of the connection. Messages may be sent by any thread. All of the messages
+    queued by the time the writer is ready are written together. A message of a replaceable kind,
+    such as a cumulative ack, replaces the queued message of the same kind wherever it is in the queue,
+    so a stalled socket holds at most one message of each such kind.
+    The latency from queuing a message to completing its write is measured.
+    """
+
+    def __init__(self, name, write_messages, on_error, kind_of=None):
+        """
+        :param name: The name of the connection, used to name the writer thread.
+        :param write_messages: Function that writes a list of messages to the connection in one write.
+        :param on_error: Function called with the exception if a write fails, after which the writer stops.
+        :param kind_of: Optional function of a message returning its replaceable kind,
+            or None if the message must never be replaced.
+        """
+        self._name = name
+        self._write_messages = write_messages
+        self._on_error = on_error
+        self._kind_of = kind_of
+        # Each entry is a list of the message and its queuing time.
+        self._queue = deque()
+        self._queued_kinds = {}
+        self._condition = threading.Condition()
+        self._running = False
+        self.messages = 0
+        self.writes = 0
+        self.superseded = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self._total_latency = 0.0
+
+    @property
+    def mean_latency(self):
+        return self._total_latency / self.writes if self.writes else 0.0
+
+    def start(self):
+        self._running = True
+        threading.Thread(
+            target=self._write_loop, name=self._name + "-write", daemon=True
+        ).start()
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._queue.clear()
+            self._queued_kinds.clear()
+            self._condition.notify()
+
+    def send(self, message):
+        with self._condition:
+            kind = self._kind_of(message) if self._kind_of else None
+            entry = self._queued_kinds.get(kind) if kind is not None else None
+            if entry is not None:
+                # The replacement keeps the place and queuing time of the message it replaces.
+                entry[0] = message
+                self.superseded += 1
+                return
+            entry = [message, time.perf_counter()]
+            self._queue.append(entry)
+            if kind is not None:
+                self._queued_kinds[kind] = entry
+            self._condition.notify()
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                while not self._queue and self._running:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                queued = list(self._queue)
+                self._queue.clear()
+                self._queued_kinds.clear()
+            try:
+                self._write_messages([message for message, _ in queued])
+            except Exception as e:
+                log.warning(f"{self._name} write failed due to: {e}")
+                with self._condition:
+                    self._running = False
+                self._on_error(e)
+                return
+            self._record_latency(time.perf_counter() - queued[0][1], len(queued))
+
+    def _record_latency(self, latency, count):
+        self.messages += count
+        self.writes += 1
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        self._total_latency += latency
+        if latency > SLOW_WRITE_SECONDS:
+            log.warning(
+                f"{self._name} took {latency:.3f}s to write {count} queued messages"
+            )
+
+    def __str__(self):
+        return (
+            f"{self._name} wrote {self.messages} messages in {self.writes} writes, "
+            f"{self.superseded} superseded, latency mean:{self.mean_latency * 1000:.3f}ms "
+            f"max:{self.max_latency * 1000:.3f}ms"
+        )
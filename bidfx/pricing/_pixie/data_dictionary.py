@@ -0,0 +1,85 @@
+import logging
+
+from bidfx.exceptions import PricingError
+from bidfx.pricing._price_values import STRING_VALUES
+
+log = logging.getLogger("bidfx.pricing.pixie")
+
+
+def _undefined_field(_reader):
+    raise PricingError("price field is not defined in the Pixie data dictionary")
+
+
+_UNDEFINED_DECODER = (None, _undefined_field)
+
+
+class DataDictionary:
+    """
+    The Pixie data dictionary of price field definitions.
+    Each definition is compiled into a decoder held in a list indexed by FID.
+    Each decoder entry is a pair of the field name, or None for a disabled field, and the
+    function that decodes the field's value. Disabled fields are skipped over rather than decoded.
+    """
+
+    def __init__(self, definitions=(), price_values=STRING_VALUES):
+        self._price_values = price_values
+        self._definitions = {}
+        self._projections = {}
+        self.field_decoders = []
+        self.update(definitions)
+
+    def update(self, definitions):
+        """
+        Merges field definitions into the dictionary, recompiling only the decoders of those fields
+        whose definitions have changed.
+        """
+        for definition in definitions:
+            if self._definitions.get(definition.fid) != definition:
+                self._definitions[definition.fid] = definition
+                self._compile_field(definition)
+
+    def definition(self, fid):
+        return self._definitions.get(fid)
+
+    def projected_decoders(self, fields):
+        """
+        Gets the field decoders projected onto a set of selected field names.
+        The fields not selected are skipped over using the width of their encoding.
+        Projections are cached until the dictionary is next updated.
+
+        :param fields: The names of the fields to decode, or None for all fields.
+        """
+        if fields is None:
+            return self.field_decoders
+        projection = self._projections.get(fields)
+        if projection is None:
+            projection = [
+                entry if entry[0] is None or entry[0] in fields else self._skip(fid)
+                for fid, entry in enumerate(self.field_decoders)
+            ]
+            self._projections[fields] = projection
+        return projection
+
+    def _skip(self, fid):
+        return None, self._definitions[fid].compile_skipper()
+
+    def _compile_field(self, definition):
+        fid = definition.fid
+        if fid >= len(self.field_decoders):
+            self.field_decoders.extend(
+                [_UNDEFINED_DECODER] * (fid + 1 - len(self.field_decoders))
+            )
+        if definition.enabled:
+            decoder = definition.compile_decoder(self._price_values)
+            self.field_decoders[fid] = (definition.name, decoder)
+        else:
+            self.field_decoders[fid] = (None, definition.compile_skipper())
+        self._projections = {}
+        log.debug(f"compiled decoder for FID:{fid} name:{definition.name}")
+
+    def __len__(self):
+        return len(self._definitions)
+
+    def __str__(self):
+        definitions = ", ".join(str(d) for d in self._definitions.values())
+        return f"DataDictionary size:{len(self)} definitions:[{definitions}]"
@@ -1,5 +1,6 @@
 from bidfx.pricing._pixie.message.field_def_message import FieldDefMessage
 from .pixie_message_type import PixieMessageType
+from ..util.buffer_reader import BufferReader
 from ..util.varint import decode_varint
 
 
@@ -12,7 +13,9 @@ class DataDictionaryMessage:
         self.is_compressed = bool(option & 1)
         self.size = decode_varint(input_buff)
         if self.is_compressed:
-            input_buff = decompressor.decompress(input_buff)  # decompressing using zlib
+            input_buff = BufferReader(  # decompressing using zlib
+                decompressor.decompress(input_buff.read_remaining())
+            )
         self.definitions = [
             FieldDefMessage.create_from_bytes(input_buff) for _ in range(self.size)
         ]
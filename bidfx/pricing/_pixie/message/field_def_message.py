@@ -3,6 +3,8 @@ import struct
 from typing import Callable
 
 from bidfx.exceptions import PricingError
+from bidfx.pricing._price_values import STRING_VALUES, SCALED_VALUES
+from bidfx.pricing._pixie.util.buffer_reader import BufferReader
 from bidfx.pricing._pixie.util.buffer_reads import (
     read_double_fixed8,
     read_long_fixed8,
@@ -17,8 +19,13 @@ from bidfx.pricing._pixie.util.buffer_reads import (
     read_byte,
     scale_to_double,
     scale_to_long,
+    fixed_skipper,
+    skip_byte_array,
+    skip_string,
+    skip_varint,
 )
 from bidfx.pricing._pixie.util.varint import decode_string, decode_varint, decode_zigzag
+from bidfx.pricing.scaled_value import ScaledValue
 
 log = logging.getLogger("bidfx.pricing.pixie.message")
 
@@ -62,6 +69,22 @@ class FieldEncoding:
             raise PricingError(f"unexpected Pixie price field encoding: {code}")
 
 
+FIELD_SKIPPERS = {
+    read_fixed1: fixed_skipper(1),
+    read_fixed2: fixed_skipper(2),
+    read_fixed3: fixed_skipper(3),
+    read_fixed4: fixed_skipper(4),
+    read_fixed8: fixed_skipper(8),
+    read_fixed16: fixed_skipper(16),
+    read_byte_array: skip_byte_array,
+    decode_varint: skip_varint,
+    decode_zigzag: skip_varint,
+    decode_string: skip_string,
+    read_double_fixed8: fixed_skipper(8),
+    read_long_fixed8: fixed_skipper(8),
+    read_int_fixed4: fixed_skipper(4),
+}
+
 LEGACY_FIELDS = ("Status", "SystemTime", "SystemLatency", "HopLatency1", "HopLatency2")
 
 
@@ -83,22 +106,51 @@ class FieldDefMessage:
         log.debug(str(self))
 
     @classmethod
-    def create_from_bytes(cls, buffer):
-        fid = decode_varint(buffer)
-        field_type = FieldType.by_code(read_byte(buffer).decode("ascii"))
-        field_encoding = FieldEncoding.by_code(read_byte(buffer).decode("ascii"))
-        scale = decode_varint(buffer)
-        name = decode_string(buffer)
+    def create_from_bytes(cls, reader: BufferReader):
+        fid = decode_varint(reader)
+        field_type = FieldType.by_code(read_byte(reader).decode("ascii"))
+        field_encoding = FieldEncoding.by_code(read_byte(reader).decode("ascii"))
+        scale = decode_varint(reader)
+        name = decode_string(reader)
         return cls(fid, field_type, field_encoding, scale, name)
 
-    def parse_value(self, buffer) -> str:
+    def compile_decoder(self, price_values=STRING_VALUES) -> Callable:
+        """
+        Compiles the definition into a single function that decodes one value of the field.
+        Numeric fields are decoded to str, or to int/float or `ScaledValue`, depending on *price_values*.
+        """
         if self.type == read_double_fixed8:
-            value = self._parse_double_value(buffer)
-        elif self.type == read_long_fixed8 or self.type == read_int_fixed4:
-            value = self._parse_int_value(buffer)
-        else:  # STRING
-            value = self.type(buffer)
-        return value
+            if price_values == STRING_VALUES:
+                return self._compile_double_decoder()
+            return self._compile_numeric_double_decoder(price_values == SCALED_VALUES)
+        if self.type == read_long_fixed8 or self.type == read_int_fixed4:
+            if price_values == STRING_VALUES:
+                return self._compile_int_decoder()
+            return self._compile_numeric_int_decoder()
+        return self.type  # STRING
+
+    def compile_skipper(self) -> Callable:
+        """
+        Compiles the definition into a function that steps over one value of the field without decoding it.
+        The width of the value is known from the field's encoding, or from its type when it has no encoding.
+        """
+        if self.type == decode_string or self.encoding is None:
+            return FIELD_SKIPPERS[self.type]
+        return FIELD_SKIPPERS[self.encoding]
+
+    def parse_value(self, reader: BufferReader) -> str:
+        return self.compile_decoder()(reader)
+
+    def __eq__(self, other):
+        if isinstance(other, FieldDefMessage):
+            return (
+                self.fid == other.fid
+                and self.type == other.type
+                and self.encoding == other.encoding
+                and self.scale == other.scale
+                and self.name == other.name
+            )
+        return False
 
     def __str__(self):
         return (
@@ -106,27 +158,61 @@ class FieldDefMessage:
             f"scale:{self.scale} name:{self.name} enabled:{self.enabled}"
         )
 
-    def _parse_double_value(self, buffer) -> str:
-        if self.encoding == decode_zigzag:
-            value = self.encoding(decode_varint(buffer))
-            value = scale_to_double(value, self.scale)
-        elif self.encoding == decode_varint:
-            value = scale_to_double(self.encoding(buffer), self.scale)
-        elif self.encoding is None:
-            value = self.type(buffer)
-        elif self.encoding == read_fixed8:
-            value = str(struct.unpack(">d", self.encoding(buffer))[0])
-        else:
-            value = str(struct.unpack(">f", self.encoding(buffer))[0])
-        return value
-
-    def _parse_int_value(self, buffer) -> str:
-        if self.encoding == decode_zigzag:
-            value = str(self.encoding(decode_varint(buffer)))
-        elif self.encoding == decode_varint:
-            value = scale_to_long(self.encoding(buffer), self.scale)
-        elif self.encoding is None:
-            value = str(self.type(buffer))
-        else:
-            value = str(int.from_bytes(self.encoding(buffer), byteorder="big"))
-        return value
+    def _compile_double_decoder(self) -> Callable:
+        scale = self.scale
+        encoding = self.encoding
+        if encoding == decode_zigzag:
+            return lambda reader: scale_to_double(
+                decode_zigzag(decode_varint(reader)), scale
+            )
+        if encoding == decode_varint:
+            return lambda reader: scale_to_double(decode_varint(reader), scale)
+        if encoding is None:
+            return self.type
+        if encoding == read_fixed8:
+            return lambda reader: str(read_double_fixed8(reader))
+        return lambda reader: str(struct.unpack(">f", encoding(reader))[0])
+
+    def _compile_int_decoder(self) -> Callable:
+        scale = self.scale
+        encoding = self.encoding
+        if encoding == decode_zigzag:
+            return lambda reader: str(decode_zigzag(decode_varint(reader)))
+        if encoding == decode_varint:
+            return lambda reader: scale_to_long(decode_varint(reader), scale)
+        if encoding is None:
+            field_type = self.type
+            return lambda reader: str(field_type(reader))
+        return lambda reader: str(int.from_bytes(encoding(reader), byteorder="big"))
+
+    def _compile_numeric_double_decoder(self, scaled) -> Callable:
+        scale = self.scale
+        encoding = self.encoding
+        if encoding == decode_zigzag:
+            if scaled:
+                return lambda reader: ScaledValue(
+                    decode_zigzag(decode_varint(reader)), scale
+                )
+            pow10 = 10 ** scale
+            return lambda reader: decode_zigzag(decode_varint(reader)) / pow10
+        if encoding == decode_varint:
+            if scaled:
+                return lambda reader: ScaledValue(decode_varint(reader), scale)
+            pow10 = 10 ** scale
+            return lambda reader: decode_varint(reader) / pow10
+        if encoding is None or encoding == read_fixed8:
+            return read_double_fixed8
+        return lambda reader: struct.unpack(">f", encoding(reader))[0]
+
+    def _compile_numeric_int_decoder(self) -> Callable:
+        encoding = self.encoding
+        if encoding == decode_zigzag:
+            return lambda reader: decode_zigzag(decode_varint(reader))
+        if encoding == decode_varint:
+            if self.scale == 0:
+                return decode_varint
+            pow10 = 10 ** self.scale
+            return lambda reader: decode_varint(reader) * pow10
+        if encoding is None:
+            return self.type
+        return lambda reader: int.from_bytes(encoding(reader), byteorder="big")
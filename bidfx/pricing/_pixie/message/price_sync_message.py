@@ -1,6 +1,13 @@
 import logging
 
-from bidfx.pricing.events import SubscriptionEvent, PriceEvent, SubscriptionStatus
+from bidfx.exceptions import PricingError
+from bidfx.pricing.events import (
+    SubscriptionEvent,
+    PriceEvent,
+    PriceBatchEvent,
+    SubscriptionStatus,
+)
+from ..util.buffer_reader import BufferReader
 from ..util.buffer_reads import read_byte
 from ..util.varint import decode_varint, decode_string
 
@@ -37,54 +44,90 @@ class PriceSyncMessage:
         self.edition = decode_varint(input_stream)
         self.size = decode_varint(input_stream)
         self._buffer = (
-            decompressor.decompress(input_stream)
+            BufferReader(decompressor.decompress(input_stream.read_remaining()))
             if self.is_compressed
             else input_stream
         )
         log.debug(f"Price Sync edition:{self.edition} revision:{self.revision}")
 
-    def visit_updates(self, subjects, data_dictionary, callbacks):
+    def visit_updates(
+        self,
+        subjects,
+        data_dictionary,
+        callbacks,
+        field_selection=None,
+        subject_count=None,
+    ):
+        # Only the first subject_count subjects belong to the edition,
+        # as the list of subjects may be shared with later editions.
+        self._subject_count = len(subjects) if subject_count is None else subject_count
+        if field_selection is None or field_selection.is_empty():
+            field_decoders = data_dictionary.field_decoders
+            decoders_for = lambda subject: field_decoders
+        else:
+            decoders_for = lambda subject: data_dictionary.projected_decoders(
+                field_selection.fields_for(subject)
+            )
+        batch = [] if callbacks.price_batch_fn else None
+        publish = callbacks.price_event_fn if batch is None else batch.append
         for i in range(self.size):
-            self._visit_next_update(subjects, data_dictionary, callbacks)
+            self._visit_next_update(subjects, decoders_for, callbacks, publish)
+        if batch:
+            callbacks.price_batch_fn(
+                PriceBatchEvent(
+                    batch,
+                    self.edition,
+                    self.revision,
+                    self.revision_time,
+                    self.conflation_latency,
+                )
+            )
 
-    def _visit_next_update(self, subjects, data_dictionary, callbacks):
+    def _visit_next_update(self, subjects, decoders_for, callbacks, publish):
         type_of_update = read_byte(self._buffer)
         if type_of_update == PARTIAL_MAP:
-            self._price_update(subjects, data_dictionary, callbacks, full=False)
+            self._price_update(subjects, decoders_for, publish, full=False)
         if type_of_update == FULL_MAP:
-            self._price_update(subjects, data_dictionary, callbacks, full=True)
+            self._price_update(subjects, decoders_for, publish, full=True)
         elif type_of_update == STATUS:
             self._status_update(subjects, callbacks)
 
-    def _price_update(self, subjects, data_dictionary, callbacks, full):
-        sid = decode_varint(self._buffer)
-        subject = subjects[sid]
+    def _price_update(self, subjects, decoders_for, publish, full):
+        subject = self._subject(subjects, decode_varint(self._buffer))
         field_count = decode_varint(self._buffer)
-        price = self._extract_price(data_dictionary, field_count)
-        event = PriceEvent(subject, price, full)
-        callbacks.price_event_fn(event)
+        price = self._extract_price(decoders_for(subject), field_count)
+        publish(PriceEvent(subject, price, full))
 
-    def _extract_price(self, data_dictionary, field_count):
+    def _subject(self, subjects, sid):
+        if sid >= self._subject_count:
+            raise PricingError(
+                f"price update for subject id {sid} is not in edition {self.edition}"
+            )
+        return subjects[sid]
+
+    def _extract_price(self, field_decoders, field_count):
         price = {}
         for _ in range(field_count):
-            self._visit_field(data_dictionary, price)
+            self._visit_field(field_decoders, price)
         return price
 
     def _status_update(self, subjects, callbacks):
-        sid = decode_varint(self._buffer)
-        subject = subjects[sid]
+        subject = self._subject(subjects, decode_varint(self._buffer))
         status = STATUSES[read_byte(self._buffer)]
         explanation = decode_string(self._buffer)
         event = SubscriptionEvent(subject, status, explanation)
         callbacks.subscription_event_fn(event)
 
-    def _visit_field(self, data_dictionary, price):
+    def _visit_field(self, field_decoders, price):
         fid = decode_varint(self._buffer)
         if fid != ERROR_FID:
-            definition = data_dictionary[fid]
-            value = definition.parse_value(self._buffer)
-            if definition.enabled:
-                price[definition.name] = value
+            try:
+                name, decode = field_decoders[fid]
+            except IndexError:
+                raise PricingError(f"price field {fid} is not in the data dictionary")
+            value = decode(self._buffer)
+            if name:
+                price[name] = value
 
     def __str__(self):
         return (
@@ -3,6 +3,10 @@ from ..util.compression import Compressor
 from ..util.varint import encode_varint, encode_strings_list
 
 
+def encode_subject(subject):
+    return encode_strings_list(subject.flatten())
+
+
 class SubscriptionSyncMessage:
     msg_type = PixieMessageType.SubscriptionSyncMessage
 
@@ -14,8 +18,11 @@ class SubscriptionSyncMessage:
         is_controls=False,
         is_unchanged=False,
         sids=None,
+        compressor=None,
+        subject_encoder=encode_subject,
     ):
-        self.compressor = Compressor()
+        self.compressor = compressor or Compressor()
+        self.subject_encoder = subject_encoder
         self.is_compressed = is_compressed
         self.is_controls = is_controls
         self.is_unchanged = is_unchanged
@@ -41,15 +48,12 @@ class SubscriptionSyncMessage:
         subject_sync_message += encode_varint(self.option)
         subject_sync_message += encode_varint(self.edition)
 
+        subject_sync_message += encode_varint(self.size)
         if self.subjects:
-            subject_sync_message += encode_varint(self.size)
-            for subject in self.subjects:
-                encoded_subject = encode_strings_list(subject.flatten())
-                if self.is_compressed:
-                    encoded_subject = self.compressor.compress(encoded_subject)
-                subject_sync_message += encoded_subject
-        else:
-            subject_sync_message += encode_varint(self.size)
+            encoded_subjects = b"".join(map(self.subject_encoder, self.subjects))
+            if self.is_compressed:
+                encoded_subjects = self.compressor.compress(encoded_subjects)
+            subject_sync_message += encoded_subjects
 
         if self.is_controls:
             control_part = b""
@@ -1,6 +1,7 @@
 __all__ = ["PixieProvider"]
 
 import logging
+import socket
 import threading
 import time
 import getpass
@@ -9,6 +10,7 @@ from datetime import datetime
 from bidfx._bidfx_api import BIDFX_API_INFO
 from bidfx.exceptions import PricingError, IncompatibleVersionError
 from bidfx.pricing.callbacks import Callbacks
+from .data_dictionary import DataDictionary
 from .message.ack_message import AckMessage
 from .message.data_dictionary_message import DataDictionaryMessage
 from .message.grant_message import GrantMessage
@@ -19,9 +21,14 @@ from .message.price_sync_message import PriceSyncMessage
 from .message.subscription_sync_message import SubscriptionSyncMessage
 from .message.welcome_message import WelcomeMessage
 from .subscription_register import SubscriptionRegister
-from .util.compression import Decompressor
-from .util.varint import decode_varint_from_socket, read_bytes
+from .util.compression import Compressor, Decompressor, DEFAULT_COMPRESSION_LEVEL
+from .util.frame_reader import FrameReader
+from .._field_selection import FieldSelection
+from .._message_writer import MessageWriter
+from .._price_values import price_values_from_config
+from .._reactor import shared_reactor
 from .._service_connector import ServiceConnector
+from .._timer_wheel import shared_timer_wheel
 from ..events import (
     ProviderEvent,
     ProviderStatus,
@@ -34,12 +41,14 @@ from ..subject import Subject
 log = logging.getLogger("bidfx.pricing.pixie")
 
 CURRENT_PROTOCOL_VERSION = 4
+TIMER_INTERVAL = 0.1
+SILENT_HEARTBEATS = 1.5
 
 
 class PixieProvider(PriceProvider):
     _instance = 0
 
-    def __init__(self, config_section, callbacks: Callbacks):
+    def __init__(self, config_section, callbacks: Callbacks, field_selection=None):
         PixieProvider._instance += 1
         self._provider_name = f"Pixie-{PixieProvider._instance}"
         self._host = config_section["host"]
@@ -55,12 +64,27 @@ class PixieProvider(PriceProvider):
         self._heartbeat_interval = config_section.getint("heartbeat_interval", 10)
         self._reconnect_interval = config_section.getint("reconnect_interval", 10)
         self._tunnel = config_section.getboolean("tunnel", True)
+        self._reactor = (
+            shared_reactor() if config_section.getboolean("reactor", False) else None
+        )
+        self._price_values = price_values_from_config(config_section)
+        self._compression_level = config_section.getint(
+            "compression_level", DEFAULT_COMPRESSION_LEVEL
+        )
         self._callbacks = callbacks
+        self._field_selection = field_selection or FieldSelection()
         self._subscription_register = SubscriptionRegister()
         self._data_dictionary = None
+        self._compressor = None
         self._decompressor = None
         self._opened_socket = None
+        self._frame_reader = None
+        self._writer = None
+        self._channel = None
+        self._timer = None
+        self._sync_lock = threading.Lock()
         self._last_time_write = 0
+        self._last_time_read = 0
         self._running = False
 
     def start(self):
@@ -70,52 +94,145 @@ class PixieProvider(PriceProvider):
             log.info(f"starting {self._provider_name} provider")
             self._publish_provider_status(ProviderStatus.DOWN, "starting up")
             self._running = True
-            threading.Thread(
-                target=self._init_connection,
-                name=self._provider_name + "-read",
-                daemon=True,
-            ).start()
+            self._start_connection_thread(self._init_connection)
+
+    def _start_connection_thread(self, target):
+        # With a reactor the thread only connects, and ends once the connection is handed over.
+        suffix = "-connect" if self._reactor else "-read"
+        threading.Thread(
+            target=target, name=self._provider_name + suffix, daemon=True
+        ).start()
 
     def subscribe(self, subject):
         log.info(f"subscribe to: {subject}")
+        self._check_level(subject)
+        self._subscription_register.subscribe(subject)
+
+    def unsubscribe(self, subject):
+        log.info(f"unsubscribe from: {subject}")
+        self._subscription_register.unsubscribe(subject)
+
+    def subscribe_many(self, subjects):
+        subjects = list(subjects)
+        log.info(f"subscribe to {len(subjects)} subjects")
+        for subject in subjects:
+            self._check_level(subject)
+        self._subscription_register.subscribe_many(subjects)
+
+    def unsubscribe_many(self, subjects):
+        subjects = list(subjects)
+        log.info(f"unsubscribe from {len(subjects)} subjects")
+        self._subscription_register.unsubscribe_many(subjects)
+
+    @staticmethod
+    def _check_level(subject):
         level = subject[Subject.LEVEL]
-        if level == "1":
-            self._subscription_register.subscribe(subject)
-        else:
+        if level != "1":
             raise PricingError(
                 f"the Pixie protocol does not yet support level={level} subscriptions"
             )
 
-    def unsubscribe(self, subject):
-        log.info(f"unsubscribe from: {subject}")
-        self._subscription_register.unsubscribe(subject)
+    def refresh(self, subject):
+        log.info(f"refresh: {subject}")
+        self._subscription_register.refresh(subject)
+
+    def toggle(self, subject):
+        log.info(f"toggle: {subject}")
+        self._subscription_register.toggle(subject)
 
     def stop(self):
         log.info(f"stopping {self._provider_name} provider")
         self._running = False
-        if self._opened_socket:
+        # The shared timer wheel's thread ends once the timers of all providers are cancelled.
+        self._stop_timer()
+        channel = self._channel
+        if channel:
+            channel.close()
+        elif self._opened_socket:
             self._opened_socket.close()
 
     def _init_connection(self):
-        self._session_connection_attempt()
-        while self._running:
+        handed_over = self._session_connection_attempt()
+        while self._running and not handed_over:
             time.sleep(self._reconnect_interval)
-            self._session_connection_attempt()
+            handed_over = self._session_connection_attempt()
+
+    def _reconnect(self):
+        time.sleep(self._reconnect_interval)
+        if self._running:
+            self._init_connection()
 
     def _session_connection_attempt(self):
+        # Returns True if the connection was handed over to the reactor, which then reads it.
         try:
             self._opened_socket = self._open_connection()
+            self._frame_reader = FrameReader(self._opened_socket)
             self._send_protocol_signature()
             self._login_into_server()
             self._prepare_new_session()
             self._publish_provider_status(ProviderStatus.READY)
+            if self._channel:
+                return True
             self._price_server_read_loop()
         except Exception as e:
             log.warning(f"connection attempt failed due to: {e}")
+            channel = self._channel
+            if channel:
+                # Closing the channel ends the session and reconnects.
+                channel.close(e)
+                return True
+            if self._reactor and self._opened_socket:
+                # The socket was never handed over, so the connection is retried.
+                self._opened_socket.close()
+        self._stop_timer()
+        self._stop_writer()
+        return False
 
     def _prepare_new_session(self):
+        self._compressor = Compressor(self._compression_level)
         self._decompressor = Decompressor()
+        if self._reactor:
+            self._channel = self._reactor.register(
+                self._provider_name,
+                self._opened_socket,
+                self._read_available_messages,
+                self._on_channel_closed,
+            )
+        else:
+            self._writer = MessageWriter(
+                self._provider_name,
+                self._write_messages,
+                self._on_write_error,
+                kind_of=self._replaceable_kind,
+            )
+            self._writer.start()
         self._send_message(SubscriptionSyncMessage(1, []))
+        self._last_time_read = time.time()
+        self._timer = shared_timer_wheel().schedule(
+            TIMER_INTERVAL, self._on_timer, interval=TIMER_INTERVAL
+        )
+
+    def _stop_timer(self):
+        timer = self._timer
+        if timer:
+            self._timer = None
+            timer.cancel()
+
+    def _on_channel_closed(self, error):
+        channel = self._channel
+        self._channel = None
+        self._stop_timer()
+        log.info(str(channel))
+        self._on_connection_lost(error)
+        if self._running:
+            self._start_connection_thread(self._reconnect)
+
+    def _stop_writer(self):
+        writer = self._writer
+        if writer:
+            self._writer = None
+            writer.stop()
+            log.info(str(writer))
 
     def _open_connection(self):
         read_timeout = self._heartbeat_interval * 2
@@ -143,15 +260,26 @@ class PixieProvider(PriceProvider):
         try:
             while self._running:
                 msg_type, buffer = self._read_message_bytes()
+                self._last_time_read = time.time()
                 self._handle_received_message(msg_type, buffer)
                 del buffer
         except Exception as e:
-            self._publish_provider_status(
-                ProviderStatus.DOWN, f"connection error due to: {e}"
-            )
-            self._notify_all_subjects_as_stale(
-                f"price provider {self._provider_name} is down"
-            )
+            self._on_connection_lost(e)
+
+    def _read_available_messages(self):
+        # Called by the reactor thread when the socket is readable.
+        for msg_type, buffer in self._frame_reader.read_available_frames():
+            self._last_time_read = time.time()
+            self._handle_received_message(msg_type, buffer)
+            del buffer
+
+    def _on_connection_lost(self, error):
+        self._publish_provider_status(
+            ProviderStatus.DOWN, f"connection error due to: {error}"
+        )
+        self._notify_all_subjects_as_stale(
+            f"price provider {self._provider_name} is down"
+        )
 
     def _handle_received_message(self, msg_type, buffer):
         if msg_type == PixieMessageType.PriceSyncMessage:
@@ -172,21 +300,59 @@ class PixieProvider(PriceProvider):
             log.debug("receive heartbeat")
 
     def _on_price_sync(self, price_sync):
-        subjects = self._subscription_register.subjects_for_edition(price_sync.edition)
-        price_sync.visit_updates(subjects, self._data_dictionary, self._callbacks)
+        subjects, size = self._subscription_register.subjects_for_edition(
+            price_sync.edition
+        )
+        price_sync.visit_updates(
+            subjects,
+            self._data_dictionary,
+            self._callbacks,
+            self._field_selection,
+            subject_count=size,
+        )
 
     def _after_price_sync(self, edition):
         self._subscription_register.purge_editions_before(edition)
-        subscription_sync = self._subscription_register.subscription_sync()
-        if subscription_sync:
-            self._send_message(subscription_sync)
-        else:
+        if not self._send_subscription_sync():
+            self._check_heartbeats()
+
+    def _on_timer(self):
+        # Runs on the shared timer thread so that subscription changes, heartbeats and a silent
+        # server are all dealt with on time, even when no prices are arriving.
+        silence = time.time() - self._last_time_read
+        if silence > self._heartbeat_interval * SILENT_HEARTBEATS:
+            log.warning(
+                f"{self._provider_name} received nothing for {silence:.1f}s, disconnecting"
+            )
+            self._stop_timer()
+            self._abort_connection(f"nothing received for {silence:.1f}s")
+        elif not self._send_subscription_sync():
             self._check_heartbeats()
 
+    def _send_subscription_sync(self):
+        # Subscription syncs share one compression stream, so they must be queued in the order built.
+        with self._sync_lock:
+            subscription_sync = self._subscription_register.subscription_sync(
+                self._compressor
+            )
+            if subscription_sync:
+                self._send_message(subscription_sync)
+                return True
+            return False
+
+    def _abort_connection(self, reason):
+        channel = self._channel
+        if channel:
+            channel.close(ConnectionAbortedError(reason))
+            return
+        # Shutting down the socket wakes the read thread, which then reconnects.
+        try:
+            self._opened_socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
     def _read_message_bytes(self):
-        length = decode_varint_from_socket(self._opened_socket)
-        message_type = read_bytes(self._opened_socket, 1)
-        return message_type, bytearray(read_bytes(self._opened_socket, length - 1))
+        return self._frame_reader.read_frame()
 
     def _read_welcome_message(self):
         msg_type, buffer = self._read_message_bytes()
@@ -219,7 +385,7 @@ class PixieProvider(PriceProvider):
             BIDFX_API_INFO.version,
             self._product_serial,
         )
-        self._send_message(login_message)
+        self._write_messages([login_message])
 
     def _read_grant_message(self):
         msg_type, buffer = self._read_message_bytes()
@@ -246,16 +412,41 @@ class PixieProvider(PriceProvider):
         data_dict_msg = DataDictionaryMessage(buff, self._decompressor)
         log.debug(f"received message: {data_dict_msg}")
         if data_dict_msg.is_updated:
-            self._data_dictionary.update(data_dict_msg.get_data_dict())
+            self._data_dictionary.update(data_dict_msg.definitions)
         else:
-            self._data_dictionary = data_dict_msg.get_data_dict()
+            self._data_dictionary = DataDictionary(
+                data_dict_msg.definitions, self._price_values
+            )
         log.debug("data dict instance: " + str(self._data_dictionary))
 
     def _send_message(self, message):
         log.debug("sending: " + str(message))
-        self._opened_socket.sendall(message.to_bytes())
+        channel = self._channel
+        if channel:
+            channel.write(message.to_bytes())
+        else:
+            writer = self._writer
+            if not writer:
+                return
+            writer.send(message)
+        # Heartbeats are due once nothing has been queued for an interval, as a stalled write
+        # would otherwise have another heartbeat queued on every timer tick.
         self._last_time_write = time.time()
 
+    def _write_messages(self, messages):
+        self._opened_socket.sendall(b"".join(m.to_bytes() for m in messages))
+
+    def _on_write_error(self, error):
+        self._opened_socket.close()
+
+    @staticmethod
+    def _replaceable_kind(message):
+        # Acks are cumulative, so a queued ack is superseded by the ack of a later revision,
+        # and a queued heartbeat needs no other.
+        if isinstance(message, (AckMessage, HeartbeatMessage)):
+            return type(message)
+        return None
+
     def _check_heartbeats(self):
         if time.time() - self._last_time_write > self._heartbeat_interval:
             self._send_message(HeartbeatMessage())
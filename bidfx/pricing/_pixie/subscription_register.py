@@ -1,20 +1,14 @@
 import threading
 
 from bidfx.exceptions import PricingError
+from bidfx.pricing._pixie.control_operations import ControlOperations
 from bidfx.pricing._pixie.message.subscription_sync_message import (
     SubscriptionSyncMessage,
+    encode_subject,
 )
 from bidfx.pricing.subject import Subject
 
 
-def _subscribe_op(subscription_set: set, subject: Subject):
-    subscription_set.add(subject)
-
-
-def _unsubscribe_op(subscription_set: set, subject: Subject):
-    subscription_set.discard(subject)
-
-
 def _subject_order():
     return (
         lambda subject: subject.get(Subject.CURRENCY_PAIR, "")
@@ -23,41 +17,174 @@ def _subject_order():
     )
 
 
+class SubjectIndex:
+    """
+    An index of subjects that iterates them in subject order. Each subject's order key is computed once
+    and cached, so adding or removing a subject costs O(1), and the keys are only sorted when the index
+    is iterated, which happens when the subscriptions are reset.
+    """
+
+    def __init__(self):
+        self._order = _subject_order()
+        self._order_keys = {}
+        self._subjects_by_key = {}
+
+    def order_key(self, subject):
+        key = self._order_keys.get(subject)
+        if key is None:
+            key = self._order_keys[subject] = self._order(subject)
+        return key
+
+    def sorted(self, subjects):
+        return sorted(subjects, key=self.order_key)
+
+    def add(self, subject):
+        self._subjects_by_key.setdefault(self.order_key(subject), subject)
+
+    def discard(self, subject):
+        key = self._order_keys.pop(subject, None)
+        if key is not None:
+            self._subjects_by_key.pop(key, None)
+
+    def clear(self):
+        self._order_keys.clear()
+        self._subjects_by_key.clear()
+
+    def __contains__(self, subject):
+        key = self._order_keys.get(subject)
+        return key is not None and key in self._subjects_by_key
+
+    def __len__(self):
+        return len(self._subjects_by_key)
+
+    def __iter__(self):
+        subjects_by_key = self._subjects_by_key
+        return (subjects_by_key[key] for key in sorted(subjects_by_key))
+
+
 class SubscriptionRegister:
     def __init__(self):
         self._lock = threading.Lock()
+        self._index = SubjectIndex()
+        self._pending_ops = {}
+        self._pending_controls = {}
+        self._encoded_subjects = {}
+        self._reset_editions()
+
+    def _reset_editions(self):
+        # Each edition is held as a pair of a subject list and the edition size. Editions that
+        # only add subjects share the list of the edition before them, which holds their prefix.
         self._edition = 1
-        self._subject_editions = {self._edition: []}
-        self._pending_ops = []
+        self._subjects = []
+        self._sids = {}
+        self._subject_editions = {self._edition: (self._subjects, 0)}
+        self._index.clear()
 
     def subscribe(self, subject: Subject):
         with self._lock:
-            self._pending_ops.append((_subscribe_op, subject))
+            self._pending_ops[subject] = True
 
     def unsubscribe(self, subject: Subject):
         with self._lock:
-            self._pending_ops.append((_unsubscribe_op, subject))
+            self._pending_ops[subject] = False
+
+    def subscribe_many(self, subjects):
+        with self._lock:
+            self._pending_ops.update(dict.fromkeys(subjects, True))
+
+    def unsubscribe_many(self, subjects):
+        with self._lock:
+            self._pending_ops.update(dict.fromkeys(subjects, False))
 
-    def subscription_sync(self):
+    def refresh(self, subject: Subject):
         with self._lock:
-            if len(self._pending_ops) == 0:
+            self._pending_controls[subject] = ControlOperations.REFRESH
+
+    def toggle(self, subject: Subject):
+        with self._lock:
+            self._pending_controls[subject] = ControlOperations.TOGGLE
+
+    def subscription_sync(self, compressor=None):
+        with self._lock:
+            if not self._pending_ops and not self._pending_controls:
                 return None
-            subject_set, is_unchanged = self._active_subject_set()
-            if is_unchanged:
+            if self._apply_pending_ops():
+                controls = self._take_controls()
+                return SubscriptionSyncMessage(
+                    self._edition,
+                    list(self._subjects),
+                    is_compressed=True,
+                    is_controls=bool(controls),
+                    sids=controls,
+                    compressor=compressor,
+                    subject_encoder=self._encoded_subject,
+                )
+            controls = self._take_controls()
+            if not controls:
                 return None
-            subjects = sorted(subject_set, key=_subject_order())
-            self._edition += 1
-            self._subject_editions[self._edition] = subjects
-            return SubscriptionSyncMessage(self._edition, subjects, is_compressed=True)
-
-    def _active_subject_set(self):
-        previous_subject_set = set(self._subject_editions[self._edition])
-        subject_set = previous_subject_set.copy()
-        for operation_fn, subject in self._pending_ops:
-            operation_fn(subject_set, subject)
+            return SubscriptionSyncMessage(
+                self._edition,
+                [],
+                is_compressed=True,
+                is_controls=True,
+                is_unchanged=True,
+                sids=controls,
+                compressor=compressor,
+            )
+
+    def _apply_pending_ops(self):
+        # Subjects are removed in place and added at the end, so the SIDs of the remaining subjects
+        # are preserved and an edition that only adds subjects is an append to the previous one.
+        index = self._index
+        added = []
+        removed = set()
+        for subject, subscribed in self._pending_ops.items():
+            if subscribed:
+                if subject not in index:
+                    added.append(subject)
+            elif subject in index:
+                removed.add(subject)
         self._pending_ops.clear()
-        is_unchanged = subject_set == previous_subject_set
-        return subject_set, is_unchanged
+        if not added and not removed:
+            return False
+        added = index.sorted(added)
+        if removed:
+            self._remove_subjects(removed)
+        for subject in added:
+            index.add(subject)
+            self._sids[subject] = len(self._subjects)
+            self._subjects.append(subject)
+        self._edition += 1
+        self._subject_editions[self._edition] = (self._subjects, len(self._subjects))
+        return True
+
+    def _remove_subjects(self, removed):
+        # Only the SIDs of the subjects after the first one removed need to change.
+        sids = self._sids
+        first = min(sids.pop(subject) for subject in removed)
+        for subject in removed:
+            self._index.discard(subject)
+            self._encoded_subjects.pop(subject, None)
+        subjects = self._subjects
+        tail = [s for s in subjects[first:] if s not in removed]
+        for sid, subject in enumerate(tail, first):
+            sids[subject] = sid
+        self._subjects = subjects[:first] + tail
+
+    def _encoded_subject(self, subject):
+        encoded = self._encoded_subjects.get(subject)
+        if encoded is None:
+            encoded = self._encoded_subjects[subject] = bytes(encode_subject(subject))
+        return encoded
+
+    def _take_controls(self):
+        controls = {}
+        for subject, operation in self._pending_controls.items():
+            sid = self._sids.get(subject)
+            if sid is not None:
+                controls[sid] = operation
+        self._pending_controls.clear()
+        return controls
 
     def purge_editions_before(self, edition):
         with self._lock:
@@ -68,17 +195,28 @@ class SubscriptionRegister:
 
     def subjects_for_edition(self, edition):
         with self._lock:
-            subjects = self._subject_editions.get(edition)
-            if subjects is None:
+            subject_edition = self._subject_editions.get(edition)
+            if subject_edition is None:
                 raise PricingError(f"no subject set registered for edition {edition}")
-            return subjects
+            # The list may be shared with later editions, which only append to it,
+            # so only its first size subjects belong to this edition.
+            return subject_edition
 
     def reset_and_get_subjects(self):
         with self._lock:
-            subject_set, _ = self._active_subject_set()
-            subjects = sorted(subject_set, key=_subject_order())
-            for subject in subjects:
-                self._pending_ops.append((_subscribe_op, subject))
-            self._edition = 1
-            self._subject_editions = {self._edition: []}
+            index = self._index
+            for subject, subscribed in self._pending_ops.items():
+                if subscribed:
+                    index.add(subject)
+                else:
+                    index.discard(subject)
+            subjects = list(index)
+            self._reset_editions()
+            self._pending_ops = dict.fromkeys(subjects, True)
+            self._pending_controls.clear()
+            self._encoded_subjects = {
+                s: self._encoded_subjects[s]
+                for s in subjects
+                if s in self._encoded_subjects
+            }
             return subjects
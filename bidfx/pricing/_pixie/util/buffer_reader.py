@@ -0,0 +1,23 @@
+class BufferReader:
+    """
+    A read cursor over an immutable view of a received Pixie message.
+    Reads advance the cursor position rather than shifting the underlying bytes,
+    so decoding a message is linear in its size.
+    """
+
+    __slots__ = ("buffer", "position")
+
+    def __init__(self, data, position=0):
+        self.buffer = memoryview(data)
+        self.position = position
+
+    def remaining(self) -> int:
+        return len(self.buffer) - self.position
+
+    def read_remaining(self) -> memoryview:
+        view = self.buffer[self.position :]
+        self.position = len(self.buffer)
+        return view
+
+    def __str__(self):
+        return f"BufferReader position:{self.position} remaining:{self.remaining()}"
@@ -1,56 +1,96 @@
 import struct
 
+from .buffer_reader import BufferReader
 from ..util.varint import decode_varint
 
+_SINGLE_BYTES = [bytes((b,)) for b in range(256)]
+_DOUBLE = struct.Struct(">d")
+_UNSIGNED_LONG = struct.Struct(">Q")
+_UNSIGNED_INT = struct.Struct(">I")
 
-def read_byte(buffer):
-    return buffer.pop(0).to_bytes(1, byteorder="big")
 
+def read_byte(reader: BufferReader) -> bytes:
+    b = reader.buffer[reader.position]
+    reader.position += 1
+    return _SINGLE_BYTES[b]
 
-def read_double_fixed8(buffer):
-    return struct.unpack(">d", read_fixed8(buffer))[0]
 
+def read_double_fixed8(reader: BufferReader) -> float:
+    return _unpack(reader, _DOUBLE)
 
-def read_long_fixed8(buffer):
-    return int.from_bytes(read_fixed8(buffer), "big")
 
+def read_long_fixed8(reader: BufferReader) -> int:
+    return _unpack(reader, _UNSIGNED_LONG)
 
-def read_int_fixed4(buffer):
-    return int.from_bytes(read_fixed4(buffer), "big")
 
+def read_int_fixed4(reader: BufferReader) -> int:
+    return _unpack(reader, _UNSIGNED_INT)
 
-def read_fixed1(buffer):
-    return _read_bytes(buffer, 1)
 
+def read_fixed1(reader: BufferReader) -> memoryview:
+    return _read_bytes(reader, 1)
 
-def read_fixed2(buffer):
-    return _read_bytes(buffer, 2)
 
+def read_fixed2(reader: BufferReader) -> memoryview:
+    return _read_bytes(reader, 2)
 
-def read_fixed3(buffer):
-    return _read_bytes(buffer, 3)
 
+def read_fixed3(reader: BufferReader) -> memoryview:
+    return _read_bytes(reader, 3)
 
-def read_fixed4(buffer):
-    return _read_bytes(buffer, 4)
 
+def read_fixed4(reader: BufferReader) -> memoryview:
+    return _read_bytes(reader, 4)
 
-def read_fixed8(buffer):
-    return _read_bytes(buffer, 8)
 
+def read_fixed8(reader: BufferReader) -> memoryview:
+    return _read_bytes(reader, 8)
 
-def read_fixed16(buffer):
-    return _read_bytes(buffer, 16)
 
+def read_fixed16(reader: BufferReader) -> memoryview:
+    return _read_bytes(reader, 16)
 
-def read_byte_array(buffer):
-    return _read_bytes(buffer, decode_varint(buffer))
 
+def read_byte_array(reader: BufferReader) -> memoryview:
+    return _read_bytes(reader, decode_varint(reader))
 
-def _read_bytes(buffer, length):
-    bytes_ = buffer[:length]
-    del buffer[:length]
-    return bytes_
+
+def skip_varint(reader: BufferReader):
+    buffer = reader.buffer
+    position = reader.position
+    while buffer[position] & 0x80:
+        position += 1
+    reader.position = position + 1
+
+
+def skip_byte_array(reader: BufferReader):
+    length = decode_varint(reader)
+    reader.position += length
+
+
+def skip_string(reader: BufferReader):
+    length = decode_varint(reader)
+    if length:
+        reader.position += length - 1
+
+
+def fixed_skipper(length):
+    def skip(reader: BufferReader):
+        reader.position += length
+
+    return skip
+
+
+def _read_bytes(reader, length):
+    start = reader.position
+    reader.position = start + length
+    return reader.buffer[start : reader.position]
+
+
+def _unpack(reader, fixed_struct):
+    value = fixed_struct.unpack_from(reader.buffer, reader.position)[0]
+    reader.position += fixed_struct.size
+    return value
 
 
 def scale_to_double(value, scale):
@@ -1,9 +1,12 @@
 import zlib
 
 
+DEFAULT_COMPRESSION_LEVEL = 6
+
+
 class Compressor:
-    def __init__(self):
-        self._zip = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+    def __init__(self, level=DEFAULT_COMPRESSION_LEVEL):
+        self._zip = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
 
     def compress(self, input_bytes):
         buf = self._zip.compress(input_bytes) + self._zip.flush(zlib.Z_SYNC_FLUSH)
@@ -15,5 +18,4 @@ class Decompressor:
         self._unzip = zlib.decompressobj(-zlib.MAX_WBITS)
 
     def decompress(self, input_bytes):
-        buf = self._unzip.decompress(input_bytes) + self._unzip.flush()
-        return bytearray(buf)
+        return self._unzip.decompress(input_bytes) + self._unzip.flush()
@@ -0,0 +1,101 @@
+import socket
+import ssl
+
+from .buffer_reader import BufferReader
+
+_SINGLE_BYTES = [bytes((b,)) for b in range(256)]
+
+
+class FrameReader:
+    """
+    Reads length-prefixed Pixie message frames from a socket.
+    Socket data is received with `recv_into` a reusable buffer that grows to fit the largest frame,
+    and every complete frame already received is returned without further socket reads.
+    A returned frame is a view into the buffer, so it is only valid until the next frame is read.
+    """
+
+    def __init__(self, opened_socket, buffer_size=65536):
+        self._opened_socket = opened_socket
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+        self._required = 0
+
+    def read_frame(self):
+        """
+        Reads the next message frame.
+
+        :return: A pair of the one byte message type and a `BufferReader` over the message body.
+        """
+        while True:
+            frame = self._next_buffered_frame()
+            if frame:
+                return frame
+            self._receive()
+
+    def read_available_frames(self):
+        """
+        Reads the message frames that are available without blocking, from a non-blocking socket.
+        Each frame must be handled before the next is read.
+
+        :return: A generator of the pairs returned by `read_frame`.
+        """
+        while True:
+            frame = self._next_buffered_frame()
+            if frame:
+                yield frame
+            else:
+                try:
+                    self._receive()
+                except (BlockingIOError, ssl.SSLWantReadError):
+                    return
+
+    def _next_buffered_frame(self):
+        buffer = self._buffer
+        position = self._start
+        end = self._end
+        length = 0
+        for offset in range(0, 64, 7):
+            if position == end:
+                self._required = position - self._start + 1
+                return None
+            b = buffer[position]
+            position += 1
+            length |= (b & 0x7F) << offset
+            if b < 128:
+                break
+        frame_end = position + length
+        if frame_end > end:
+            self._required = frame_end - self._start
+            return None
+        self._start = frame_end
+        return (
+            _SINGLE_BYTES[buffer[position]],
+            BufferReader(self._view[position + 1 : frame_end]),
+        )
+
+    def _receive(self):
+        self._compact()
+        if self._required > len(self._buffer):
+            self._grow(self._required)
+        received = self._opened_socket.recv_into(self._view[self._end :])
+        if received == 0:
+            raise socket.error("end of socket stream")
+        self._end += received
+
+    def _compact(self):
+        if self._start:
+            size = self._end - self._start
+            self._buffer[:size] = self._buffer[self._start : self._end]
+            self._start = 0
+            self._end = size
+
+    def _grow(self, required):
+        capacity = len(self._buffer)
+        while capacity < required:
+            capacity *= 2
+        buffer = bytearray(capacity)
+        buffer[: self._end] = self._view[: self._end]
+        self._buffer = buffer
+        self._view = memoryview(buffer)
@@ -1,5 +1,7 @@
 import socket
 
+from .buffer_reader import BufferReader
+
 
 def encode_varint(n: int) -> bytearray:
     buffer = bytearray()
@@ -14,13 +16,17 @@ def encode_varint(n: int) -> bytearray:
     return buffer
 
 
-def decode_varint(buffer: bytearray) -> int:
+def decode_varint(reader: BufferReader) -> int:
+    buffer = reader.buffer
+    position = reader.position
     result = 0
     for offset in range(0, 64, 7):
-        b = _read_bytes(buffer, 1)[0]
+        b = buffer[position]
+        position += 1
         result |= (b & 0x7F) << offset
         if b < 128:
             break
+    reader.position = position
     return result
 
 
@@ -37,25 +43,20 @@ def encode_string(s: str) -> bytearray:
     return buffer
 
 
-def decode_string(buffer: bytearray) -> str:
-    length = decode_varint(buffer)
+def decode_string(reader: BufferReader) -> str:
+    length = decode_varint(reader)
     s = None
     if length:
         length -= 1
         if length:
-            utf = _read_bytes(buffer, length)
-            s = utf.decode("utf-8")
+            start = reader.position
+            reader.position = start + length
+            s = str(reader.buffer[start : reader.position], "utf-8")
         else:
             s = ""
     return s
 
 
-def _read_bytes(buffer, length):
-    data = buffer[:length]
-    del buffer[:length]
-    return data
-
-
 def encode_strings_list(string_list: list) -> bytearray:
     buffer = bytearray()
     buffer += encode_varint(len(string_list))
@@ -64,12 +65,12 @@ def encode_strings_list(string_list: list) -> bytearray:
     return buffer
 
 
-def decode_strings_list(list_bytes) -> list:
-    length = decode_varint(list_bytes)
+def decode_strings_list(reader: BufferReader) -> list:
+    length = decode_varint(reader)
     string_list = []
     if length:
         for _ in range(length):
-            ss = decode_string(list_bytes)
+            ss = decode_string(reader)
             string_list.append(ss)
         return string_list
     else:
@@ -0,0 +1,43 @@
+from .scaled_value import ScaledValue
+from ..exceptions import PricingError
+
+STRING_VALUES = "string"
+"""Price values are published as strings. This is the default."""
+
+NUMERIC_VALUES = "numeric"
+"""Price values are published as int or float."""
+
+SCALED_VALUES = "scaled"
+"""Decimal price values are published as a `ScaledValue`, integers as int."""
+
+PRICE_VALUES = (STRING_VALUES, NUMERIC_VALUES, SCALED_VALUES)
+
+
+def price_values_from_config(config_section):
+    price_values = config_section.get("price_values", STRING_VALUES).lower()
+    if price_values not in PRICE_VALUES:
+        raise PricingError(
+            f"unsupported price_values setting '{price_values}', expected one of {PRICE_VALUES}"
+        )
+    return price_values
+
+
+def number_from_text(text):
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def scaled_from_text(text):
+    whole, point, fraction = text.partition(".")
+    if point and fraction.isdigit():
+        try:
+            return ScaledValue(int(whole + fraction), len(fraction))
+        except ValueError:
+            pass
+    return number_from_text(text)
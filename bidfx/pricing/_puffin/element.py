@@ -27,8 +27,14 @@ class Element:
     def attributes(self) -> iter:
         return iter(self._attributes)
 
-    def extract_price(self) -> dict:
+    def extract_price(self, fields=None) -> dict:
         if self._sub_elements:
+            if fields is not None:
+                return {
+                    k: v
+                    for k, v in self._sub_elements[0].attributes()
+                    if k in fields and k not in OMITTED_KEYS
+                }
             return {
                 k: v
                 for k, v in self._sub_elements[0].attributes()
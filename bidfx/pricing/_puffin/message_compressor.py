@@ -1,6 +1,7 @@
 __all__ = ["MessageCompressor"]
 
 import logging
+import threading
 
 from .element import Element
 from .token_dictionary import Dictionary, Token, TokenType
@@ -9,18 +10,37 @@ log = logging.getLogger("bidfx.pricing.puffin.compressor")
 
 
 class MessageCompressor:
+    """
+    Compresses Puffin messages into a reusable buffer that is written to the socket in one call
+    per message, or per batch of messages when flushing is deferred to an explicit `flush()`.
+    """
+
     def __init__(self, opened_socket):
         self._token_usage_by_token = {}
         self._dictionary = Dictionary(self._token_usage_by_token)
         self._opened_socket = opened_socket
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
 
-    def compress_message(self, message: Element):
+    def compress_message(self, message: Element, flush=True):
         # The only compressed messages the clients sends are single flat elements with string attributes.
-        self.write_token(Token(TokenType.START, message.tag))
-        for (name, value) in message.attributes():
-            self.write_token(Token(TokenType.NAME, name))
-            self.write_token(Token(TokenType.STRING, value))
-        self._write_type(TokenType.EMPTY)
+        with self._lock:
+            self.write_token(Token(TokenType.START, message.tag))
+            for (name, value) in message.attributes():
+                self.write_token(Token(TokenType.NAME, name))
+                self.write_token(Token(TokenType.STRING, value))
+            self._write_type(TokenType.EMPTY)
+            if flush:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            self._opened_socket.sendall(bytes(self._buffer))
+            self._buffer.clear()
 
     def write_token(self, token: Token):
         if token.length():
@@ -30,15 +50,15 @@ class MessageCompressor:
                 if token_usage is not None:
                     self._token_usage_by_token[token] = token_usage
                 self._write_type(token.type)
-                self._opened_socket.sendall(token.text.encode("ascii"))
+                self._buffer += token.text.encode("ascii")
             else:
                 self._write_token_usage(token_usage)
         else:
             self._write_type(token.type)
 
     def _write_type(self, token_type: TokenType):
-        self._opened_socket.sendall(bytes([token_type.value]))
+        self._buffer.append(token_type.value)
 
     def _write_token_usage(self, token_usage):
         symbol = self._dictionary.optimise_token_usage(token_usage)
-        self._opened_socket.sendall(Dictionary.symbol_bytes(symbol))
+        self._buffer += Dictionary.symbol_bytes(symbol)
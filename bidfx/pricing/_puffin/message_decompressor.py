@@ -1,109 +1,207 @@
 __all__ = ["MessageDecompressor"]
 
-import io
 import logging
+import re
 import socket
 
 from bidfx import PricingError
 from .element import Element
 from .token_dictionary import Dictionary, Token, TokenType
+from .._price_values import (
+    STRING_VALUES,
+    SCALED_VALUES,
+    number_from_text,
+    scaled_from_text,
+)
 
 log = logging.getLogger("bidfx.pricing.puffin.decompression")
 
+END = TokenType.END.value
+EMPTY = TokenType.EMPTY.value
+START = TokenType.START.value
+CONTENT = TokenType.CONTENT.value
+NAME = TokenType.NAME.value
+INTEGER = TokenType.INTEGER.value
+DOUBLE = TokenType.DOUBLE.value
+FRACTION = TokenType.FRACTION.value
+STRING = TokenType.STRING.value
+
+TOKEN_TYPES = list(TokenType)
+VALUE_TYPES = (INTEGER, DOUBLE, FRACTION, STRING)
+
+END_TOKEN = Token(TokenType.END)
 EMPTY_TOKEN = Token(TokenType.EMPTY)
 NULL_VALUE_TOKEN = Token(TokenType.STRING)
 NULL_CONTENT_TOKEN = Token(TokenType.CONTENT)
 
+NUMERIC_CONVERSIONS = {
+    TokenType.INTEGER: number_from_text,
+    TokenType.DOUBLE: number_from_text,
+    TokenType.FRACTION: number_from_text,
+}
+
+SCALED_CONVERSIONS = {
+    TokenType.INTEGER: number_from_text,
+    TokenType.DOUBLE: scaled_from_text,
+    TokenType.FRACTION: scaled_from_text,
+}
+
+# Plain text is any run of bytes that are neither token types nor symbols.
+PLAIN_TEXT = re.compile(b"[%c-\x7f]*" % Dictionary.NUM_TOKEN_TYPES)
+
+SYMBOL_BITS = Dictionary.SYMBOL_BITS
+SYMBOL_MASK = Dictionary.SYMBOL_MASK
+NUM_TOKEN_TYPES = Dictionary.NUM_TOKEN_TYPES
+NUM_ONE_BYTE_SYMBOLS = Dictionary.NUM_ONE_BYTE_SYMBOLS
+
+
+def _text(text):
+    return text
+
 
 class MessageDecompressor:
-    def __init__(self, opened_socket):
+    """
+    Decompresses Puffin messages from a socket. Socket data is received in large blocks into a buffer
+    that is scanned in place. Each token is read by a function looked up by its first byte.
+    """
+
+    def __init__(
+        self,
+        opened_socket,
+        price_values=STRING_VALUES,
+        on_drained=None,
+        buffer_size=65536,
+    ):
+        self._opened_socket = opened_socket
+        self._on_drained = on_drained
         self._dictionary = Dictionary()
-        self._input = io.BufferedReader(socket.SocketIO(opened_socket, "r"), 4096)
-        self._tag_stack = list()
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._position = 0
+        self._end = 0
+        self._typed_values = price_values != STRING_VALUES
+        self._conversions = (
+            SCALED_CONVERSIONS if price_values == SCALED_VALUES else NUMERIC_CONVERSIONS
+        )
+        self._token_readers = (
+            [self._read_end, self._read_empty]
+            + [self._read_unseen_token] * (NUM_TOKEN_TYPES - 2)
+            + [self._read_plain_text_error] * (NUM_ONE_BYTE_SYMBOLS - NUM_TOKEN_TYPES)
+            + [self._read_symbol] * NUM_ONE_BYTE_SYMBOLS
+        )
 
     def decompress_message(self) -> Element:
-        token = self._next_token()
-        if token.type != TokenType.START:
+        next_token = self._next_token
+        token = next_token()
+        if token.type != START:
             raise PricingError("start tag expected")
         element = Element(token.text)
         stack = list()
+        typed_values = self._typed_values
         while True:
-            token = self._next_token()
-            if token is None:
-                raise PricingError("unexpected XML message termination")
-            if token.type == TokenType.NAME:
-                name = token
-                value = self._next_token()
-                if value is not None:
-                    element.set(name.text, value.text)
-            elif token.type == TokenType.END or token.type == TokenType.EMPTY:
-                if len(stack) == 0:
+            token = next_token()
+            token_type = token.type
+            if token_type == NAME:
+                value = next_token()
+                if stack and typed_values:
+                    element.set(token.text, self._typed_value(value))
+                else:
+                    element.set(token.text, value.text)
+            elif token_type == END or token_type == EMPTY:
+                if not stack:
                     return element
                 element = stack.pop()
-            elif token.type == TokenType.START:
+            elif token_type == START:
                 parent = element
                 element = Element(token.text)
                 parent.nest(element)
                 stack.append(parent)
-            elif token.type == TokenType.CONTENT:
+            elif token_type == CONTENT:
                 log.warning(f"ignoring unexpected XML content: {token}")
-            elif token.type in (
-                TokenType.INTEGER,
-                TokenType.DOUBLE,
-                TokenType.FRACTION,
-                TokenType.STRING,
-            ):
+            elif token_type in VALUE_TYPES:
                 raise PricingError(f"attribute value with no name: {token}")
             else:
                 raise PricingError(f"unknown token type: {token}")
 
+    def _typed_value(self, token):
+        # Nested price attributes are converted by token type. Dictionary tokens cache their value.
+        value = token.value
+        if value is None and token.text is not None:
+            value = token.value = self._conversions.get(token.type, _text)(token.text)
+        return value
+
     def _next_token(self):
-        b = self._read_byte()
-        if Dictionary.is_first_byte_of_symbol(b):
-            return self._parse_two_byte_token(b)
-        if Dictionary.is_token_type(b):
-            token_type = TokenType(b)
-            if token_type == TokenType.END:
-                return Token(TokenType.END, self._tag_stack.pop())
-            if token_type == TokenType.EMPTY:
-                return EMPTY_TOKEN
-            return self._parse_unseen_token(token_type)
-        else:
-            raise PricingError("Puffin protocol syntax error: token tag expected")
-
-    def _parse_two_byte_token(self, b1):
-        symbol = Dictionary.first_byte_symbol(b1)
-        b2 = self._input.peek(1)[0]
-        if Dictionary.is_second_byte_of_symbol(b2):
-            self._read_byte()
-            symbol |= Dictionary.second_byte_symbol(b2)
-        token = self._dictionary.get_token(symbol)
-        if token.type == TokenType.START:
-            self._tag_stack.append(token.text)
-        return token
-
-    def _parse_unseen_token(self, token_type):
-        text_bytes = bytearray()
-        while True:
-            b = self._input.peek(1)[0]
-            if Dictionary.is_plain_text(b):
-                text_bytes.append(self._read_byte())
-            else:
-                if text_bytes:
-                    text = text_bytes.decode("ascii")
-                    token = Token(token_type, text)
-                    if token_type == TokenType.START:
-                        self._tag_stack.append(token)
-                    self._dictionary.insert_token(token)
-                    return token
-                if token_type == TokenType.STRING:
-                    return NULL_VALUE_TOKEN
-                if token_type == TokenType.CONTENT:
-                    return NULL_CONTENT_TOKEN
-                raise PricingError("text of previously unseen token expected")
-
-    def _read_byte(self):
-        b = self._input.read(1)
-        if b == b"":
+        position = self._position
+        if position == self._end:
+            self._receive()
+            position = self._position
+        b = self._buffer[position]
+        self._position = position + 1
+        return self._token_readers[b](b)
+
+    def _read_end(self, _b):
+        return END_TOKEN
+
+    def _read_empty(self, _b):
+        return EMPTY_TOKEN
+
+    def _read_plain_text_error(self, _b):
+        raise PricingError("Puffin protocol syntax error: token tag expected")
+
+    def _read_symbol(self, b1):
+        symbol = b1 & SYMBOL_MASK
+        if self._position == self._end:
+            self._receive()
+        b2 = self._buffer[self._position]
+        if NUM_TOKEN_TYPES <= b2 < NUM_ONE_BYTE_SYMBOLS:
+            self._position += 1
+            symbol |= (b2 - NUM_TOKEN_TYPES) << SYMBOL_BITS
+        return self._dictionary.get_token(symbol)
+
+    def _read_unseen_token(self, b):
+        text = self._read_plain_text()
+        if text:
+            token = Token(TOKEN_TYPES[b], text)
+            self._dictionary.insert_token(token)
+            return token
+        if b == STRING:
+            return NULL_VALUE_TOKEN
+        if b == CONTENT:
+            return NULL_CONTENT_TOKEN
+        raise PricingError("text of previously unseen token expected")
+
+    def _read_plain_text(self):
+        start = self._position
+        end = PLAIN_TEXT.match(self._buffer, start, self._end).end()
+        if end < self._end:
+            self._position = end
+            return str(self._view[start:end], "ascii")
+        # The text runs to the end of the buffered input, so more must be received to find its end.
+        parts = []
+        while end == self._end:
+            parts.append(str(self._view[start:end], "ascii"))
+            self._position = end
+            self._receive()
+            start = self._position
+            end = PLAIN_TEXT.match(self._buffer, start, self._end).end()
+        parts.append(str(self._view[start:end], "ascii"))
+        self._position = end
+        return "".join(parts)
+
+    def _receive(self):
+        if self._on_drained:
+            self._on_drained()
+        self._compact()
+        received = self._opened_socket.recv_into(self._view[self._end :])
+        if not received:
             raise socket.error("end of socket stream")
-        return ord(b)
+        self._end += received
+
+    def _compact(self):
+        if self._position == self._end:
+            self._position = self._end = 0
+        elif self._position:
+            size = self._end - self._position
+            self._buffer[:size] = self._buffer[self._position : self._end]
+            self._position = 0
+            self._end = size
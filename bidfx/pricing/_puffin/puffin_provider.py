@@ -2,6 +2,7 @@ __all__ = ["PuffinProvider"]
 
 import getpass
 import logging
+import socket
 import threading
 import time
 from base64 import b64decode, b64encode
@@ -14,7 +15,11 @@ from bidfx.exceptions import PricingError, IncompatibleVersionError
 from .element import Element, ElementParser
 from .message_compressor import MessageCompressor
 from .message_decompressor import MessageDecompressor
+from .._field_selection import FieldSelection
+from .._message_writer import MessageWriter
+from .._price_values import price_values_from_config
 from .._service_connector import ServiceConnector
+from .._timer_wheel import shared_timer_wheel
 from ..callbacks import Callbacks
 from ..events import (
     ProviderEvent,
@@ -22,12 +27,15 @@ from ..events import (
     SubscriptionEvent,
     SubscriptionStatus,
     PriceEvent,
+    PriceBatchEvent,
 )
 from ..provider import PriceProvider
 
 log = logging.getLogger("bidfx.pricing.puffin")
 
 CURRENT_PROTOCOL_VERSION = 8
+TIMER_INTERVAL = 0.1
+SILENT_HEARTBEATS = 1.5
 
 _status_adaptor = [
     SubscriptionStatus.OK,
@@ -65,6 +73,15 @@ class SubscriptionSet:
         with self._lock:
             del self._subscribed_subjects[str(subject)]
 
+    def subscribe_many(self, subjects):
+        with self._lock:
+            self._subscribed_subjects.update((str(s), s) for s in subjects)
+
+    def unsubscribe_many(self, subjects):
+        with self._lock:
+            pop = self._subscribed_subjects.pop
+            return [s for s in subjects if pop(str(s), None) is not None]
+
     def subject_from_string(self, subject_str):
         with self._lock:
             return self._subscribed_subjects.get(subject_str, None)
@@ -77,7 +94,7 @@ class SubscriptionSet:
 class PuffinProvider(PriceProvider):
     _instance = 0
 
-    def __init__(self, config_section, callbacks: Callbacks):
+    def __init__(self, config_section, callbacks: Callbacks, field_selection=None):
         PuffinProvider._instance += 1
         self._provider_name = f"Puffin-{PuffinProvider._instance}"
         self._host = config_section["host"]
@@ -90,12 +107,18 @@ class PuffinProvider(PriceProvider):
         self._heartbeat_interval = config_section.getint("heartbeat_interval", 10)
         self._reconnect_interval = config_section.getint("reconnect_interval", 10)
         self._tunnel = config_section.getboolean("tunnel", True)
+        self._price_values = price_values_from_config(config_section)
         self._callbacks = callbacks
+        self._field_selection = field_selection or FieldSelection()
         self._subscription_set = SubscriptionSet()
+        self._price_batch = []
         self._compressor = None
         self._decompressor = None
         self._opened_socket = None
+        self._writer = None
+        self._timer = None
         self._last_time_write = 0
+        self._last_time_read = 0
         self._running = False
 
     def start(self):
@@ -121,9 +144,24 @@ class PuffinProvider(PriceProvider):
         self._subscription_set.unsubscribe(subject)
         self._send_unsubscribe(subject)
 
+    def subscribe_many(self, subjects):
+        subjects = list(subjects)
+        log.info(f"subscribe to {len(subjects)} subjects")
+        self._subscription_set.subscribe_many(subjects)
+        for subject in subjects:
+            self._send_subscribe(subject)
+
+    def unsubscribe_many(self, subjects):
+        subjects = list(subjects)
+        log.info(f"unsubscribe from {len(subjects)} subjects")
+        for subject in self._subscription_set.unsubscribe_many(subjects):
+            self._send_unsubscribe(subject)
+
     def stop(self):
         log.info(f"stopping {self._provider_name} provider")
         self._running = False
+        # The shared timer wheel's thread ends once the timers of all providers are cancelled.
+        self._stop_timer()
         if self._opened_socket:
             self._opened_socket.close()
 
@@ -143,11 +181,40 @@ class PuffinProvider(PriceProvider):
             self._price_server_read_loop()
         except Exception as e:
             log.warning(f"connection attempt failed due to: {e}")
+        finally:
+            self._publish_price_batch()
+            self._stop_timer()
+            self._stop_writer()
 
     def _prepare_new_session(self):
         self._compressor = MessageCompressor(self._opened_socket)
-        self._decompressor = MessageDecompressor(self._opened_socket)
+        self._price_batch = []
+        self._decompressor = MessageDecompressor(
+            self._opened_socket, self._price_values, self._publish_price_batch
+        )
+        writer = MessageWriter(
+            self._provider_name, self._write_messages, self._on_write_error
+        )
+        writer.start()
+        self._writer = writer
         self._refresh_subscriptions()
+        self._last_time_read = time.time()
+        self._timer = shared_timer_wheel().schedule(
+            TIMER_INTERVAL, self._on_timer, interval=TIMER_INTERVAL
+        )
+
+    def _stop_timer(self):
+        timer = self._timer
+        if timer:
+            self._timer = None
+            timer.cancel()
+
+    def _stop_writer(self):
+        writer = self._writer
+        if writer:
+            self._writer = None
+            writer.stop()
+            log.info(str(writer))
 
     def _open_connection(self):
         connector = ServiceConnector(
@@ -175,8 +242,11 @@ class PuffinProvider(PriceProvider):
         try:
             while self._running:
                 message = self._decompressor.decompress_message()
+                self._last_time_read = time.time()
                 self._handle_received_message(message)
         except Exception as e:
+            # Prices read before the connection was lost are published before the subjects go stale.
+            self._publish_price_batch()
             self._publish_provider_status(
                 ProviderStatus.DOWN, f"connection error due to: {e}"
             )
@@ -184,6 +254,19 @@ class PuffinProvider(PriceProvider):
                 f"price provider {self._provider_name} is down"
             )
 
+    def _on_timer(self):
+        # Runs on the shared timer thread, detecting a silent server sooner than the socket read timeout.
+        silence = time.time() - self._last_time_read
+        if silence > self._heartbeat_interval * SILENT_HEARTBEATS:
+            log.warning(
+                f"{self._provider_name} received nothing for {silence:.1f}s, disconnecting"
+            )
+            self._stop_timer()
+            try:
+                self._opened_socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
     def _handle_received_message(self, message: Element):
         msg_type = message.tag
         if msg_type == "Update":
@@ -198,12 +281,27 @@ class PuffinProvider(PriceProvider):
     def _handle_price_update_message(self, message: Element, full: bool):
         subject = self._subscribed_subject_attribute(message)
         if subject:
-            price = message.extract_price()
-            self._callbacks.price_event_fn(PriceEvent(subject, price, full))
+            price = message.extract_price(self._field_selection.fields_for(subject))
+            event = PriceEvent(subject, price, full)
+            if self._callbacks.price_batch_fn:
+                self._price_batch.append(event)
+            else:
+                self._callbacks.price_event_fn(event)
+
+    def _publish_price_batch(self):
+        if self._price_batch:
+            events = self._price_batch
+            self._price_batch = []
+            if self._callbacks.price_batch_fn:
+                self._callbacks.price_batch_fn(PriceBatchEvent(events))
+            else:
+                for event in events:
+                    self._callbacks.price_event_fn(event)
 
     def _handle_price_status_message(self, message: Element):
         subject = self._subscribed_subject_attribute(message)
         if subject:
+            self._publish_price_batch()
             status_id = int(message["Id"])
             status = self._puffin_status_adaptor(status_id)
             explanation = message.get("Text", "")
@@ -291,11 +389,23 @@ class PuffinProvider(PriceProvider):
     def _send_message(self, message: Element, compress=True):
         log.debug(f"sending: {message}")
         if compress:
-            self._compressor.compress_message(message)
+            writer = self._writer
+            if writer:
+                writer.send(message)
         else:
             self._opened_socket.sendall(str(message).encode("ascii"))
+            self._last_time_write = time.time()
+
+    def _write_messages(self, messages):
+        # All of the queued messages are compressed in order and written together.
+        for message in messages:
+            self._compressor.compress_message(message, flush=False)
+        self._compressor.flush()
         self._last_time_write = time.time()
 
+    def _on_write_error(self, error):
+        self._opened_socket.close()
+
     def _publish_provider_status(self, status: ProviderStatus, reason=""):
         event = ProviderEvent(self._provider_name, status, reason)
         log.info(str(event))
@@ -318,9 +428,7 @@ class PuffinProvider(PriceProvider):
             self._send_subscribe(subject)
 
     def _send_subscribe(self, subject):
-        if self._opened_socket:
-            self._send_message(Element("Subscribe").set("Subject", str(subject)))
+        self._send_message(Element("Subscribe").set("Subject", str(subject)))
 
     def _send_unsubscribe(self, subject):
-        if self._opened_socket:
-            self._send_message(Element("Unsubscribe").set("Subject", str(subject)))
+        self._send_message(Element("Unsubscribe").set("Subject", str(subject)))
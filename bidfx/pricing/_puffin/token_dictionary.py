@@ -3,7 +3,7 @@ __all__ = ["Dictionary", "Token", "TokenType"]
 import io
 import logging
 import socket
-from enum import Enum, unique
+from enum import IntEnum, unique
 
 from bidfx import PricingError
 from .element import Element
@@ -12,7 +12,7 @@ log = logging.getLogger("bidfx.pricing.puffin.decompressor")
 
 
 @unique
-class TokenType(Enum):
+class TokenType(IntEnum):
     END = 0
     EMPTY = 1
     START = 2
@@ -25,11 +25,12 @@ class TokenType(Enum):
 
 
 class Token:
-    __slots__ = ("type", "text")
+    __slots__ = ("type", "text", "value")
 
     def __init__(self, token_type, text=None):
         self.type = token_type
         self.text = text
+        self.value = None
 
     def __str__(self):
         if self.type == TokenType.START:
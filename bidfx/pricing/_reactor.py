@@ -0,0 +1,210 @@
+__all__ = ["Reactor", "shared_reactor"]
+
+import logging
+import selectors
+import socket
+import ssl
+import threading
+from collections import deque
+
+log = logging.getLogger("bidfx.pricing.reactor")
+
+_WOULD_BLOCK = (BlockingIOError, ssl.SSLWantReadError, ssl.SSLWantWriteError)
+
+
+class Channel:
+    """
+    A non-blocking socket connection served by a `Reactor`.
+    Data may be written by any thread. It is buffered and sent by the reactor thread.
+    """
+
+    def __init__(self, reactor, name, opened_socket, on_readable, on_closed):
+        self._reactor = reactor
+        self._name = name
+        self._socket = opened_socket
+        self._on_readable = on_readable
+        self._on_closed = on_closed
+        self._out = bytearray()
+        self._lock = threading.Lock()
+        self._flush_scheduled = False
+        self._writing = False
+        self._closed = False
+        self.bytes_written = 0
+        self.writes = 0
+
+    def write(self, data):
+        with self._lock:
+            if self._closed:
+                return
+            self._out += data
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+        if schedule:
+            self._reactor.call_soon(self._flush)
+
+    def close(self, error=None):
+        """
+        Closes the channel, after which its on_closed function is called by the reactor thread.
+
+        :param error: The reason for closing, passed to on_closed.
+        """
+        self._reactor.call_soon(lambda: self._close(error))
+
+    def _register(self):
+        self._reactor._selector.register(self._socket, selectors.EVENT_READ, self)
+        # Data may already have been buffered by the reader before the socket was handed over.
+        self._on_events(selectors.EVENT_READ)
+
+    def _on_events(self, events):
+        if self._closed:
+            return
+        if events & selectors.EVENT_READ:
+            try:
+                self._on_readable()
+            except Exception as e:
+                self._close(e)
+                return
+        if events & selectors.EVENT_WRITE:
+            self._flush()
+
+    def _flush(self):
+        if self._closed:
+            return
+        error = None
+        with self._lock:
+            self._flush_scheduled = False
+            try:
+                while self._out:
+                    sent = self._socket.send(self._out)
+                    del self._out[:sent]
+                    self.bytes_written += sent
+                    self.writes += 1
+            except _WOULD_BLOCK:
+                pass
+            except OSError as e:
+                error = e
+            writing = bool(self._out)
+        if error:
+            self._close(error)
+        elif writing != self._writing:
+            # Write readiness is only watched while there is unsent data.
+            self._writing = writing
+            events = selectors.EVENT_READ | (selectors.EVENT_WRITE if writing else 0)
+            self._reactor._selector.modify(self._socket, events, self)
+
+    def _close(self, error):
+        if self._closed:
+            return
+        with self._lock:
+            self._closed = True
+            self._out.clear()
+        try:
+            self._reactor._selector.unregister(self._socket)
+        except (KeyError, ValueError):
+            pass
+        self._socket.close()
+        try:
+            self._on_closed(error or ConnectionAbortedError("connection closed"))
+        except Exception:
+            log.exception(f"{self._name} failed to handle the closed connection")
+
+    def __str__(self):
+        return f"{self._name} wrote {self.bytes_written} bytes in {self.writes} writes"
+
+
+class Reactor:
+    """
+    A single thread that serves any number of non-blocking socket connections using a selector,
+    so that many connections can be read without a thread each.
+    The reading function of a connection is called whenever its socket is readable
+    and must consume the data that is available without blocking.
+    """
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._wake_receiver, self._wake_sender = socket.socketpair()
+        self._wake_receiver.setblocking(False)
+        self._wake_sender.setblocking(False)
+        self._selector.register(self._wake_receiver, selectors.EVENT_READ)
+        self._calls = deque()
+        self._lock = threading.Lock()
+        self._woken = False
+        self._thread = None
+
+    def register(self, name, opened_socket, on_readable, on_closed):
+        """
+        Hands a connected socket over to the reactor, which sets it to non-blocking.
+
+        :param name: The name of the connection, used for logging.
+        :param opened_socket: The connected socket, which may be an `ssl.SSLSocket`.
+        :param on_readable: Function called by the reactor thread when the socket is readable.
+        :param on_closed: Function called by the reactor thread with the error that closed the connection.
+        :return: The `Channel` used to write to and close the connection.
+        """
+        opened_socket.setblocking(False)
+        channel = Channel(self, name, opened_socket, on_readable, on_closed)
+        self.call_soon(channel._register)
+        return channel
+
+    def call_soon(self, task):
+        """
+        Calls a task on the reactor thread. A task called from the reactor thread itself
+        runs once the current socket events have been handled.
+        """
+        with self._lock:
+            self._calls.append(task)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="bidfx-reactor", daemon=True
+                )
+                self._thread.start()
+            elif self._woken or threading.current_thread() is self._thread:
+                return
+            self._woken = True
+        try:
+            self._wake_sender.send(b"\0")
+        except BlockingIOError:
+            pass
+
+    def _run(self):
+        while True:
+            timeout = 0 if self._calls else None
+            for key, events in self._selector.select(timeout):
+                if key.data is None:
+                    self._drain_wake_ups()
+                else:
+                    key.data._on_events(events)
+            self._run_calls()
+
+    def _drain_wake_ups(self):
+        with self._lock:
+            self._woken = False
+        try:
+            while self._wake_receiver.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _run_calls(self):
+        calls = self._calls
+        for _ in range(len(calls)):
+            task = calls.popleft()
+            try:
+                task()
+            except Exception:
+                log.exception("reactor task failed")
+
+
+_shared_reactor = None
+_shared_reactor_lock = threading.Lock()
+
+
+def shared_reactor():
+    """
+    Gets the reactor shared by all of the price providers configured to use one.
+    """
+    global _shared_reactor
+    with _shared_reactor_lock:
+        if _shared_reactor is None:
+            _shared_reactor = Reactor()
+        return _shared_reactor
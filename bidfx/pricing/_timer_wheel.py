@@ -0,0 +1,140 @@
+__all__ = ["TimerWheel", "shared_timer_wheel"]
+
+import logging
+import math
+import threading
+import time
+
+log = logging.getLogger("bidfx.pricing.timer")
+
+DEFAULT_TICK = 0.05
+DEFAULT_SLOTS = 256
+
+
+class Timer:
+    """
+    A task scheduled on a `TimerWheel`, which may be cancelled.
+    """
+
+    __slots__ = ("task", "interval_ticks", "deadline", "cancelled")
+
+    def __init__(self, task, interval_ticks, deadline):
+        self.task = task
+        self.interval_ticks = interval_ticks
+        self.deadline = deadline
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimerWheel:
+    """
+    A hashed timer wheel that runs timed tasks from a single thread.
+    Time is divided into ticks and each timer is held in the slot of the tick it is due on,
+    so scheduling and expiring a timer take constant time however many timers there are.
+    Timers are accurate to one tick. Tasks must be quick, as they run on the wheel's thread.
+    The thread is started by the first timer scheduled, and ends when the wheel is stopped
+    or once no timers are left, so a shared wheel has no thread while nothing uses it.
+    """
+
+    def __init__(self, tick=DEFAULT_TICK, slots=DEFAULT_SLOTS):
+        self._tick = tick
+        self._slots = [[] for _ in range(slots)]
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._ticks = 0
+        self._start_time = None
+        self._thread = None
+
+    def schedule(self, delay, task, interval=None):
+        """
+        Schedules a task to run after a delay in seconds, and then repeatedly at an interval if one is given.
+
+        :return: The `Timer`, which can be used to cancel the task.
+        """
+        interval_ticks = self._to_ticks(interval) if interval else None
+        with self._lock:
+            if self._thread is None:
+                self._start()
+            timer = Timer(task, interval_ticks, self._ticks + self._to_ticks(delay))
+            self._add(timer)
+        return timer
+
+    def stop(self):
+        """
+        Stops the wheel's thread and drops all of the scheduled timers.
+        Scheduling another timer starts the wheel again.
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+            for slot in self._slots:
+                slot.clear()
+            self._wake.notify_all()
+        if thread and thread is not threading.current_thread():
+            thread.join()
+
+    def _to_ticks(self, seconds):
+        return max(1, math.ceil(seconds / self._tick))
+
+    def _add(self, timer):
+        self._slots[timer.deadline % len(self._slots)].append(timer)
+
+    def _start(self):
+        self._start_time = time.monotonic()
+        self._ticks = 0
+        self._thread = threading.Thread(
+            target=self._run, name="bidfx-timer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        thread = threading.current_thread()
+        while True:
+            with self._lock:
+                while True:
+                    if self._thread is not thread:
+                        return
+                    delay = (
+                        self._start_time
+                        + (self._ticks + 1) * self._tick
+                        - time.monotonic()
+                    )
+                    if delay <= 0:
+                        break
+                    self._wake.wait(delay)
+                due = self._expire_next_tick()
+                idle = not any(self._slots)
+                if idle:
+                    # Scheduling another timer starts a new thread.
+                    self._thread = None
+            for timer in due:
+                try:
+                    timer.task()
+                except Exception:
+                    log.exception("timer task failed")
+            if idle:
+                return
+
+    def _expire_next_tick(self):
+        self._ticks += 1
+        ticks = self._ticks
+        slot = self._slots[ticks % len(self._slots)]
+        due = [t for t in slot if t.deadline <= ticks and not t.cancelled]
+        slot[:] = [t for t in slot if t.deadline > ticks and not t.cancelled]
+        for timer in due:
+            if timer.interval_ticks:
+                timer.deadline = ticks + timer.interval_ticks
+                self._add(timer)
+        return due
+
+
+_shared_timer_wheel = TimerWheel()
+
+
+def shared_timer_wheel():
+    """
+    Gets the timer wheel shared by all of the price providers.
+    """
+    return _shared_timer_wheel
@@ -0,0 +1,363 @@
+__all__ = ["AsyncPricingAPI", "EventStream"]
+
+import asyncio
+from collections import deque
+
+from .dispatcher import CONFLATE, DEFAULT_QUEUE_SIZE, DROP_OLDEST, merge_price_events
+from .events import PriceEvent
+from .pricing import PricingAPI
+from ..exceptions import PricingError
+
+STREAM_OVERFLOW_POLICIES = (DROP_OLDEST, CONFLATE)
+
+
+class EventStream:
+    """
+    An asynchronous iterator over the pricing events published by an `AsyncPricingAPI`,
+    optionally filtered to a single subject. Event streams are created by `AsyncPricingAPI.events`
+    and should be closed when no longer needed, most simply by using them as an async context manager.
+
+    .. code-block:: python
+
+        async with pricing.events(subject) as events:
+            async for event in events:
+                print(event)
+
+    A stream holds at most ``max_size`` events that have not yet been consumed.
+    What happens when a consumer lags and the stream is full is set by ``overflow``, which is one of:
+
+    - ``drop_oldest`` - the oldest event is dropped. This is the default.
+    - ``conflate`` - a price update is merged into the unconsumed price event of its subject, if there is one,
+      otherwise the oldest event is dropped.
+    """
+
+    def __init__(
+        self,
+        subject=None,
+        on_close=None,
+        max_size=DEFAULT_QUEUE_SIZE,
+        overflow=DROP_OLDEST,
+    ):
+        """
+        :param subject: The subject to filter events by, or None for all events.
+        :type subject: Subject
+        :param on_close: Function called with the stream when the stream is closed.
+        :param max_size: The maximum number of unconsumed events held by the stream.
+        :type max_size: int
+        :param overflow: The overflow policy, one of 'drop_oldest' or 'conflate'.
+        :type overflow: str
+        :raises PricingError: if the overflow policy is not supported.
+        """
+        if overflow not in STREAM_OVERFLOW_POLICIES:
+            raise PricingError(
+                f"unsupported event stream overflow '{overflow}', expected one of {STREAM_OVERFLOW_POLICIES}"
+            )
+        self._subject = subject
+        self._on_close = on_close
+        self._max_size = max(1, max_size)
+        self._overflow = overflow
+        # Each entry is a list of the event and its subject, as in the dispatcher's queues.
+        self._events = deque()
+        self._queued_prices = {}
+        self._waiter = None
+        self._closed = False
+        self.dropped = 0
+        """The number of events dropped because the stream was full."""
+        self.conflated = 0
+        """The number of price events merged into an unconsumed event because the stream was full."""
+
+    @property
+    def subject(self):
+        """
+        The subject that events are filtered by, or None if the stream receives all events.
+
+        :rtype: Subject
+        """
+        return self._subject
+
+    def close(self):
+        """
+        Closes the stream. Iteration stops once the events already received have been consumed.
+        """
+        if not self._closed:
+            self._closed = True
+            if self._on_close:
+                self._on_close(self)
+            self._wake()
+
+    def _put(self, event):
+        events = self._events
+        subject = getattr(event, "subject", None)
+        mergeable = isinstance(event, PriceEvent)
+        if len(events) >= self._max_size:
+            entry = self._queued_prices.get(subject) if mergeable else None
+            if entry is not None and self._overflow == CONFLATE:
+                entry[0] = merge_price_events(entry[0], event)
+                self.conflated += 1
+                return
+            self._forget(events.popleft())
+            self.dropped += 1
+        entry = [event, subject]
+        events.append(entry)
+        if mergeable:
+            self._queued_prices[subject] = entry
+        elif subject is not None:
+            # Later prices must not be merged into those queued before this event.
+            self._queued_prices.pop(subject, None)
+        self._wake()
+
+    def _forget(self, entry):
+        subject = entry[1]
+        if subject is not None and self._queued_prices.get(subject) is entry:
+            del self._queued_prices[subject]
+
+    def _wake(self):
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._events:
+            if self._closed:
+                raise StopAsyncIteration
+            self._waiter = asyncio.get_event_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        entry = self._events.popleft()
+        self._forget(entry)
+        return entry[0]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class AsyncPricingAPI:
+    """
+    An asyncio interface to the real-time pricing services of BidFX.
+    Pricing events are delivered on the event loop through `EventStream` async iterators,
+    so there is no need for callbacks or for bridging between threads.
+    For example:
+
+    .. code-block:: python
+
+        async def main():
+            session = AsyncSession.create_from_ini_file()
+            pricing = session.pricing
+            await pricing.start()
+            subject = pricing.build.fx.indicative.spot.currency_pair("EURUSD").create_subject()
+            async with pricing.events(subject) as events:
+                await pricing.subscribe(subject)
+                async for event in events:
+                    print(event)
+
+    The price servers are read by the same provider threads as the `PricingAPI`.
+    Their events are handed over to the event loop in bursts, with one loop wake-up per burst
+    rather than one per event.
+    """
+
+    def __init__(self, config_parser):
+        """
+        :param config_parser: The API configuration.
+        :type config_parser: configparser.ConfigParser
+        """
+        self._pricing = PricingAPI(config_parser)
+        self._loop = None
+        self._pending = deque()
+        self._scheduled = False
+        self._all_streams = []
+        self._subject_streams = {}
+        callbacks = self._pricing.callbacks
+        callbacks.price_event_fn = self._handover
+        callbacks.price_batch_fn = self._handover_batch
+        callbacks.subscription_event_fn = self._handover
+        callbacks.provider_event_fn = self._handover
+
+    async def start(self):
+        """
+        Starts the pricing threads which connect to the price services,
+        delivering their events to the running event loop.
+        """
+        # Inside a coroutine this is the running loop. get_running_loop() is not used as it needs Python 3.7.
+        self._loop = asyncio.get_event_loop()
+        self._pricing.start()
+        if self._pending:
+            self._schedule()
+
+    async def stop(self):
+        """
+        Stops the pricing threads and closes all of the event streams.
+        """
+        self._pricing.stop()
+        for stream in list(self._all_streams) + [
+            s for streams in self._subject_streams.values() for s in streams
+        ]:
+            stream.close()
+
+    def events(self, subject=None, max_size=DEFAULT_QUEUE_SIZE, overflow=DROP_OLDEST):
+        """
+        Creates a stream of the pricing events published from now on.
+        A stream for a subject receives its `PriceEvent` and `SubscriptionEvent`.
+        A stream for all subjects also receives each `ProviderEvent`.
+
+        :param subject: The subject to filter events by, or None for all events.
+        :type subject: Subject
+        :param max_size: The maximum number of unconsumed events held by the stream.
+        :type max_size: int
+        :param overflow: What to do when the stream is full, either 'drop_oldest' or 'conflate'.
+        :type overflow: str
+        :return: An async iterator of events.
+        :rtype: EventStream
+        :raises PricingError: if the overflow policy is not supported.
+        """
+        stream = EventStream(subject, self._remove_stream, max_size, overflow)
+        if subject is None:
+            self._all_streams.append(stream)
+        else:
+            self._subject_streams.setdefault(subject, []).append(stream)
+        return stream
+
+    def _remove_stream(self, stream):
+        if stream.subject is None:
+            self._all_streams.remove(stream)
+        else:
+            streams = self._subject_streams[stream.subject]
+            streams.remove(stream)
+            if not streams:
+                del self._subject_streams[stream.subject]
+
+    async def subscribe(self, subject):
+        """
+        Subscribes to real-time price publications on a given `Subject`.
+
+        :param subject: The price subject to subscribe to.
+        :type subject: Subject
+        """
+        self._pricing.subscribe(subject)
+
+    async def unsubscribe(self, subject):
+        """
+        Un-subscribes from a previously subscribed price `Subject`.
+
+        :param subject: The price subject to unsubscribe from.
+        :type subject: Subject
+        """
+        self._pricing.unsubscribe(subject)
+
+    async def subscribe_many(self, subjects):
+        """
+        Subscribes to real-time price publications on many `Subject` at once.
+
+        :param subjects: The price subjects to subscribe to.
+        :type subjects: list
+        """
+        self._pricing.subscribe_many(subjects)
+
+    async def unsubscribe_many(self, subjects):
+        """
+        Un-subscribes from many previously subscribed price `Subject` at once.
+
+        :param subjects: The price subjects to unsubscribe from.
+        :type subjects: list
+        """
+        self._pricing.unsubscribe_many(subjects)
+
+    async def refresh(self, subject):
+        """
+        Requests a full refresh of the price image of a subscribed exclusive pricing `Subject`.
+
+        :param subject: The price subject to refresh.
+        :type subject: Subject
+        :raises PricingError: if the subject is not an exclusive pricing subject.
+        """
+        self._pricing.refresh(subject)
+
+    async def toggle(self, subject):
+        """
+        Toggles a subscribed exclusive pricing `Subject` off and back on again at the liquidity provider.
+
+        :param subject: The price subject to toggle.
+        :type subject: Subject
+        :raises PricingError: if the subject is not an exclusive pricing subject.
+        """
+        self._pricing.toggle(subject)
+
+    def select_fields(self, fields, subject=None):
+        """
+        Restricts the price fields published in each `PriceEvent` to an allow-list of field names.
+        See `PricingAPI.select_fields`.
+
+        :param fields: The names of the price fields to publish, or None to publish all fields.
+        :type fields: list
+        :param subject: The subject to apply the selection to, or None to apply it globally.
+        :type subject: Subject
+        """
+        self._pricing.select_fields(fields, subject)
+
+    def snapshot(self, subject):
+        """
+        Gets the current price image of a subscribed `Subject` from the price cache.
+        See `PricingAPI.snapshot`.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        :return: A read-only map of price fields, or None if there is no current price.
+        :rtype: types.MappingProxyType
+        :raises PricingError: if the price cache is not enabled.
+        """
+        return self._pricing.snapshot(subject)
+
+    def snapshot_all(self):
+        """
+        Gets the current price images of all subscribed subjects from the price cache.
+        See `PricingAPI.snapshot_all`.
+
+        :return: A map of each `Subject` with a current price to its read-only map of price fields.
+        :rtype: dict
+        :raises PricingError: if the price cache is not enabled.
+        """
+        return self._pricing.snapshot_all()
+
+    @property
+    def build(self):
+        """
+        Provides a handle to the subject builder interface. See `PricingAPI.build`.
+
+        :return: A method-chain that should lead to the creation a valid `Subject`.
+        """
+        return self._pricing.build
+
+    def _handover(self, event):
+        # Called by the pricing threads. The loop is only woken for the first event of each burst.
+        self._pending.append(event)
+        self._schedule()
+
+    def _handover_batch(self, batch):
+        self._pending.extend(batch.events)
+        self._schedule()
+
+    def _schedule(self):
+        if not self._scheduled and self._loop is not None:
+            self._scheduled = True
+            self._loop.call_soon_threadsafe(self._deliver_pending)
+
+    def _deliver_pending(self):
+        self._scheduled = False
+        pending = self._pending
+        all_streams = self._all_streams
+        subject_streams = self._subject_streams
+        while pending:
+            event = pending.popleft()
+            for stream in all_streams:
+                stream._put(event)
+            streams = subject_streams.get(getattr(event, "subject", None))
+            if streams:
+                for stream in streams:
+                    stream._put(event)
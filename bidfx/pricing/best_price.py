@@ -0,0 +1,242 @@
+__all__ = ["BestPriceAggregator"]
+
+import heapq
+import threading
+
+from ._callback_stage import CallbackStage
+from .events import BestPriceEvent, SubscriptionStatus
+from .field import Field
+from .subject import Subject
+
+_NO_PRICE = (None, None, None, None, None, None)
+
+
+def best_price_from_config(config_section, callbacks):
+    if not config_section.getboolean("best_price", False):
+        return None
+    return BestPriceAggregator(callbacks)
+
+
+def _to_float(value):
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _Side:
+    """
+    The quotes of one side of an instrument, with a heap of quotes ordered best first.
+    Replaced and withdrawn quotes are left in the heap and skipped when they reach the top,
+    so each update costs O(log n). The heap is rebuilt when it has grown to hold mostly dead entries.
+    """
+
+    __slots__ = ("sign", "heap", "quotes")
+
+    def __init__(self, sign):
+        # The sign orders bids highest first and asks lowest first in the min-heap.
+        self.sign = sign
+        self.heap = []
+        self.quotes = {}
+
+    def set(self, subject, provider, price, size, sequence):
+        quote = self.quotes.get(subject)
+        if quote is not None and quote[0] == price:
+            # A size change keeps the time priority of the quote.
+            self.quotes[subject] = (price, size, provider, quote[3])
+            return
+        self.quotes[subject] = (price, size, provider, sequence)
+        heapq.heappush(self.heap, (self.sign * price, sequence, subject))
+        if len(self.heap) > 2 * len(self.quotes) + 8:
+            self.heap = [
+                (self.sign * price, sequence, subject)
+                for subject, (price, _, _, sequence) in self.quotes.items()
+            ]
+            heapq.heapify(self.heap)
+
+    def withdraw(self, subject):
+        if self.quotes.pop(subject, None) is not None and not self.quotes:
+            self.heap.clear()
+
+    def get(self, subject):
+        quote = self.quotes.get(subject)
+        return (None, None) if quote is None else quote[:2]
+
+    def best(self):
+        heap = self.heap
+        while heap:
+            _, sequence, subject = heap[0]
+            quote = self.quotes.get(subject)
+            if quote is not None and quote[3] == sequence:
+                return quote[:3]
+            heapq.heappop(heap)
+        return None, None, None
+
+
+class _Book:
+    __slots__ = ("bids", "asks", "top")
+
+    def __init__(self):
+        self.bids = _Side(-1)
+        self.asks = _Side(1)
+        self.top = _NO_PRICE
+
+
+class BestPriceAggregator(CallbackStage):
+    """
+    An aggregator of the best bid and offer across the liquidity providers quoting the same instrument.
+    Subjects with a ``LiquidityProvider`` are grouped by their ``Symbol``, ``Quantity``, ``Tenor`` and ``DealType``,
+    and a `BestPriceEvent` is published to ``Callbacks.best_price_fn`` whenever the best bid or ask of a group changes,
+    in price, size or provider. Price updates that do not change the top of book publish nothing.
+
+    Each provider's quote is merged from its partial price updates.
+    The best bid and ask of each group are kept in heaps, so a price update costs O(log n) in the number of providers
+    rather than a scan of them all. A provider's quote is withdrawn when its subscription status changes,
+    for example when it becomes stale, when it is unsubscribed, and a side is withdrawn
+    when a full price update omits its price.
+
+    The aggregator is enabled by setting ``best_price`` in the ``[DEFAULT]`` section of the configuration.
+    It publishes from the same threads as the other callbacks, after the dispatcher if there is one.
+    """
+
+    def __init__(self, callbacks):
+        """
+        :param callbacks: The callback functions to publish events to, including the best price events.
+        :type callbacks: Callbacks
+        """
+        super().__init__(callbacks)
+        self._books = {}
+        self._subject_keys = {}
+        self._sequence = 0
+        # Reentrant so that best price callbacks, which are called under the lock to keep them in order, can query.
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def key_of(subject):
+        """
+        Gets the instrument key that groups a subject with those of other liquidity providers.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        :return: The tuple of Symbol, Quantity, Tenor and DealType,
+            or None for subjects without a liquidity provider and Level 2 book subjects, which are not aggregated.
+        :rtype: tuple
+        """
+        if (
+            Subject.LIQUIDITY_PROVIDER not in subject
+            or Subject.SYMBOL not in subject
+            or subject.get(Subject.LEVEL, None) == "2"
+        ):
+            return None
+        return (
+            subject[Subject.SYMBOL],
+            subject.get(Subject.QUANTITY, None),
+            subject.get(Subject.TENOR, None),
+            subject.get(Subject.DEAL_TYPE, None),
+        )
+
+    def best(self, key):
+        """
+        Gets the current best bid and offer of an instrument.
+
+        :param key: The instrument key, as given by `key_of`.
+        :type key: tuple
+        :return: The latest best price, or None if no provider is quoting the instrument.
+        :rtype: BestPriceEvent
+        """
+        with self._lock:
+            book = self._books.get(key)
+            if book is None or book.top == _NO_PRICE:
+                return None
+            return BestPriceEvent(key, *book.top)
+
+    def keys(self):
+        """
+        Gets the keys of the instruments being aggregated.
+
+        :rtype: list
+        """
+        with self._lock:
+            return list(self._books)
+
+    def discard(self, subject):
+        """
+        Withdraws the quote of a subject, publishing a best price event if it was best.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        """
+        with self._lock:
+            self._withdraw(subject)
+
+    def __len__(self):
+        return len(self._books)
+
+    def __contains__(self, key):
+        return key in self._books
+
+    def _after_publish(self, events, applied):
+        with self._lock:
+            for event in events:
+                self._apply(event)
+
+    def _on_subscription(self, event):
+        super()._on_subscription(event)
+        if event.status is not SubscriptionStatus.OK:
+            with self._lock:
+                self._withdraw(event.subject)
+
+    def _apply(self, event):
+        subject = event.subject
+        key = self._subject_keys.get(subject)
+        if key is None:
+            key = self.key_of(subject)
+            if key is None:
+                return
+            self._subject_keys[subject] = key
+        book = self._books.get(key)
+        if book is None:
+            book = self._books[key] = _Book()
+        provider = subject[Subject.LIQUIDITY_PROVIDER]
+        self._sequence += 1
+        self._update_side(book.bids, event, provider, Field.BID, Field.BID_SIZE)
+        self._update_side(book.asks, event, provider, Field.ASK, Field.ASK_SIZE)
+        self._publish_if_changed(key, book)
+
+    def _update_side(self, side, event, provider, price_field, size_field):
+        price = event.price
+        if event.full:
+            previous_price = previous_size = None
+        else:
+            previous_price, previous_size = side.get(event.subject)
+        value = _to_float(price.get(price_field))
+        if price_field in price and value is None:
+            # An empty price withdraws the side.
+            side.withdraw(event.subject)
+            return
+        value = previous_price if value is None else value
+        if value is None:
+            side.withdraw(event.subject)
+            return
+        size = _to_float(price.get(size_field))
+        size = previous_size if size is None else size
+        side.set(event.subject, provider, value, size, self._sequence)
+
+    def _withdraw(self, subject):
+        key = self._subject_keys.pop(subject, None)
+        book = self._books.get(key)
+        if book is None:
+            return
+        book.bids.withdraw(subject)
+        book.asks.withdraw(subject)
+        self._publish_if_changed(key, book)
+        if not book.bids.quotes and not book.asks.quotes:
+            del self._books[key]
+
+    def _publish_if_changed(self, key, book):
+        top = book.bids.best() + book.asks.best()
+        if top != book.top:
+            book.top = top
+            self._callbacks.best_price_fn(BestPriceEvent(key, *top))
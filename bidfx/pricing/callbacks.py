@@ -13,8 +13,11 @@ class Callbacks:
 
     __slots__ = (
         "price_event_fn",
+        "price_batch_fn",
         "subscription_event_fn",
         "provider_event_fn",
+        "best_price_fn",
+        "depth_event_fn",
     )
 
     def __init__(self):
@@ -24,6 +27,14 @@ class Callbacks:
 
         :type: def function(event: `PriceEvent`)
         """
+        self.price_batch_fn = None
+        """
+        The optional callback function to be used for handling price events in batches.
+        When set, price events are published to this function as a `PriceBatchEvent`,
+        one per price sync or run of buffered updates, instead of being published to `price_event_fn`.
+
+        :type: def function(batch: `PriceBatchEvent`)
+        """
         self.subscription_event_fn = _noop
         """
         The callback function to be used for handling subscription events.
@@ -36,3 +47,17 @@ class Callbacks:
 
         :type: def function(event: `ProviderEvent`)
         """
+        self.best_price_fn = _noop
+        """
+        The callback function to be used for handling best price events,
+        which are published only when the `BestPriceAggregator` is enabled.
+
+        :type: def function(event: `BestPriceEvent`)
+        """
+        self.depth_event_fn = _noop
+        """
+        The callback function to be used for handling depth events,
+        which are published only when the `DepthBookCache` is enabled.
+
+        :type: def function(event: `DepthEvent`)
+        """
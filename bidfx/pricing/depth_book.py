@@ -0,0 +1,375 @@
+__all__ = ["DepthBookCache", "DepthBook", "BookSide"]
+
+import threading
+from array import array
+from functools import lru_cache
+
+from ._callback_stage import CallbackStage
+from .events import DepthEvent, SubscriptionStatus
+from .subject import Subject
+
+DEFAULT_ROWS = 10
+
+_NAN = float("nan")
+_PRICE = 0
+_SIZE = 1
+_FIRM = 2
+_LEVELS = 3
+
+
+def depth_book_cache_from_config(config_section, callbacks):
+    if not config_section.getboolean("depth_books", False):
+        return None
+    return DepthBookCache(
+        callbacks, rows=config_section.getint("depth_book_rows", DEFAULT_ROWS)
+    )
+
+
+@lru_cache(maxsize=None)
+def _level_fields(capacity):
+    """
+    Maps the indexed field names of each level of a book, such as ``BidSize3``,
+    to the side, column and index they update, so that updates are applied without parsing the names.
+    """
+    fields = {"BidLevels": (False, _LEVELS, None), "AskLevels": (True, _LEVELS, None)}
+    for index in range(capacity):
+        level = index + 1
+        for is_ask, side in ((False, "Bid"), (True, "Ask")):
+            fields[f"{side}{level}"] = (is_ask, _PRICE, index)
+            fields[f"{side}Size{level}"] = (is_ask, _SIZE, index)
+            fields[f"{side}Firm{level}"] = (is_ask, _FIRM, index)
+    return fields
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+def _same(a, b):
+    return a == b or a != a and b != b
+
+
+class BookSide:
+    """
+    One side of a `DepthBook`, held in fixed-capacity columns of the price, size and firm of each level,
+    with the best level at index 0. Empty levels have a NaN price and size and a None firm.
+    The price and size columns are `array.array` of float, which can be wrapped without copying
+    by ``numpy.frombuffer``.
+    """
+
+    __slots__ = ("prices", "sizes", "firms")
+
+    def __init__(self, capacity):
+        """
+        :param capacity: The number of levels the side can hold.
+        :type capacity: int
+        """
+        self.prices = array("d", [_NAN]) * capacity
+        """
+        The price of each level.
+
+        :type: array.array
+        """
+        self.sizes = array("d", [_NAN]) * capacity
+        """
+        The size of each level.
+
+        :type: array.array
+        """
+        self.firms = [None] * capacity
+        """
+        The firm quoting each level.
+
+        :type: list
+        """
+
+    @property
+    def capacity(self):
+        """
+        The number of levels the side can hold.
+
+        :rtype: int
+        """
+        return len(self.prices)
+
+    @property
+    def depth(self):
+        """
+        The number of consecutive levels with a price, from the best.
+
+        :rtype: int
+        """
+        prices = self.prices
+        for index in range(len(prices)):
+            if prices[index] != prices[index]:
+                return index
+        return len(prices)
+
+    def level(self, index):
+        """
+        Gets a level of the side.
+
+        :param index: The index of the level, with 0 being the best.
+        :type index: int
+        :return: The price, size and firm of the level.
+        :rtype: tuple
+        """
+        return self.prices[index], self.sizes[index], self.firms[index]
+
+    def top(self, n=None):
+        """
+        Gets the best levels of the side.
+
+        :param n: The maximum number of levels, or None for all priced levels.
+        :type n: int
+        :return: A list of the price, size and firm of each level, best first.
+        :rtype: list
+        """
+        depth = self.depth if n is None else min(n, self.depth)
+        return [self.level(index) for index in range(depth)]
+
+    def cumulative_size(self, n=None):
+        """
+        Gets the total size available at the best levels of the side.
+
+        :param n: The maximum number of levels, or None for all priced levels.
+        :type n: int
+        :return: The sum of the sizes of the levels, ignoring levels without a size.
+        :rtype: float
+        """
+        depth = self.depth if n is None else min(n, self.depth)
+        sizes = self.sizes
+        return sum(
+            sizes[index] for index in range(depth) if sizes[index] == sizes[index]
+        )
+
+    def _state(self):
+        return list(zip(self.prices, self.sizes, self.firms))
+
+    def _set(self, column, index, value, changed):
+        if column == _FIRM:
+            if self.firms[index] != value:
+                self.firms[index] = value
+                changed.add(index)
+            return
+        values = self.prices if column == _PRICE else self.sizes
+        value = _to_float(value)
+        if not _same(values[index], value):
+            values[index] = value
+            changed.add(index)
+
+    def _clear(self, start, changed):
+        for index in range(start, len(self.prices)):
+            if self.firms[index] is not None or not (
+                _same(self.prices[index], _NAN) and _same(self.sizes[index], _NAN)
+            ):
+                self.prices[index] = _NAN
+                self.sizes[index] = _NAN
+                self.firms[index] = None
+                changed.add(index)
+
+
+class DepthBook:
+    """
+    The Level 2 market depth of a book subject, with the `BookSide` of its bids and of its asks.
+    """
+
+    __slots__ = ("subject", "bids", "asks")
+
+    def __init__(self, subject, capacity):
+        """
+        :param subject: The book subject.
+        :type subject: Subject
+        :param capacity: The number of levels each side can hold.
+        :type capacity: int
+        """
+        self.subject = subject
+        """
+        The `Subject` of the book.
+
+        :type: Subject
+        """
+        self.bids = BookSide(capacity)
+        """
+        The bid levels, highest price first.
+
+        :type: BookSide
+        """
+        self.asks = BookSide(capacity)
+        """
+        The ask levels, lowest price first.
+
+        :type: BookSide
+        """
+
+    def top(self, n=None):
+        """
+        Gets the best levels of both sides of the book.
+
+        :param n: The maximum number of levels of each side, or None for all priced levels.
+        :type n: int
+        :return: A pair of the lists of the bid and ask levels, as given by `BookSide.top`.
+        :rtype: tuple
+        """
+        return self.bids.top(n), self.asks.top(n)
+
+    def _apply(self, price, full, bid_changes, ask_changes):
+        fields = _level_fields(self.bids.capacity)
+        if full:
+            bid_state, ask_state = self.bids._state(), self.asks._state()
+            self.bids._clear(0, set())
+            self.asks._clear(0, set())
+            self._apply_fields(fields, price, set(), set())
+            _diff(bid_state, self.bids._state(), bid_changes)
+            _diff(ask_state, self.asks._state(), ask_changes)
+        else:
+            self._apply_fields(fields, price, bid_changes, ask_changes)
+
+    def _apply_fields(self, fields, price, bid_changes, ask_changes):
+        for name, value in price.items():
+            target = fields.get(name)
+            if target is None:
+                continue
+            is_ask, column, index = target
+            side, changed = (
+                (self.asks, ask_changes) if is_ask else (self.bids, bid_changes)
+            )
+            if column == _LEVELS:
+                try:
+                    side._clear(int(value), changed)
+                except (TypeError, ValueError):
+                    pass
+            else:
+                side._set(column, index, value, changed)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.subject!r}, Bids({self.bids.top()!r}) Asks({self.asks.top()!r}))"
+
+
+def _diff(old, new, changed):
+    for index, (before, after) in enumerate(zip(old, new)):
+        if not all(_same(a, b) for a, b in zip(before, after)):
+            changed.add(index)
+
+
+class DepthBookCache(CallbackStage):
+    """
+    A cache of the Level 2 market depth of each book subject, such as those created with the ``book`` method
+    of the subject builder, reconstructed from the indexed price fields of each level, such as ``Bid1``,
+    ``BidSize1`` and ``BidFirm1``. For example:
+
+    .. code-block:: python
+
+        def on_depth_event(event):
+            for price, size, firm in event.book.bids.top(5):
+                print(price, size, firm)
+            print("size of best 3 asks", event.book.asks.cumulative_size(3))
+
+        pricing.callbacks.depth_event_fn = on_depth_event
+
+    Each book holds fixed-capacity columns per side, sized by the subject's ``Rows``, or ``depth_book_rows``
+    for subjects without it. Price updates are applied in place to the levels they change,
+    without copying the book or parsing the field names, and a `DepthEvent` listing only the levels that changed
+    is published to ``Callbacks.depth_event_fn``. A book is cleared when its subscription status changes,
+    for example when it becomes stale, and is dropped when it is unsubscribed.
+
+    The cache is enabled by setting ``depth_books`` in the ``[DEFAULT]`` section of the configuration.
+    It updates the books from the same threads as the other callbacks, after the dispatcher if there is one,
+    so the books should be read from the callbacks.
+    """
+
+    def __init__(self, callbacks, rows=DEFAULT_ROWS):
+        """
+        :param callbacks: The callback functions to publish events to, including the depth events.
+        :type callbacks: Callbacks
+        :param rows: The capacity of each side of the books of subjects without a ``Rows`` component.
+        :type rows: int
+        """
+        super().__init__(callbacks)
+        self._rows = max(1, rows)
+        self._books = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_book(subject):
+        """
+        Tests whether a subject is a Level 2 book subject.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        :rtype: bool
+        """
+        return subject.get(Subject.LEVEL, None) == "2"
+
+    def book(self, subject):
+        """
+        Gets the depth book of a subject.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        :return: The book, or None if no price has been received for the subject.
+        :rtype: DepthBook
+        """
+        return self._books.get(subject)
+
+    def discard(self, subject):
+        """
+        Drops the depth book of a subject.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        """
+        with self._lock:
+            self._books.pop(subject, None)
+
+    def __len__(self):
+        return len(self._books)
+
+    def __contains__(self, subject):
+        return subject in self._books
+
+    def _before_publish(self, events, batch):
+        # The books are updated before the prices are published, and their depth events after.
+        return [self._apply(event) for event in events]
+
+    def _after_publish(self, events, applied):
+        for depth_event in applied:
+            if depth_event is not None:
+                self._callbacks.depth_event_fn(depth_event)
+
+    def _on_subscription(self, event):
+        book = self._books.get(event.subject)
+        super()._on_subscription(event)
+        if book is not None and event.status is not SubscriptionStatus.OK:
+            bid_changes, ask_changes = set(), set()
+            book.bids._clear(0, bid_changes)
+            book.asks._clear(0, ask_changes)
+            if bid_changes or ask_changes:
+                self._callbacks.depth_event_fn(
+                    DepthEvent(book, sorted(bid_changes), sorted(ask_changes))
+                )
+
+    def _apply(self, event):
+        subject = event.subject
+        book = self._books.get(subject)
+        if book is None:
+            if not self.is_book(subject):
+                return None
+            book = self._create_book(subject)
+        bid_changes, ask_changes = set(), set()
+        book._apply(event.price, event.full, bid_changes, ask_changes)
+        if not bid_changes and not ask_changes:
+            return None
+        return DepthEvent(book, sorted(bid_changes), sorted(ask_changes))
+
+    def _create_book(self, subject):
+        try:
+            capacity = int(subject.get(Subject.ROWS, self._rows))
+        except ValueError:
+            capacity = self._rows
+        with self._lock:
+            book = self._books[subject] = DepthBook(subject, max(1, capacity))
+        return book
@@ -0,0 +1,384 @@
+__all__ = ["CallbackDispatcher"]
+
+import logging
+import threading
+from collections import deque
+
+from .callbacks import Callbacks
+from .events import PriceBatchEvent, PriceEvent
+from ..exceptions import PricingError
+
+log = logging.getLogger("bidfx.pricing.dispatcher")
+
+BLOCK = "block"
+"""When the queue is full the pricing thread waits for the callbacks to catch up. This is the default."""
+
+DROP_OLDEST = "drop_oldest"
+"""When the queue is full the oldest queued event is dropped to make room."""
+
+CONFLATE = "conflate"
+"""When the queue is full a price update is merged into the queued price event of the same subject."""
+
+OVERFLOW_POLICIES = (BLOCK, DROP_OLDEST, CONFLATE)
+
+DEFAULT_QUEUE_SIZE = 10000
+
+
+def dispatcher_from_config(config_section, callbacks: Callbacks):
+    threads = config_section.getint("dispatch_threads", 0)
+    if threads <= 0:
+        return None
+    return CallbackDispatcher(
+        callbacks,
+        threads=threads,
+        queue_size=config_section.getint("dispatch_queue_size", DEFAULT_QUEUE_SIZE),
+        overflow=config_section.get("dispatch_overflow", BLOCK).lower(),
+        conflate=config_section.getboolean("dispatch_conflate", False),
+    )
+
+
+def merge_price_events(pending: PriceEvent, update: PriceEvent):
+    if update.full:
+        return update
+    price = dict(pending.price)
+    price.update(update.price)
+    return PriceEvent(update.subject, price, pending.full)
+
+
+class _DispatchQueue:
+    """
+    A bounded queue of events waiting to be published, drained by a single worker thread.
+    Each entry is a list of the publishing function, the event and the event's subject.
+    The latest queued price event of each subject is indexed so that updates can be merged into it.
+    """
+
+    def __init__(self, max_size, overflow, conflate=False):
+        self._max_size = max_size
+        self._overflow = overflow
+        self._conflate = conflate
+        self._entries = deque()
+        self._queued_prices = {}
+        self._condition = threading.Condition()
+        self.running = False
+        self.dropped = 0
+        self.conflated = 0
+        self.dispatched = 0
+
+    def put(self, publish, event, subject=None, mergeable=False):
+        with self._condition:
+            entries = self._entries
+            full = len(entries) >= self._max_size
+            if mergeable and (self._conflate or full and self._overflow == CONFLATE):
+                entry = self._queued_prices.get(subject)
+                if entry is not None:
+                    entry[1] = merge_price_events(entry[1], event)
+                    self.conflated += 1
+                    return
+            if full:
+                if self._overflow != DROP_OLDEST:
+                    while len(entries) >= self._max_size and self.running:
+                        self._condition.wait()
+                # A queue that is not running has no worker to wait for, so it drops the oldest event too.
+                if len(entries) >= self._max_size:
+                    self._forget(entries.popleft())
+                    self.dropped += 1
+            entry = [publish, event, subject]
+            entries.append(entry)
+            if mergeable:
+                self._queued_prices[subject] = entry
+            elif subject is not None:
+                # Later prices must not be merged into those queued before this event.
+                self._queued_prices.pop(subject, None)
+            self._condition.notify_all()
+
+    def take(self):
+        # Returns None once the queue has been stopped and drained.
+        with self._condition:
+            while not self._entries and self.running:
+                self._condition.wait()
+            if not self._entries:
+                return None
+            entry = self._entries.popleft()
+            self._forget(entry)
+            self._condition.notify_all()
+            return entry
+
+    def take_all(self):
+        # Takes every queued entry as one drain cycle. Returns None once stopped and drained.
+        with self._condition:
+            while not self._entries and self.running:
+                self._condition.wait()
+            if not self._entries:
+                return None
+            entries = list(self._entries)
+            self._entries.clear()
+            self._queued_prices.clear()
+            self._condition.notify_all()
+            return entries
+
+    def _forget(self, entry):
+        subject = entry[2]
+        if subject is not None and self._queued_prices.get(subject) is entry:
+            del self._queued_prices[subject]
+
+    def set_running(self, running):
+        with self._condition:
+            self.running = running
+            self._condition.notify_all()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CallbackDispatcher:
+    """
+    A dispatcher that decouples the pricing threads from the application's callback functions.
+    Events are put onto bounded queues that are drained by worker threads, which call the `Callbacks`.
+    A slow callback therefore no longer delays the reading of prices, heartbeats and acknowledgements.
+    The events of each subject are always published in order by the same worker thread.
+
+    The dispatcher is enabled by setting ``dispatch_threads`` in the ``[DEFAULT]`` section of the configuration.
+    What happens when a queue is full is set by ``dispatch_overflow``, which is one of:
+
+    - ``block`` - the pricing thread waits for the callbacks to catch up. This is the default.
+    - ``drop_oldest`` - the oldest queued event is dropped.
+    - ``conflate`` - a price update is merged into the queued event of its subject, if there is one,
+      otherwise the pricing thread waits.
+
+    While the dispatcher is not started, or once it is stopped, there are no workers to wait for,
+    so a full queue drops its oldest event whatever the policy.
+
+    Setting ``dispatch_conflate`` enables conflating delivery for consumers that need only the latest state
+    of each subject. Price updates are then always merged into the queued event of their subject,
+    and each worker publishes everything queued in one drain cycle,
+    so that at most one merged event per subject is published per cycle.
+    Partial updates merged into a full price image give a full image.
+    When a batch callback is set, the price events of each cycle are published together in a `PriceBatchEvent`
+    that reports the server's latest conflation latency.
+    """
+
+    def __init__(
+        self,
+        callbacks: Callbacks,
+        threads=1,
+        queue_size=DEFAULT_QUEUE_SIZE,
+        overflow=BLOCK,
+        conflate=False,
+    ):
+        """
+        :param callbacks: The callback functions to publish events to.
+        :type callbacks: Callbacks
+        :param threads: The number of worker threads, each with its own queue.
+        :type threads: int
+        :param queue_size: The maximum number of events held by each queue.
+        :type queue_size: int
+        :param overflow: The overflow policy, one of 'block', 'drop_oldest' or 'conflate'.
+        :type overflow: str
+        :param conflate: Whether to always merge the queued price updates of each subject.
+        :type conflate: bool
+        :raises PricingError: if the overflow policy is not supported.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise PricingError(
+                f"unsupported dispatch_overflow setting '{overflow}', expected one of {OVERFLOW_POLICIES}"
+            )
+        self._callbacks = callbacks
+        self._conflate = conflate
+        self._conflation_latency = None
+        self._queues = [
+            _DispatchQueue(max(1, queue_size), overflow, conflate)
+            for _ in range(max(1, threads))
+        ]
+        self._workers = []
+
+    def start(self):
+        """
+        Starts the worker threads.
+        """
+        if self._workers:
+            return
+        work = self._work_conflating if self._conflate else self._work
+        for i, queue in enumerate(self._queues):
+            queue.set_running(True)
+            worker = threading.Thread(
+                target=work, args=(queue,), name=f"dispatch-{i + 1}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self):
+        """
+        Stops the worker threads once they have published the events already queued.
+        """
+        for queue in self._queues:
+            queue.set_running(False)
+        self._workers = []
+
+    @property
+    def queue_depth(self):
+        """
+        The number of events waiting to be published.
+
+        :rtype: int
+        """
+        return sum(len(queue) for queue in self._queues)
+
+    @property
+    def dispatched_count(self):
+        """
+        The number of events published to the callbacks.
+
+        :rtype: int
+        """
+        return sum(queue.dispatched for queue in self._queues)
+
+    @property
+    def dropped_count(self):
+        """
+        The number of events dropped by the ``drop_oldest`` overflow policy.
+
+        :rtype: int
+        """
+        return sum(queue.dropped for queue in self._queues)
+
+    @property
+    def conflated_count(self):
+        """
+        The number of price events merged into queued events, by conflating delivery or the ``conflate`` overflow policy.
+
+        :rtype: int
+        """
+        return sum(queue.conflated for queue in self._queues)
+
+    @property
+    def conflation_latency(self):
+        """
+        The latest latency in milliseconds reported by the Pixie server for its own conflation of price updates,
+        which it does to publish no more often than the configured ``min_interval``.
+        None until a batch of prices has been received from a Pixie server while conflating delivery.
+
+        :rtype: int
+        """
+        return self._conflation_latency
+
+    @property
+    def price_event_fn(self):
+        return self._dispatch_price
+
+    @property
+    def price_batch_fn(self):
+        # Conflating delivery takes batches apart so that their events can be merged.
+        if self._conflate or self._callbacks.price_batch_fn:
+            return self._dispatch_batch
+        return None
+
+    @property
+    def subscription_event_fn(self):
+        return self._dispatch_subscription
+
+    @property
+    def provider_event_fn(self):
+        return self._dispatch_provider
+
+    def _queue_for(self, subject):
+        return self._queues[hash(subject) % len(self._queues)]
+
+    def _dispatch_price(self, event):
+        self._queue_for(event.subject).put(
+            self._publish_price, event, event.subject, mergeable=True
+        )
+
+    def _dispatch_batch(self, batch):
+        if self._conflate:
+            if batch.conflation_latency is not None:
+                self._conflation_latency = batch.conflation_latency
+            for event in batch.events:
+                self._dispatch_price(event)
+            return
+        if len(self._queues) == 1:
+            self._queues[0].put(self._publish_batch, batch)
+            return
+        # Batches are split by queue so that the events of each subject stay with one worker.
+        split = {}
+        for event in batch.events:
+            split.setdefault(self._queue_for(event.subject), []).append(event)
+        for queue, events in split.items():
+            queue.put(
+                self._publish_batch,
+                PriceBatchEvent(
+                    events,
+                    batch.edition,
+                    batch.revision,
+                    batch.revision_time,
+                    batch.conflation_latency,
+                ),
+            )
+
+    def _dispatch_subscription(self, event):
+        self._queue_for(event.subject).put(
+            self._publish_subscription, event, event.subject
+        )
+
+    def _dispatch_provider(self, event):
+        self._queues[0].put(self._publish_provider, event)
+
+    def _publish_price(self, event):
+        self._callbacks.price_event_fn(event)
+
+    def _publish_batch(self, batch):
+        if self._callbacks.price_batch_fn:
+            self._callbacks.price_batch_fn(batch)
+        else:
+            for event in batch.events:
+                self._callbacks.price_event_fn(event)
+
+    def _publish_subscription(self, event):
+        self._callbacks.subscription_event_fn(event)
+
+    def _publish_provider(self, event):
+        self._callbacks.provider_event_fn(event)
+
+    @staticmethod
+    def _work(queue):
+        while True:
+            entry = queue.take()
+            if entry is None:
+                return
+            _publish(entry[0], entry[1])
+            queue.dispatched += 1
+
+    def _work_conflating(self, queue):
+        while True:
+            entries = queue.take_all()
+            if entries is None:
+                return
+            # Runs of price events are published together, between the other events in the order queued.
+            prices = []
+            for publish, event, _subject in entries:
+                if publish == self._publish_price:
+                    prices.append(event)
+                    continue
+                if prices:
+                    self._publish_conflated(prices)
+                    prices = []
+                _publish(publish, event)
+            if prices:
+                self._publish_conflated(prices)
+            queue.dispatched += len(entries)
+
+    def _publish_conflated(self, events):
+        if self._callbacks.price_batch_fn:
+            _publish(
+                self._publish_batch,
+                PriceBatchEvent(events, conflation_latency=self._conflation_latency),
+            )
+        else:
+            for event in events:
+                _publish(self._publish_price, event)
+
+
+def _publish(publish, event):
+    try:
+        publish(event)
+    except Exception:
+        log.exception(f"callback failed on event: {event}")
@@ -1,5 +1,8 @@
 __all__ = [
     "PriceEvent",
+    "PriceBatchEvent",
+    "BestPriceEvent",
+    "DepthEvent",
     "SubscriptionEvent",
     "ProviderEvent",
     "SubscriptionStatus",
@@ -57,6 +60,8 @@ class PriceEvent:
         self.price = price
         """
         The map of updated price field. 
+        Values are strings unless the provider is configured with the ``price_values`` setting
+        to publish numeric values as int and float, or decimal values as `ScaledValue`.
 
         :type: dict
         """
@@ -76,6 +81,275 @@ class PriceEvent:
         return f"{self.__class__.__name__} {self.subject} is {self.price} {update}"
 
 
+class PriceBatchEvent:
+    """
+    This class defines a Price Batch Event that gets published with all of the price events received together,
+    when a batch callback function is set via `PricingAPI.callbacks`.
+    For the Pixie protocol a batch holds the price updates decoded from one price sync message.
+    For the Puffin protocol a batch holds the run of consecutive price updates read before more data
+    had to be received from the socket.
+    The callback function could be implemented and used as follows.
+
+    .. code-block:: python
+
+        def on_price_batch(batch):
+            with lock:
+                for event in batch.events:
+                    prices[event.subject] = event.price
+
+        def main():
+            session = Session.create_from_ini_file()
+            session.pricing.callbacks.price_batch_fn = on_price_batch
+    """
+
+    __slots__ = ("events", "edition", "revision", "revision_time", "conflation_latency")
+
+    def __init__(
+        self,
+        events,
+        edition=None,
+        revision=None,
+        revision_time=None,
+        conflation_latency=None,
+    ):
+        """
+        :param events: The price events of the batch in the order received.
+        :type events: list
+        :param edition: The subscription edition of the price sync, or None.
+        :type edition: int
+        :param revision: The revision number of the price sync, or None.
+        :type revision: int
+        :param revision_time: The time of the price sync revision in epoch milliseconds, or None.
+        :type revision_time: int
+        :param conflation_latency: The server's price conflation latency in milliseconds, or None.
+        :type conflation_latency: int
+        """
+
+        self.events = events
+        """
+        The list of `PriceEvent` in the order received.
+
+        :type: list
+        """
+        self.edition = edition
+        """
+        The subscription edition of the Pixie price sync. None for Puffin batches.
+
+        :type: int
+        """
+        self.revision = revision
+        """
+        The revision number of the Pixie price sync. None for Puffin batches.
+
+        :type: int
+        """
+        self.revision_time = revision_time
+        """
+        The time of the Pixie price sync revision in epoch milliseconds. None for Puffin batches.
+
+        :type: int
+        """
+        self.conflation_latency = conflation_latency
+        """
+        The latency in milliseconds added by the Pixie server conflating price updates,
+        which it does to publish no more often than the configured ``min_interval``. None for Puffin batches.
+
+        :type: int
+        """
+
+    def __len__(self):
+        return len(self.events)
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.events!r}, Edition({self.edition!r}) "
+            f"Revision({self.revision!r}) RevisionTime({self.revision_time!r}) "
+            f"ConflationLatency({self.conflation_latency!r}))"
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__name__} of {len(self.events)} edition:{self.edition} "
+            f"revision:{self.revision} revision time:{self.revision_time}"
+        )
+
+
+class BestPriceEvent:
+    """
+    This class defines a Best Price Event that gets published by the `BestPriceAggregator`
+    whenever the best bid or offer across the liquidity providers quoting the same instrument changes.
+    Best price events should be handled by setting a callback function via `PricingAPI.callbacks`.
+    The callback function could be implemented and used as follows.
+
+    .. code-block:: python
+
+        def on_best_price(event):
+            symbol, quantity, tenor, deal_type = event.key
+            print(f"{symbol} {quantity} {event.bid} ({event.bid_provider}) / {event.ask} ({event.ask_provider})")
+
+        def main():
+            session = Session.create_from_ini_file()
+            session.pricing.callbacks.best_price_fn = on_best_price
+    """
+
+    __slots__ = (
+        "key",
+        "bid",
+        "bid_size",
+        "bid_provider",
+        "ask",
+        "ask_size",
+        "ask_provider",
+    )
+
+    def __init__(self, key, bid, bid_size, bid_provider, ask, ask_size, ask_provider):
+        """
+        :param key: The instrument key of Symbol, Quantity, Tenor and DealType.
+        :type key: tuple
+        :param bid: The best bid price, or None if no provider is bidding.
+        :type bid: float
+        :param bid_size: The size of the best bid, or None if not quoted.
+        :type bid_size: float
+        :param bid_provider: The liquidity provider of the best bid, or None.
+        :type bid_provider: str
+        :param ask: The best ask price, or None if no provider is offering.
+        :type ask: float
+        :param ask_size: The size of the best ask, or None if not quoted.
+        :type ask_size: float
+        :param ask_provider: The liquidity provider of the best ask, or None.
+        :type ask_provider: str
+        """
+
+        self.key = key
+        """
+        The instrument key of the subject components Symbol, Quantity, Tenor and DealType,
+        with None for any component missing from the subjects.
+
+        :type: tuple
+        """
+        self.bid = bid
+        """
+        The best (highest) bid price across the liquidity providers, or None if no provider is bidding.
+
+        :type: float
+        """
+        self.bid_size = bid_size
+        """
+        The size quoted with the best bid, or None if not quoted.
+
+        :type: float
+        """
+        self.bid_provider = bid_provider
+        """
+        The liquidity provider quoting the best bid, or None if no provider is bidding.
+        Of providers bidding the same price, the first to quote it is best.
+
+        :type: str
+        """
+        self.ask = ask
+        """
+        The best (lowest) ask price across the liquidity providers, or None if no provider is offering.
+
+        :type: float
+        """
+        self.ask_size = ask_size
+        """
+        The size quoted with the best ask, or None if not quoted.
+
+        :type: float
+        """
+        self.ask_provider = ask_provider
+        """
+        The liquidity provider quoting the best ask, or None if no provider is offering.
+        Of providers offering the same price, the first to quote it is best.
+
+        :type: str
+        """
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.key!r}, Bid({self.bid!r} {self.bid_size!r} {self.bid_provider!r}) "
+            f"Ask({self.ask!r} {self.ask_size!r} {self.ask_provider!r}))"
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__name__} {'/'.join(str(part) for part in self.key)} "
+            f"is {self.bid} {self.bid_provider} / {self.ask} {self.ask_provider}"
+        )
+
+
+class DepthEvent:
+    """
+    This class defines a Depth Event that gets published by the `DepthBookCache`
+    whenever a price update changes the levels of a Level 2 book subject.
+    Depth events should be handled by setting a callback function via `PricingAPI.callbacks`.
+    The callback function could be implemented and used as follows.
+
+    .. code-block:: python
+
+        def on_depth_event(event):
+            for index in event.bid_changes:
+                print(f"bid level {index + 1} of {event.subject} is {event.book.bids.level(index)}")
+
+        def main():
+            session = Session.create_from_ini_file()
+            session.pricing.callbacks.depth_event_fn = on_depth_event
+    """
+
+    __slots__ = ("book", "bid_changes", "ask_changes")
+
+    def __init__(self, book, bid_changes, ask_changes):
+        """
+        :param book: The updated depth book.
+        :type book: DepthBook
+        :param bid_changes: The indices of the bid levels that changed.
+        :type bid_changes: list
+        :param ask_changes: The indices of the ask levels that changed.
+        :type ask_changes: list
+        """
+
+        self.book = book
+        """
+        The `DepthBook`, which is updated in place by later price updates.
+
+        :type: DepthBook
+        """
+        self.bid_changes = bid_changes
+        """
+        The indices of the bid levels that changed, in ascending order, with 0 being the best level.
+
+        :type: list
+        """
+        self.ask_changes = ask_changes
+        """
+        The indices of the ask levels that changed, in ascending order, with 0 being the best level.
+
+        :type: list
+        """
+
+    @property
+    def subject(self):
+        """
+        The `Subject` of the book.
+
+        :type: Subject
+        """
+        return self.book.subject
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.book.subject!r}, Bids({self.bid_changes!r}) Asks({self.ask_changes!r}))"
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__name__} {self.book.subject} changed bid levels {self.bid_changes} "
+            f"and ask levels {self.ask_changes}"
+        )
+
+
 @unique
 class SubscriptionStatus(Enum):
     """
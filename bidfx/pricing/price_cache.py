@@ -0,0 +1,105 @@
+__all__ = ["PriceCache"]
+
+import threading
+from types import MappingProxyType
+
+from ._callback_stage import CallbackStage
+from .events import SubscriptionStatus
+
+
+def price_cache_from_config(config_section, callbacks):
+    if not config_section.getboolean("price_cache", False):
+        return None
+    return PriceCache(callbacks)
+
+
+class PriceCache(CallbackStage):
+    """
+    A cache of the current price image of each subscribed subject, maintained by the pricing threads
+    as they read price updates, before the updates are published to the callbacks.
+    Partial price updates are merged into the cached image, so there is no need for applications
+    to merge them themselves. For example:
+
+    .. code-block:: python
+
+        price = pricing.snapshot(subject)
+        if price:
+            print(price.get(Field.BID), price.get(Field.ASK))
+
+    Each update replaces a subject's cached image with a new one rather than modifying it,
+    so a snapshot can be read at any time without locking and is never changed afterwards.
+    The updates of a `PriceBatchEvent` are applied together,
+    so `snapshot_all` never sees part of a batch.
+    A subject's image is dropped when its subscription status changes, for example when it becomes stale,
+    and when it is unsubscribed.
+
+    The cache is enabled by setting ``price_cache`` in the ``[DEFAULT]`` section of the configuration.
+    It holds only the fields selected by `PricingAPI.select_fields`.
+    """
+
+    def __init__(self, callbacks):
+        """
+        :param callbacks: The callback functions to publish events to once they have been cached.
+        :type callbacks: Callbacks
+        """
+        super().__init__(callbacks)
+        self._images = {}
+        self._lock = threading.Lock()
+
+    def snapshot(self, subject):
+        """
+        Gets the current price image of a subject.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        :return: A read-only map of price fields, or None if there is no current price.
+        :rtype: types.MappingProxyType
+        """
+        image = self._images.get(subject)
+        return None if image is None else MappingProxyType(image)
+
+    def snapshot_all(self):
+        """
+        Gets the current price images of all subjects, consistently as of the same price update.
+
+        :return: A map of each `Subject` with a current price to its read-only map of price fields.
+        :rtype: dict
+        """
+        with self._lock:
+            images = dict(self._images)
+        return {subject: MappingProxyType(image) for subject, image in images.items()}
+
+    def discard(self, subject):
+        """
+        Drops the price image of a subject.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        """
+        with self._lock:
+            self._images.pop(subject, None)
+
+    def __len__(self):
+        return len(self._images)
+
+    def __contains__(self, subject):
+        return subject in self._images
+
+    def _before_publish(self, events, batch):
+        with self._lock:
+            for event in events:
+                self._apply(event)
+
+    def _apply(self, event):
+        if event.full:
+            image = dict(event.price)
+        else:
+            image = self._images.get(event.subject)
+            image = dict(image) if image else {}
+            image.update(event.price)
+        self._images[event.subject] = image
+
+    def _on_subscription(self, event):
+        if event.status is not SubscriptionStatus.OK:
+            self.discard(event.subject)
+        super()._on_subscription(event)
@@ -4,8 +4,16 @@ import logging
 
 from ._pixie.pixie_provider import PixieProvider
 from ._puffin.puffin_provider import PuffinProvider
+from ._field_selection import FieldSelection
 from ._subject_builder import SubjectBuilder
+from ._callback_stage import CallbackStage
 from .callbacks import Callbacks
+from .best_price import BestPriceAggregator, best_price_from_config
+from .depth_book import DepthBookCache, depth_book_cache_from_config
+from .dispatcher import CallbackDispatcher, dispatcher_from_config
+from .price_cache import PriceCache, price_cache_from_config
+from .quote_table import QuoteTable, quote_table_from_config
+from .tick_history import TickHistory, tick_history_from_config
 from .provider import PriceProvider
 from .subject import Subject
 from ..exceptions import PricingError
@@ -42,6 +50,12 @@ class DisabledProvider(PriceProvider):
     def unsubscribe(self, subject):
         pass
 
+    def refresh(self, subject):
+        pass
+
+    def toggle(self, subject):
+        pass
+
 
 class PricingAPI(PriceProvider):
     """
@@ -58,6 +72,31 @@ class PricingAPI(PriceProvider):
         """
         config_section = config_parser["Exclusive Pricing"]
         self._callbacks = Callbacks()
+        default_section = config_parser[config_parser.default_section]
+        # Each enabled stage publishes to the one before it, ending with the API user's callbacks.
+        # The stages listed before the dispatcher are called from its worker threads, those after it from the pricing threads.
+        self._stages = []
+        callbacks = self._callbacks
+        for stage_from_config in (
+            depth_book_cache_from_config,
+            best_price_from_config,
+            dispatcher_from_config,
+            quote_table_from_config,
+            tick_history_from_config,
+            price_cache_from_config,
+        ):
+            stage = stage_from_config(default_section, callbacks)
+            if stage is not None:
+                self._stages.append(stage)
+                callbacks = stage
+        self._provider_callbacks = callbacks
+        self._depth_books = self._stage_of_type(DepthBookCache)
+        self._best_prices = self._stage_of_type(BestPriceAggregator)
+        self._dispatcher = self._stage_of_type(CallbackDispatcher)
+        self._quote_table = self._stage_of_type(QuoteTable)
+        self._tick_history = self._stage_of_type(TickHistory)
+        self._price_cache = self._stage_of_type(PriceCache)
+        self._field_selection = FieldSelection()
         self._subject_builder = SubjectBuilder(
             config_section["username"], config_section["default_account"]
         )
@@ -68,6 +107,18 @@ class PricingAPI(PriceProvider):
             config_parser, "Shared Pricing", PUFFIN_PROTOCOL
         )
 
+    def _stage_of_type(self, stage_type):
+        for stage in self._stages:
+            if isinstance(stage, stage_type):
+                return stage
+        return None
+
+    def _discard_from_stages(self, subjects):
+        for stage in self._stages:
+            if isinstance(stage, CallbackStage):
+                for subject in subjects:
+                    stage.discard(subject)
+
     def _create_provider(self, config_parser, section, protocol):
         config_section = config_parser[section]
         if config_section.getboolean("disable", False):
@@ -76,22 +127,30 @@ class PricingAPI(PriceProvider):
             )
             return DisabledProvider()
         return PricingAPI.create_price_provider(
-            config_section, self.callbacks, protocol
+            config_section,
+            self._provider_callbacks,
+            protocol,
+            self._field_selection,
         )
 
     def start(self):
+        if self._dispatcher:
+            self._dispatcher.start()
         self._pixie_provider.start()
         self._puffin_provider.start()
 
     def stop(self):
         self._pixie_provider.stop()
         self._puffin_provider.stop()
+        if self._dispatcher:
+            self._dispatcher.stop()
 
     def subscribe(self, subject):
         if self._is_exclusive_subject(subject):
             self._pixie_provider.subscribe(subject)
         else:
             self._puffin_provider.subscribe(subject)
+        self._add_quote_table_rows((subject,))
         log.debug("successfully subscribed to: " + str(subject))
 
     def unsubscribe(self, subject):
@@ -99,8 +158,140 @@ class PricingAPI(PriceProvider):
             self._pixie_provider.unsubscribe(subject)
         else:
             self._puffin_provider.unsubscribe(subject)
+        self._discard_from_stages((subject,))
         log.info("unsubscribe from: " + str(subject))
 
+    def subscribe_many(self, subjects):
+        """
+        Subscribes to real-time price publications on many `Subject` at once.
+        The subjects are routed to the exclusive and shared pricing providers in a single pass,
+        and each provider registers its subjects with one update and sends them to the server together.
+        This is much faster than calling `subscribe` for each subject when starting up with many subscriptions.
+
+        :param subjects: The price subjects to subscribe to.
+        :type subjects: list
+        """
+        exclusive, shared = self._partition_subjects(subjects)
+        if exclusive:
+            self._pixie_provider.subscribe_many(exclusive)
+            self._add_quote_table_rows(exclusive)
+        if shared:
+            self._puffin_provider.subscribe_many(shared)
+            self._add_quote_table_rows(shared)
+        log.debug(f"successfully subscribed to {len(exclusive) + len(shared)} subjects")
+
+    def unsubscribe_many(self, subjects):
+        """
+        Un-subscribes from many previously subscribed price `Subject` at once.
+
+        :param subjects: The price subjects to unsubscribe from.
+        :type subjects: list
+        """
+        exclusive, shared = self._partition_subjects(subjects)
+        if exclusive:
+            self._pixie_provider.unsubscribe_many(exclusive)
+        if shared:
+            self._puffin_provider.unsubscribe_many(shared)
+        self._discard_from_stages(exclusive + shared)
+        log.info(f"unsubscribe from {len(exclusive) + len(shared)} subjects")
+
+    def _add_quote_table_rows(self, subjects):
+        # Rows are only added once the provider has accepted the subjects, so rejected ones have none.
+        if self._quote_table is not None:
+            for subject in subjects:
+                self._quote_table.add(subject)
+
+    def _partition_subjects(self, subjects):
+        exclusive = []
+        shared = []
+        for subject in subjects:
+            if self._is_exclusive_subject(subject):
+                exclusive.append(subject)
+            else:
+                shared.append(subject)
+        return exclusive, shared
+
+    def refresh(self, subject):
+        """
+        Requests a full refresh of the price image of a subscribed exclusive pricing `Subject`.
+        The refresh is sent to the server without starting a new subscription edition.
+
+        :param subject: The price subject to refresh.
+        :type subject: Subject
+        :raises PricingError: if the subject is not an exclusive pricing subject.
+        """
+        self._exclusive_provider(subject, "refresh").refresh(subject)
+
+    def toggle(self, subject):
+        """
+        Toggles a subscribed exclusive pricing `Subject` off and back on again at the liquidity provider,
+        so as to request a new stream or quote.
+        The toggle is sent to the server without starting a new subscription edition.
+
+        :param subject: The price subject to toggle.
+        :type subject: Subject
+        :raises PricingError: if the subject is not an exclusive pricing subject.
+        """
+        self._exclusive_provider(subject, "toggle").toggle(subject)
+
+    def _exclusive_provider(self, subject, operation):
+        if not self._is_exclusive_subject(subject):
+            raise PricingError(
+                f"{operation} is only supported for exclusive pricing subjects: {subject}"
+            )
+        return self._pixie_provider
+
+    def select_fields(self, fields, subject=None):
+        """
+        Restricts the price fields published in each `PriceEvent` to an allow-list of field names.
+        Fields not selected are skipped over while reading price updates, without their values being decoded,
+        which reduces both the CPU cost of each update and the size of each event's price map.
+        A selection made for a specific subject takes precedence over the global selection.
+        For example:
+
+        .. code-block:: python
+
+            # Only publish the top-of-book fields for all subjects
+            pricing.select_fields([Field.BID, Field.ASK, Field.BID_SIZE, Field.ASK_SIZE, Field.ORIGIN_TIME])
+
+        :param fields: The names of the price fields to publish, or None to publish all fields.
+        :type fields: list
+        :param subject: The subject to apply the selection to, or None to apply it globally.
+        :type subject: Subject
+        """
+        self._field_selection.select(fields, subject)
+
+    def snapshot(self, subject):
+        """
+        Gets the current price image of a subscribed `Subject` from the price cache,
+        with all of the partial price updates received merged into it.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        :return: A read-only map of price fields, or None if there is no current price.
+        :rtype: types.MappingProxyType
+        :raises PricingError: if the price cache is not enabled.
+        """
+        return self._enabled_price_cache().snapshot(subject)
+
+    def snapshot_all(self):
+        """
+        Gets the current price images of all subscribed subjects from the price cache,
+        consistently as of the same price update.
+
+        :return: A map of each `Subject` with a current price to its read-only map of price fields.
+        :rtype: dict
+        :raises PricingError: if the price cache is not enabled.
+        """
+        return self._enabled_price_cache().snapshot_all()
+
+    def _enabled_price_cache(self):
+        if self._price_cache is None:
+            raise PricingError(
+                "the price cache is not enabled, set price_cache = true in the DEFAULT config section"
+            )
+        return self._price_cache
+
     @property
     def build(self):
         """
@@ -131,12 +322,75 @@ class PricingAPI(PriceProvider):
         """
         return self._callbacks
 
+    @property
+    def dispatcher(self):
+        """
+        Accessor for the dispatcher that publishes events to the callbacks from its own worker threads.
+        The dispatcher provides the queue depth and the counts of the events published, dropped and conflated.
+
+        :return: The `CallbackDispatcher`, or None if the callbacks are called directly by the pricing threads.
+        :rtype: CallbackDispatcher
+        """
+        return self._dispatcher
+
+    @property
+    def price_cache(self):
+        """
+        Accessor for the cache of the current price image of each subscribed subject.
+
+        :return: The `PriceCache`, or None if the price cache is not enabled.
+        :rtype: PriceCache
+        """
+        return self._price_cache
+
+    @property
+    def quote_table(self):
+        """
+        Accessor for the columnar table of the latest values of selected price fields for every subscribed subject.
+
+        :return: The `QuoteTable`, or None if the quote table is not enabled.
+        :rtype: QuoteTable
+        """
+        return self._quote_table
+
+    @property
+    def tick_history(self):
+        """
+        Accessor for the fixed-memory history of the last ticks of each subject.
+
+        :return: The `TickHistory`, or None if the tick history is not enabled.
+        :rtype: TickHistory
+        """
+        return self._tick_history
+
+    @property
+    def best_prices(self):
+        """
+        Accessor for the aggregator of the best bid and offer across the liquidity providers quoting each instrument.
+
+        :return: The `BestPriceAggregator`, or None if best price aggregation is not enabled.
+        :rtype: BestPriceAggregator
+        """
+        return self._best_prices
+
+    @property
+    def depth_books(self):
+        """
+        Accessor for the cache of the Level 2 market depth of each book subject.
+
+        :return: The `DepthBookCache`, or None if depth books are not enabled.
+        :rtype: DepthBookCache
+        """
+        return self._depth_books
+
     @staticmethod
     def _is_exclusive_subject(subject):
         return Subject.USER in subject and subject[Subject.ASSET_CLASS] == "Fx"
 
     @staticmethod
-    def create_price_provider(config_section, callbacks, protocol):
+    def create_price_provider(
+        config_section, callbacks, protocol, field_selection=None
+    ):
         """
         Creates a price provider for a given protocol. Allowed values are 'Pixie' or 'Puffin'.
         Most applications will not use this method directly as the `PricingAPI` will create
@@ -148,12 +402,13 @@ class PricingAPI(PriceProvider):
         :type callbacks: Callbacks
         :param protocol: The protocol implementation for the provider. Defaults to 'Pixie'.
         :type protocol: str
+        :param field_selection: The price fields selected for publication. Defaults to all fields.
         :return: A new price provider instance.
         :rtype: PriceProvider
         :raises PricingError: if the protocol is not supported.
         """
         if protocol == PIXIE_PROTOCOL:
-            return PixieProvider(config_section, callbacks)
+            return PixieProvider(config_section, callbacks, field_selection)
         if protocol == PUFFIN_PROTOCOL:
-            return PuffinProvider(config_section, callbacks)
+            return PuffinProvider(config_section, callbacks, field_selection)
         raise PricingError(f"unsupported pricing protocol: {protocol}")
@@ -43,3 +43,25 @@ class PriceProvider(abc.ABC):
         :type subject: Subject
         """
         pass
+
+    def subscribe_many(self, subjects):
+        """
+        Subscribes to real-time price publications on many `Subject` at once.
+        Providers override this to apply the whole batch in one update.
+
+        :param subjects: The price subjects to subscribe to.
+        :type subjects: list
+        """
+        for subject in subjects:
+            self.subscribe(subject)
+
+    def unsubscribe_many(self, subjects):
+        """
+        Un-subscribes from many previously subscribed price `Subject` at once.
+        Providers override this to apply the whole batch in one update.
+
+        :param subjects: The price subjects to unsubscribe from.
+        :type subjects: list
+        """
+        for subject in subjects:
+            self.unsubscribe(subject)
@@ -0,0 +1,260 @@
+__all__ = ["QuoteTable"]
+
+import logging
+import threading
+
+from ._callback_stage import CallbackStage
+from .events import SubscriptionStatus
+from ..exceptions import PricingError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+log = logging.getLogger("bidfx.pricing.quote_table")
+
+DEFAULT_CAPACITY = 1024
+
+
+def quote_table_from_config(config_section, callbacks):
+    fields = _field_list(config_section.get("quote_table_fields", ""))
+    int_fields = _field_list(config_section.get("quote_table_int_fields", ""))
+    if not fields and not int_fields:
+        return None
+    return QuoteTable(
+        callbacks,
+        fields,
+        int_fields,
+        capacity=config_section.getint("quote_table_capacity", DEFAULT_CAPACITY),
+    )
+
+
+def _field_list(setting):
+    return [field.strip() for field in setting.split(",") if field.strip()]
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return int(float(value))
+
+
+class QuoteTable(CallbackStage):
+    """
+    A columnar table of the latest values of selected price fields for every subscribed subject,
+    held in preallocated NumPy arrays for bulk analytics, such as computing all mid prices at once:
+
+    .. code-block:: python
+
+        table = pricing.quote_table
+        mids = (table.column(Field.BID) + table.column(Field.ASK)) / 2
+        for subject, mid in zip(table.subjects(), mids):
+            ...
+
+    Each subscribed `Subject` is assigned a row, whose index is recycled when the subject is unsubscribed.
+    Each configured field has a float64 column, or an int64 column for integer fields such as times.
+    The table copies the values of each decoded price update into the columns on the pricing threads,
+    before the events are published to the callbacks.
+    Values not yet received, values that are not numeric, and the values of a subject whose subscription status changes,
+    are NaN in float columns and zero in integer columns. Rows that are not assigned to a subject are cleared in the same way.
+
+    `column` gives zero-copy views of the live columns, which are updated in place and may be read
+    part way through a batch of updates. `copy` gives a consistent copy of the whole table.
+    The columns are reallocated with double the capacity when more subjects are subscribed than they can hold,
+    after which previously taken views are no longer updated.
+
+    The table requires NumPy. It is enabled by setting ``quote_table_fields`` and/or ``quote_table_int_fields``
+    in the ``[DEFAULT]`` section of the configuration.
+    """
+
+    def __init__(self, callbacks, fields, int_fields=(), capacity=DEFAULT_CAPACITY):
+        """
+        :param callbacks: The callback functions to publish events to once they have been tabled.
+        :type callbacks: Callbacks
+        :param fields: The names of the price fields with float64 columns.
+        :type fields: list
+        :param int_fields: The names of the price fields with int64 columns.
+        :type int_fields: list
+        :param capacity: The number of rows initially allocated.
+        :type capacity: int
+        :raises PricingError: if NumPy is not installed.
+        """
+        if numpy is None:
+            raise PricingError(
+                "the quote table requires NumPy, which can be installed with: pip install numpy"
+            )
+        super().__init__(callbacks)
+        self._dtypes = dict.fromkeys(fields, numpy.float64)
+        self._dtypes.update(dict.fromkeys(int_fields, numpy.int64))
+        self._converters = [
+            (field, float if dtype is numpy.float64 else _to_int)
+            for field, dtype in self._dtypes.items()
+        ]
+        self._lock = threading.Lock()
+        self._rows = {}
+        self._subjects = []
+        self._free_rows = []
+        self._columns = {}
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity):
+        columns = {}
+        for field, dtype in self._dtypes.items():
+            column = numpy.full(
+                capacity, numpy.nan if dtype is numpy.float64 else 0, dtype
+            )
+            previous = self._columns.get(field)
+            if previous is not None:
+                column[: len(previous)] = previous
+            columns[field] = column
+        self._columns = columns
+        self._capacity = capacity
+
+    @property
+    def fields(self):
+        """
+        The names of the price fields in the table.
+
+        :rtype: list
+        """
+        return list(self._dtypes)
+
+    def add(self, subject):
+        """
+        Assigns a row to a subject, reusing the row of an unsubscribed subject if there is one.
+        Adding a subject that already has a row does nothing.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        :return: The row index of the subject.
+        :rtype: int
+        """
+        with self._lock:
+            row = self._rows.get(subject)
+            if row is None:
+                if self._free_rows:
+                    row = self._free_rows.pop()
+                    self._subjects[row] = subject
+                else:
+                    row = len(self._subjects)
+                    if row == self._capacity:
+                        self._allocate(self._capacity * 2)
+                    self._subjects.append(subject)
+                self._rows[subject] = row
+            return row
+
+    def remove(self, subject):
+        """
+        Clears and frees the row of a subject for reuse.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        """
+        with self._lock:
+            row = self._rows.pop(subject, None)
+            if row is not None:
+                self._clear_row(row)
+                self._subjects[row] = None
+                self._free_rows.append(row)
+
+    def discard(self, subject):
+        """
+        Clears and frees the row of a subject for reuse, the same as `remove`.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        """
+        self.remove(subject)
+
+    def row(self, subject):
+        """
+        Gets the row index of a subject.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        :return: The row index, or None if the subject has no row.
+        :rtype: int
+        """
+        return self._rows.get(subject)
+
+    def subjects(self):
+        """
+        Gets the subject of each row, in row order.
+
+        :return: A list with the `Subject` of each row, or None for a free row.
+        :rtype: list
+        """
+        return list(self._subjects)
+
+    def column(self, field):
+        """
+        Gets a zero-copy view of the live column of a price field, with one entry per row.
+
+        :param field: The name of the price field.
+        :type field: str
+        :return: A view of the column.
+        :rtype: numpy.ndarray
+        :raises KeyError: if the field is not in the table.
+        """
+        return self._columns[field][: len(self._subjects)]
+
+    def copy(self, fields=None):
+        """
+        Takes a consistent copy of the table, as of the same price update.
+
+        :param fields: The names of the price fields to copy, or None to copy all fields.
+        :type fields: list
+        :return: A pair of the list of the subject of each row, and a map of each field to a copy of its column.
+        :rtype: tuple
+        """
+        with self._lock:
+            rows = len(self._subjects)
+            subjects = list(self._subjects)
+            columns = {
+                field: self._columns[field][:rows].copy()
+                for field in (self._dtypes if fields is None else fields)
+            }
+        return subjects, columns
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, subject):
+        return subject in self._rows
+
+    def _before_publish(self, events, batch):
+        with self._lock:
+            for event in events:
+                self._apply(event)
+
+    def _apply(self, event):
+        row = self._rows.get(event.subject)
+        if row is None:
+            return
+        if event.full:
+            self._clear_row(row)
+        price = event.price
+        columns = self._columns
+        for field, convert in self._converters:
+            value = price.get(field)
+            if value is not None:
+                column = columns[field]
+                try:
+                    column[row] = convert(value)
+                except (TypeError, ValueError):
+                    log.debug(f"{event.subject} has a non-numeric {field}: {value!r}")
+                    column[row] = numpy.nan if column.dtype == numpy.float64 else 0
+
+    def _clear_row(self, row):
+        for field, column in self._columns.items():
+            column[row] = numpy.nan if column.dtype == numpy.float64 else 0
+
+    def _on_subscription(self, event):
+        if event.status is not SubscriptionStatus.OK:
+            with self._lock:
+                row = self._rows.get(event.subject)
+                if row is not None:
+                    self._clear_row(row)
+        super()._on_subscription(event)
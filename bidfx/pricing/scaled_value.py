@@ -0,0 +1,58 @@
+__all__ = ["ScaledValue"]
+
+
+class ScaledValue:
+    """
+    A decimal price value held exactly as an integer number of units together with a decimal scale,
+    such that the value represented is ``value * 10 ** -scale``.
+    Scaled values are published in price events when a provider is configured with ``price_values = scaled``.
+    They avoid the rounding error of binary floating point and are cheap to compare and accumulate.
+
+    >>> price = ScaledValue(1234560, 6)
+    >>> float(price)
+    1.23456
+    """
+
+    __slots__ = ("value", "scale")
+
+    def __init__(self, value, scale):
+        """
+        :param value: The unscaled integer value.
+        :type value: int
+        :param scale: The number of decimal places the value is scaled by.
+        :type scale: int
+        """
+        self.value = value
+        """
+        The unscaled integer value.
+
+        :type: int
+        """
+        self.scale = scale
+        """
+        The number of decimal places by which the unscaled value is scaled.
+
+        :type: int
+        """
+
+    def __float__(self):
+        """Converts the value to the nearest floating point number."""
+        return self.value / 10 ** self.scale
+
+    def __eq__(self, other):
+        if isinstance(other, ScaledValue):
+            return self.value == other.value and self.scale == other.scale
+        return False
+
+    def __hash__(self):
+        return hash((self.value, self.scale))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.value!r}, {self.scale!r})"
+
+    def __str__(self):
+        if self.scale == 0:
+            return str(self.value)
+        sign = "-" if self.value < 0 else ""
+        whole, fraction = divmod(abs(self.value), 10 ** self.scale)
+        return f"{sign}{whole}.{fraction:0{self.scale}d}"
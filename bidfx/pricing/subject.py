@@ -1,6 +1,8 @@
 __all__ = ["Subject"]
 
 import itertools
+import threading
+import weakref
 
 
 class Subject:
@@ -17,6 +19,8 @@ class Subject:
     * ``AssetClass=Fx,Exchange=OTC,Level=1,Source=Indi,Symbol=USDJPY``
 
     Subject are safe to compare for equality and to use as the keys of a dictionary.
+    Subjects are interned, so creating a subject with the same components as an existing subject
+    returns the existing instance rather than a new one, and equal subjects are usually identical.
     Subjects can be converted to string using ``str(subject)`` for display purposes.
     Instances of the subject class can be used much like a `dict` to pull out the individual component parts.
     For example:
@@ -27,12 +31,45 @@ class Subject:
     A number of common subject component keys are provided as constants of the Subject class for this purpose.
     """
 
-    def __init__(self, components):
+    __slots__ = ("_components", "_positions", "_str", "_hash", "__weakref__")
+
+    # Maps each distinct tuple of component keys to the position of each key, shared by all subjects with those keys.
+    _positions_by_keys = {}
+
+    # The canonical subject for each tuple of components. Held weakly so that unused subjects can be collected.
+    _interned = weakref.WeakValueDictionary()
+    _intern_lock = threading.Lock()
+
+    def __new__(cls, components):
         """
         :param components: A tuple of subject components, key-value pairs as tuples.
         :type components: tuple
         """
-        self._components = components
+        components = tuple(components)
+        subject = Subject._interned.get(components)
+        if subject is None:
+            subject = object.__new__(cls)
+            subject._components = components
+            subject._positions = Subject._key_positions(components)
+            subject._str = None
+            subject._hash = None
+            with Subject._intern_lock:
+                subject = Subject._interned.setdefault(components, subject)
+        return subject
+
+    def __reduce__(self):
+        # Unpickled and copied subjects are interned like any other.
+        return Subject, (self._components,)
+
+    @staticmethod
+    def _key_positions(components):
+        keys = tuple(c[0] for c in components)
+        positions = Subject._positions_by_keys.get(keys)
+        if positions is None:
+            # Reversed so that the first of any repeated keys takes precedence.
+            positions = {key: i for i, key in reversed(list(enumerate(keys)))}
+            positions = Subject._positions_by_keys.setdefault(keys, positions)
+        return positions
 
     def flatten(self):
         """
@@ -83,17 +120,15 @@ class Subject:
         :return: A the value of the component mapped from the *key*, or the *default* value.
         :rtype: str
         """
-        return self._find(key, (None, default))[1]
+        position = self._positions.get(key)
+        return default if position is None else self._components[position][1]
 
     def __getitem__(self, key):
-        return self._find(key, (None, None))[1]
-
-    def _find(self, key, default):
-        return next((c for c in self._components if c[0] == key), default)
+        return self.get(key, None)
 
     def __contains__(self, key):
         """Checks if this Subject contains a component with the given key."""
-        return self._find(key, None) is not None
+        return key in self._positions
 
     def __len__(self):
         """Gets the length of the Subject in terms of components."""
@@ -105,17 +140,26 @@ class Subject:
 
     def __str__(self):
         """Gets a string representation of the Subject."""
-        return ",".join(map(lambda c: "=".join(c), self._components))
+        if self._str is None:
+            self._str = ",".join(map(lambda c: "=".join(c), self._components))
+        return self._str
 
     def __eq__(self, other):
         """Tests the subject for equality with another Subject."""
+        if self is other:
+            return True
         if isinstance(other, Subject):
-            return self._components == other._components
+            return (
+                self.__hash__() == other.__hash__()
+                and self._components == other._components
+            )
         return False
 
     def __hash__(self):
         """Provides a hash code of the Subject."""
-        return hash(self._components)
+        if self._hash is None:
+            self._hash = hash(self._components)
+        return self._hash
 
     ASSET_CLASS = "AssetClass"
     BUY_SIDE_ACCOUNT = "BuySideAccount"
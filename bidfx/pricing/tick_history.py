@@ -0,0 +1,271 @@
+__all__ = ["TickHistory"]
+
+import logging
+import threading
+import time
+from array import array
+
+from ._callback_stage import CallbackStage
+
+log = logging.getLogger("bidfx.pricing.history")
+
+DEFAULT_SIZE = 1000
+DEFAULT_MAX_MB = 128
+
+_NAN = float("nan")
+
+
+def tick_history_from_config(config_section, callbacks):
+    fields = [
+        field.strip()
+        for field in config_section.get("tick_history_fields", "").split(",")
+        if field.strip()
+    ]
+    if not fields:
+        return None
+    return TickHistory(
+        callbacks,
+        fields,
+        size=config_section.getint("tick_history_size", DEFAULT_SIZE),
+        max_bytes=config_section.getint("tick_history_max_mb", DEFAULT_MAX_MB) << 20,
+    )
+
+
+class _Ring:
+    """
+    The preallocated columns of one subject's ticks, written circularly.
+    """
+
+    __slots__ = ("columns", "times", "revisions", "revision_times", "head", "count")
+
+    def __init__(self, fields, size):
+        self.columns = {field: array("d", [_NAN]) * size for field in fields}
+        self.times = array("d", [0.0]) * size
+        self.revisions = array("q", [0]) * size
+        self.revision_times = array("q", [0]) * size
+        self.head = 0
+        self.count = 0
+
+
+class TickHistory(CallbackStage):
+    """
+    A fixed-memory history of the last ticks of each subject, held in preallocated ring buffers.
+    Each tick records the values of the configured numeric price fields, the time it was received and,
+    for the Pixie protocol, the revision and revision time of its price sync.
+    A tick records the full state of its subject, so the fields missing from a partial update
+    keep their previous values. Values not yet received are NaN.
+    The pricing threads record ticks as they are read, before the events are published to the callbacks.
+
+    Window queries return columns in time order as `array.array`, which support the buffer protocol,
+    so they can be wrapped without copying by ``numpy.frombuffer`` for vectorised analysis. For example:
+
+    .. code-block:: python
+
+        window = pricing.tick_history.since(subject, time.time() - 5)
+        bids = numpy.frombuffer(window[Field.BID])
+
+    The buffers of a subject are allocated by its first tick. The total memory is capped by ``max_bytes``,
+    beyond which the ticks of further subjects are not recorded until others are unsubscribed.
+
+    The history is enabled by setting ``tick_history_fields`` in the ``[DEFAULT]`` section of the configuration.
+    """
+
+    RECEIVE_TIME = "ReceiveTime"
+    """The column of the times that ticks were received, in epoch seconds."""
+
+    REVISION = "Revision"
+    """The column of the Pixie price sync revisions. Zero for Puffin."""
+
+    REVISION_TIME = "RevisionTime"
+    """The column of the Pixie price sync revision times, in epoch milliseconds. Zero for Puffin."""
+
+    def __init__(
+        self, callbacks, fields, size=DEFAULT_SIZE, max_bytes=DEFAULT_MAX_MB << 20
+    ):
+        """
+        :param callbacks: The callback functions to publish events to once they have been recorded.
+        :type callbacks: Callbacks
+        :param fields: The names of the numeric price fields to record.
+        :type fields: list
+        :param size: The number of ticks kept for each subject.
+        :type size: int
+        :param max_bytes: The maximum memory used by the buffers of all subjects.
+        :type max_bytes: int
+        """
+        super().__init__(callbacks)
+        self._fields = list(fields)
+        self._size = max(1, size)
+        self._ring_bytes = self._size * 8 * (len(self._fields) + 3)
+        self._max_rings = max_bytes // self._ring_bytes
+        self._rings = {}
+        self._lock = threading.Lock()
+        self._capped = False
+
+    @property
+    def fields(self):
+        """
+        The names of the price fields recorded.
+
+        :rtype: list
+        """
+        return list(self._fields)
+
+    @property
+    def memory_used(self):
+        """
+        The number of bytes allocated to ring buffers.
+
+        :rtype: int
+        """
+        return len(self._rings) * self._ring_bytes
+
+    def subjects(self):
+        """
+        Gets the subjects with recorded ticks.
+
+        :rtype: list
+        """
+        return list(self._rings)
+
+    def count(self, subject):
+        """
+        Gets the number of ticks recorded for a subject, up to the size of its buffer.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        :rtype: int
+        """
+        ring = self._rings.get(subject)
+        return ring.count if ring else 0
+
+    def last(self, subject, n=None, fields=None):
+        """
+        Gets the last ticks of a subject.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        :param n: The number of ticks, or None for all recorded ticks.
+        :type n: int
+        :param fields: The names of the columns to get, or None for all columns.
+        :type fields: list
+        :return: A map of each column name to an `array.array` of its values, oldest first.
+        :rtype: dict
+        """
+        with self._lock:
+            ring = self._rings.get(subject)
+            if ring is None:
+                return self._window(_Ring(self._fields, 0), 0, fields)
+            return self._window(ring, ring.count if n is None else n, fields)
+
+    def since(self, subject, timestamp, fields=None):
+        """
+        Gets the ticks of a subject received at or after a time.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        :param timestamp: The time in epoch seconds.
+        :type timestamp: float
+        :param fields: The names of the columns to get, or None for all columns.
+        :type fields: list
+        :return: A map of each column name to an `array.array` of its values, oldest first.
+        :rtype: dict
+        """
+        with self._lock:
+            ring = self._rings.get(subject)
+            if ring is None:
+                return self._window(_Ring(self._fields, 0), 0, fields)
+            # Binary search for the oldest tick at or after the timestamp.
+            times = ring.times
+            size = len(times)
+            oldest = ring.head - ring.count
+            low, high = 0, ring.count
+            while low < high:
+                middle = (low + high) // 2
+                if times[(oldest + middle) % size] < timestamp:
+                    low = middle + 1
+                else:
+                    high = middle
+            return self._window(ring, ring.count - low, fields)
+
+    def discard(self, subject):
+        """
+        Frees the buffers of a subject.
+
+        :param subject: The price subject.
+        :type subject: Subject
+        """
+        with self._lock:
+            if self._rings.pop(subject, None) is not None:
+                self._capped = False
+
+    def __len__(self):
+        return len(self._rings)
+
+    def __contains__(self, subject):
+        return subject in self._rings
+
+    def _window(self, ring, n, fields):
+        n = max(0, min(n, ring.count))
+        columns = {
+            TickHistory.RECEIVE_TIME: ring.times,
+            TickHistory.REVISION: ring.revisions,
+            TickHistory.REVISION_TIME: ring.revision_times,
+        }
+        columns.update(ring.columns)
+        names = list(columns) if fields is None else fields
+        size = len(ring.times)
+        start = (ring.head - n) % size if size else 0
+        end = start + n
+        if end <= size:
+            return {name: columns[name][start:end] for name in names}
+        end -= size
+        return {name: columns[name][start:] + columns[name][:end] for name in names}
+
+    def _before_publish(self, events, batch):
+        received = time.time()
+        revision = revision_time = 0
+        if batch is not None:
+            # Only batches carry the Pixie revisions.
+            revision = batch.revision or 0
+            revision_time = batch.revision_time or 0
+        with self._lock:
+            for event in events:
+                self._record(event, received, revision, revision_time)
+
+    def _record(self, event, received, revision, revision_time):
+        ring = self._rings.get(event.subject)
+        if ring is None:
+            ring = self._allocate(event.subject)
+            if ring is None:
+                return
+        size = self._size
+        head = ring.head
+        previous = (head - 1) % size
+        price = event.price
+        for field, column in ring.columns.items():
+            value = price.get(field)
+            if value is None:
+                column[head] = _NAN if event.full else column[previous]
+            else:
+                try:
+                    column[head] = float(value)
+                except (TypeError, ValueError):
+                    column[head] = _NAN
+        ring.times[head] = received
+        ring.revisions[head] = revision
+        ring.revision_times[head] = revision_time
+        ring.head = (head + 1) % size
+        if ring.count < size:
+            ring.count += 1
+
+    def _allocate(self, subject):
+        if len(self._rings) >= self._max_rings:
+            if not self._capped:
+                self._capped = True
+                log.warning(
+                    f"tick history memory cap reached with {len(self._rings)} subjects, "
+                    f"ticks of further subjects are not recorded"
+                )
+            return None
+        ring = self._rings[subject] = _Ring(self._fields, self._size)
+        return ring
@@ -1,9 +1,10 @@
-__all__ = ["Session"]
+__all__ = ["Session", "AsyncSession"]
 
 from configparser import ConfigParser
 from pathlib import Path
 
 from ._bidfx_api import BIDFX_API_INFO
+from .pricing.async_pricing import AsyncPricingAPI
 from .pricing.pricing import PricingAPI
 
 
@@ -20,8 +21,8 @@ class Session:
         """
         self._pricing = PricingAPI(config_parser)
 
-    @staticmethod
-    def create_from_ini_file(config_file="~/.bidfx/api/config.ini"):
+    @classmethod
+    def create_from_ini_file(cls, config_file="~/.bidfx/api/config.ini"):
         """
         Creates a new Session using configuration data parsed from an INI file.
         The default behaviour is to search for the file ``.bidfx/api/config.ini`` in the user's home directory.
@@ -34,7 +35,7 @@ class Session:
         path = Path(config_file).expanduser()
         if not config.read(path):
             raise FileNotFoundError(f"could not find config in {path}")
-        return Session(config)
+        return cls(config)
 
     @property
     def pricing(self):
@@ -54,3 +55,27 @@ class Session:
         :rtype: str
         """
         return BIDFX_API_INFO.version
+
+
+class AsyncSession(Session):
+    """
+    An AsyncSession is the top-level API class for applications that use asyncio.
+    It gives access to an `AsyncPricingAPI` that delivers pricing events on the event loop.
+    """
+
+    def __init__(self, config_parser):
+        """
+        :param config_parser: The API configuration settings.
+        :type config_parser: configparser.ConfigParser
+        """
+        self._pricing = AsyncPricingAPI(config_parser)
+
+    @property
+    def pricing(self):
+        """
+        Gets the asyncio Pricing API session used for subscribing to realtime prices.
+
+        :return: A configured interface to the `AsyncPricingAPI`.
+        :rtype: AsyncPricingAPI
+        """
+        return self._pricing
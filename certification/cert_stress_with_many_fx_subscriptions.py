@@ -164,10 +164,11 @@ def main():
         "XCDSDG",
     }
 
+    subjects = []
     for lp in PROVIDERS:
         for ccy_pair in CCY_PAIRS:
             ccy = ccy_pair[:3]
-            session.pricing.subscribe(
+            subjects.append(
                 session.pricing.build.fx.quote.spot.liquidity_provider(lp)
                 .currency_pair(ccy_pair)
                 .currency(ccy)
@@ -177,7 +178,7 @@ def main():
 
         for ccy_pair in CCY_PAIRS:
             ccy = ccy_pair[:3]
-            session.pricing.subscribe(
+            subjects.append(
                 session.pricing.build.fx.quote.ndf.liquidity_provider(lp)
                 .currency_pair(ccy_pair)
                 .currency(ccy)
@@ -189,7 +190,7 @@ def main():
     for lp in PROVIDERS:
         for ccy_pair in CCY_PAIRS:
             ccy = ccy_pair[:3]
-            session.pricing.subscribe(
+            subjects.append(
                 session.pricing.build.fx.stream.spot.liquidity_provider(lp)
                 .currency_pair(ccy_pair)
                 .currency(ccy)
@@ -197,7 +198,7 @@ def main():
                 .create_subject()
             )
 
-            session.pricing.subscribe(
+            subjects.append(
                 session.pricing.build.fx.quote.ndf.liquidity_provider(lp)
                 .currency_pair(ccy_pair)
                 .currency(ccy)
@@ -206,6 +207,8 @@ def main():
                 .create_subject()
             )
 
+    session.pricing.subscribe_many(subjects)
+
 
 if __name__ == "__main__":
     main()
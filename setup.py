@@ -25,6 +25,7 @@ setuptools.setup(
     download_url="https://github.com/bidfx/bidfx-api-py/tarball/v" + version,
     packages=setuptools.find_packages(),
     install_requires=requirements,
+    extras_require={"numpy": ["numpy"]},
     license="Apache License 2.0",
     classifiers=[
         "Programming Language :: Python :: 3.6",
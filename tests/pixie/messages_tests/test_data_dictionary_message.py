@@ -2,6 +2,7 @@ import unittest
 
 from bidfx.pricing._pixie.message.data_dictionary_message import DataDictionaryMessage
 from bidfx.pricing._pixie.message.pixie_message_type import PixieMessageType
+from bidfx.pricing._pixie.util.buffer_reader import BufferReader
 from bidfx.pricing._pixie.util.buffer_reads import (
     read_double_fixed8,
     read_long_fixed8,
@@ -94,7 +95,9 @@ class TestDataDictionaryMessage(unittest.TestCase):
         ]
 
     def test_first_data_dictionary_message(self):
-        data_dictionary_bytes = bytearray.fromhex(self.data_dictionary_message1_bytes)
+        data_dictionary_bytes = BufferReader(
+            bytes.fromhex(self.data_dictionary_message1_bytes)
+        )
         self.assertEqual(
             read_byte(data_dictionary_bytes), PixieMessageType.DataDictionaryMessage
         )
@@ -107,7 +110,9 @@ class TestDataDictionaryMessage(unittest.TestCase):
         self.assertEqual(data_dict.is_compressed, False)
 
     def test_second_welcome_message(self):
-        data_dictionary_bytes = bytearray.fromhex(self.data_dictionary_message2_bytes)
+        data_dictionary_bytes = BufferReader(
+            bytes.fromhex(self.data_dictionary_message2_bytes)
+        )
         self.assertEqual(
             read_byte(data_dictionary_bytes), PixieMessageType.DataDictionaryMessage
         )
@@ -119,7 +124,7 @@ class TestDataDictionaryMessage(unittest.TestCase):
         header = bytearray(b"D\x03\t")  # Update + compressed
         body = bytes_message[3:]
         compressed_body = self.compressor.compress(body)
-        compressed_data_dict_message = header + compressed_body
+        compressed_data_dict_message = BufferReader(header + compressed_body)
         self.assertEqual(
             read_byte(compressed_data_dict_message),
             PixieMessageType.DataDictionaryMessage,
@@ -2,6 +2,7 @@ import unittest
 
 from bidfx.pricing._pixie.message.heartbeat_message import HeartbeatMessage
 from bidfx.pricing._pixie.message.pixie_message_type import PixieMessageType
+from bidfx.pricing._pixie.util.buffer_reader import BufferReader
 from bidfx.pricing._pixie.util.buffer_reads import read_byte
 
 
@@ -10,11 +11,11 @@ class TestHeartbeatMessage(unittest.TestCase):
         self.heartbeat_message = "48"
 
     def test_heartbeat_message(self):
-        heartbeat_message_bytes = bytearray.fromhex(self.heartbeat_message)
+        heartbeat_message_bytes = BufferReader(bytes.fromhex(self.heartbeat_message))
         self.assertEqual(
             read_byte(heartbeat_message_bytes), PixieMessageType.HeartbeatMessage
         )
-        self.assertEqual(heartbeat_message_bytes, b"")
+        self.assertEqual(heartbeat_message_bytes.remaining(), 0)
 
     def test_heartbeat_encode(self):
         heartbeat_message = HeartbeatMessage()
@@ -1,10 +1,20 @@
 import unittest
 
+from bidfx import PricingError
+
+from bidfx.pricing._field_selection import FieldSelection
+from bidfx.pricing._pixie.data_dictionary import DataDictionary
 from bidfx.pricing._pixie.message.field_def_message import FieldDefMessage
 from bidfx.pricing._pixie.message.pixie_message_type import PixieMessageType
 from bidfx.pricing._pixie.message.price_sync_message import PriceSyncMessage
-from bidfx.pricing._pixie.util.buffer_reads import read_long_fixed8, read_byte
+from bidfx.pricing._pixie.util.buffer_reader import BufferReader
+from bidfx.pricing._pixie.util.buffer_reads import (
+    read_double_fixed8,
+    read_long_fixed8,
+    read_byte,
+)
 from bidfx.pricing._pixie.util.compression import Compressor, Decompressor
+from bidfx.pricing.callbacks import Callbacks
 
 
 class TestPriceSyncMessage(unittest.TestCase):
@@ -19,11 +29,21 @@ class TestPriceSyncMessage(unittest.TestCase):
             2: FieldDefMessage(2, read_long_fixed8, None, 0, "HopLatency1"),
             3: FieldDefMessage(3, read_long_fixed8, None, 0, "HopLatency2"),
         }
+        self.PRICE_DATA_DICT = DataDictionary(
+            [
+                FieldDefMessage(0, read_double_fixed8, None, 0, "Bid"),
+                FieldDefMessage(1, read_long_fixed8, None, 0, "BidSize"),
+                FieldDefMessage(2, read_double_fixed8, None, 0, "Ask"),
+                FieldDefMessage(3, read_long_fixed8, None, 0, "AskSize"),
+            ]
+        )
         self.compressor = Compressor()
         self.decompressor = Decompressor()
 
     def test_compressed_message(self):
-        price_sync_message_bytes = bytearray.fromhex(self.price_sync_compressed)
+        price_sync_message_bytes = BufferReader(
+            bytes.fromhex(self.price_sync_compressed)
+        )
         self.assertEqual(
             read_byte(price_sync_message_bytes), PixieMessageType.PriceSyncMessage
         )
@@ -37,7 +57,9 @@ class TestPriceSyncMessage(unittest.TestCase):
         self.assertEqual(price_sync.size, 3)
 
     def test_not_compressed_message(self):
-        price_sync_message_bytes = bytearray.fromhex(self.price_sync_not_compressed)
+        price_sync_message_bytes = BufferReader(
+            bytes.fromhex(self.price_sync_not_compressed)
+        )
         self.assertEqual(
             read_byte(price_sync_message_bytes), PixieMessageType.PriceSyncMessage
         )
@@ -51,9 +73,88 @@ class TestPriceSyncMessage(unittest.TestCase):
         self.assertEqual(price_sync.size, 3)
 
     def test_status_from_price_sync(self):
-        price_sync_message_bytes = bytearray.fromhex(self.price_sync_with_status)
+        price_sync_message_bytes = BufferReader(
+            bytes.fromhex(self.price_sync_with_status)
+        )
         self.assertEqual(
             read_byte(price_sync_message_bytes), PixieMessageType.PriceSyncMessage
         )
         price_sync = PriceSyncMessage(price_sync_message_bytes, self.decompressor)
         self.assertEqual(price_sync.is_compressed, True)
+
+    def test_visit_updates_of_not_compressed_message(self):
+        price_sync_message_bytes = BufferReader(
+            bytes.fromhex(self.price_sync_not_compressed)
+        )
+        read_byte(price_sync_message_bytes)
+        price_sync = PriceSyncMessage(price_sync_message_bytes, self.decompressor)
+        events = []
+        callbacks = Callbacks()
+        callbacks.price_event_fn = events.append
+        price_sync.visit_updates(["A", "B", "C"], self.PRICE_DATA_DICT, callbacks)
+
+        self.assertEqual(["A", "B", "C"], [e.subject for e in events])
+        self.assertTrue(all(e.full for e in events))
+        self.assertEqual(
+            {"Bid": 1.5, "BidSize": "3000", "Ask": 1.542, "AskSize": "3000"},
+            events[0].price,
+        )
+        self.assertEqual(
+            {"Bid": 2.167, "BidSize": "4500", "Ask": 2.185, "AskSize": "4500"},
+            events[2].price,
+        )
+        self.assertEqual(0, price_sync_message_bytes.remaining())
+
+    def test_visit_updates_rejects_subjects_beyond_the_edition(self):
+        price_sync_message_bytes = BufferReader(
+            bytes.fromhex(self.price_sync_not_compressed)
+        )
+        read_byte(price_sync_message_bytes)
+        price_sync = PriceSyncMessage(price_sync_message_bytes, self.decompressor)
+        with self.assertRaises(PricingError):
+            price_sync.visit_updates(
+                ["A", "B", "C"], self.PRICE_DATA_DICT, Callbacks(), subject_count=2
+            )
+
+    def test_visit_updates_of_selected_fields(self):
+        price_sync_message_bytes = BufferReader(
+            bytes.fromhex(self.price_sync_not_compressed)
+        )
+        read_byte(price_sync_message_bytes)
+        price_sync = PriceSyncMessage(price_sync_message_bytes, self.decompressor)
+        events = []
+        callbacks = Callbacks()
+        callbacks.price_event_fn = events.append
+        field_selection = FieldSelection()
+        field_selection.select(["Bid", "Ask"])
+        field_selection.select(["AskSize"], "B")
+        price_sync.visit_updates(
+            ["A", "B", "C"], self.PRICE_DATA_DICT, callbacks, field_selection
+        )
+
+        self.assertEqual({"Bid": 1.5, "Ask": 1.542}, events[0].price)
+        self.assertEqual({"AskSize": "2000"}, events[1].price)
+        self.assertEqual({"Bid": 2.167, "Ask": 2.185}, events[2].price)
+        self.assertEqual(0, price_sync_message_bytes.remaining())
+
+    def test_visit_updates_as_a_batch(self):
+        price_sync_message_bytes = BufferReader(
+            bytes.fromhex(self.price_sync_not_compressed)
+        )
+        read_byte(price_sync_message_bytes)
+        price_sync = PriceSyncMessage(price_sync_message_bytes, self.decompressor)
+        events = []
+        batches = []
+        callbacks = Callbacks()
+        callbacks.price_event_fn = events.append
+        callbacks.price_batch_fn = batches.append
+        price_sync.visit_updates(["A", "B", "C"], self.PRICE_DATA_DICT, callbacks)
+
+        self.assertEqual([], events)
+        self.assertEqual(1, len(batches))
+        batch = batches[0]
+        self.assertEqual(["A", "B", "C"], [e.subject for e in batch.events])
+        self.assertEqual(4, batch.edition)
+        self.assertEqual(7, batch.revision)
+        self.assertEqual(1542372218934, batch.revision_time)
+        self.assertEqual(47, batch.conflation_latency)
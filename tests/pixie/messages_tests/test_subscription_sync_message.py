@@ -5,8 +5,9 @@ from bidfx.pricing._pixie.message.pixie_message_type import PixieMessageType
 from bidfx.pricing._pixie.message.subscription_sync_message import (
     SubscriptionSyncMessage,
 )
+from bidfx.pricing._pixie.util.buffer_reader import BufferReader
 from bidfx.pricing._pixie.util.buffer_reads import read_byte
-from bidfx.pricing._pixie.util.compression import Decompressor
+from bidfx.pricing._pixie.util.compression import Compressor, Decompressor
 from bidfx.pricing._pixie.util.varint import decode_varint
 from bidfx.pricing.subject import Subject
 
@@ -28,13 +29,13 @@ class TestSubscriptionSyncMessage(unittest.TestCase):
             is_compressed=False,
             is_controls=False,
         )
-        encoded_message = subj_mess.to_bytes()
+        encoded_message = BufferReader(subj_mess.to_bytes())
         self.assertEqual(decode_varint(encoded_message), 68)
         self.assertEqual(
             bytearray(
                 b"S\000\173\002\004\011Quantity\0102500000\007Symbol\007EURGBP\004\011Quantity\0105600000\007Symbol\007USDJPY"
             ),
-            encoded_message,
+            encoded_message.read_remaining(),
         )
 
     def test_subscription_sync_encode_not_compressed_with_control_block(self):
@@ -47,13 +48,13 @@ class TestSubscriptionSyncMessage(unittest.TestCase):
             sids=control_block,
         )
 
-        encoded_message = subj_mess.to_bytes()
+        encoded_message = BufferReader(subj_mess.to_bytes())
         self.assertEqual(decode_varint(encoded_message), 73)
         self.assertEqual(
             bytearray(
                 b"S\002\173\002\004\011Quantity\0102500000\007Symbol\007EURGBP\004\011Quantity\0105600000\007Symbol\007USDJPY\002\000R\001T"
             ),
-            encoded_message,
+            encoded_message.read_remaining(),
         )
 
     def test_subscription_sync_compressed_encode_without_control_block(self):
@@ -61,8 +62,8 @@ class TestSubscriptionSyncMessage(unittest.TestCase):
             self.price_sync_edition_sequence_number, self.subjects, is_compressed=True
         )
 
-        encoded_message = subj_mess.to_bytes()
-        self.assertEqual(decode_varint(encoded_message), 59)
+        encoded_message = BufferReader(subj_mess.to_bytes())
+        self.assertEqual(decode_varint(encoded_message), 52)
         self.assertEqual(
             read_byte(encoded_message), PixieMessageType.SubscriptionSyncMessage
         )
@@ -71,7 +72,7 @@ class TestSubscriptionSyncMessage(unittest.TestCase):
             decode_varint(encoded_message), self.price_sync_edition_sequence_number
         )
         self.assertEqual(decode_varint(encoded_message), len(self.subjects))
-        decompressed = self.decompressor.decompress(encoded_message)
+        decompressed = self.decompressor.decompress(encoded_message.read_remaining())
         self.assertEqual(
             bytearray(
                 b"\004\011Quantity\0102500000\007Symbol\007EURGBP\004\011Quantity\0105600000\007Symbol\007USDJPY"
@@ -89,8 +90,8 @@ class TestSubscriptionSyncMessage(unittest.TestCase):
             sids=control_block,
         )
 
-        encoded_message = subj_mess.to_bytes()
-        self.assertEqual(decode_varint(encoded_message), 70)
+        encoded_message = BufferReader(subj_mess.to_bytes())
+        self.assertEqual(decode_varint(encoded_message), 63)
         self.assertEqual(
             read_byte(encoded_message), PixieMessageType.SubscriptionSyncMessage
         )
@@ -99,10 +100,48 @@ class TestSubscriptionSyncMessage(unittest.TestCase):
             decode_varint(encoded_message), self.price_sync_edition_sequence_number
         )
         self.assertEqual(decode_varint(encoded_message), len(self.subjects))
-        decompressed = self.decompressor.decompress(encoded_message)
+        decompressed = self.decompressor.decompress(encoded_message.read_remaining())
         self.assertEqual(
             bytearray(
                 b"\004\011Quantity\0102500000\007Symbol\007EURGBP\004\011Quantity\0105600000\007Symbol\007USDJPY\002\000R\001T"
             ),
             decompressed,
         )
+
+    def test_session_compressor_is_shared_across_messages(self):
+        compressor = Compressor()
+        messages = [
+            SubscriptionSyncMessage(
+                edition, self.subjects, is_compressed=True, compressor=compressor
+            ).to_bytes()
+            for edition in (2, 3)
+        ]
+        self.assertTrue(len(messages[1]) < len(messages[0]))
+        for message in messages:
+            encoded_message = BufferReader(message)
+            decode_varint(encoded_message)
+            read_byte(encoded_message)
+            decode_varint(encoded_message)
+            decode_varint(encoded_message)
+            decode_varint(encoded_message)
+            self.assertEqual(
+                b"\004\011Quantity\0102500000\007Symbol\007EURGBP"
+                b"\004\011Quantity\0105600000\007Symbol\007USDJPY",
+                self.decompressor.decompress(encoded_message.read_remaining()),
+            )
+
+    def test_subject_encoder(self):
+        encoded = []
+
+        def encode(subject):
+            encoded.append(subject)
+            return b"\x00"
+
+        subj_mess = SubscriptionSyncMessage(
+            self.price_sync_edition_sequence_number,
+            self.subjects,
+            subject_encoder=encode,
+        )
+        encoded_message = BufferReader(subj_mess.to_bytes())
+        self.assertEqual(decode_varint(encoded_message), 6)
+        self.assertEqual(self.subjects, encoded)
@@ -1,6 +1,7 @@
 import unittest
 
 from bidfx.pricing._pixie.message.welcome_message import WelcomeMessage
+from bidfx.pricing._pixie.util.buffer_reader import BufferReader
 from bidfx.pricing._pixie.util.buffer_reads import read_byte
 
 
@@ -10,7 +11,7 @@ class TestWelcomeMessage(unittest.TestCase):
         self.welcome_message2_bytes = "570701000010e1000026ae"
 
     def test_first_welcome_message(self):
-        welcome_message_bytes = bytearray.fromhex(self.welcome_message1_bytes)
+        welcome_message_bytes = BufferReader(bytes.fromhex(self.welcome_message1_bytes))
         self.assertEqual(read_byte(welcome_message_bytes), b"W")
         welcome_message = WelcomeMessage(welcome_message_bytes)
         self.assertEqual(welcome_message.options, 0)
@@ -19,7 +20,7 @@ class TestWelcomeMessage(unittest.TestCase):
         self.assertEqual(welcome_message.server_id, 9902)
 
     def test_second_welcome_message(self):
-        welcome_message_bytes = bytearray.fromhex(self.welcome_message2_bytes)
+        welcome_message_bytes = BufferReader(bytes.fromhex(self.welcome_message2_bytes))
         self.assertEqual(read_byte(welcome_message_bytes), b"W")
         welcome_message = WelcomeMessage(welcome_message_bytes)
         self.assertEqual(welcome_message.options, 7)
@@ -0,0 +1,238 @@
+from unittest import TestCase
+
+from bidfx import ScaledValue
+from bidfx.exceptions import PricingError
+from bidfx.pricing._price_values import NUMERIC_VALUES, SCALED_VALUES
+from bidfx.pricing._pixie.data_dictionary import DataDictionary
+from bidfx.pricing._pixie.message.field_def_message import FieldDefMessage
+from bidfx.pricing._pixie.util.buffer_reader import BufferReader
+from bidfx.pricing._pixie.util.buffer_reads import (
+    read_double_fixed8,
+    read_long_fixed8,
+    read_int_fixed4,
+    read_fixed2,
+    read_fixed4,
+    read_fixed8,
+    read_byte_array,
+)
+from bidfx.pricing._pixie.util.varint import (
+    decode_varint,
+    decode_zigzag,
+    decode_string,
+    encode_varint,
+    encode_zigzag,
+    encode_string,
+)
+
+BID = FieldDefMessage(0, read_double_fixed8, decode_varint, 6, "Bid")
+ASK = FieldDefMessage(1, read_double_fixed8, decode_varint, 6, "Ask")
+BID_SIZE = FieldDefMessage(3, read_long_fixed8, decode_varint, 0, "BidSize")
+SYSTEM_TIME = FieldDefMessage(5, read_long_fixed8, decode_varint, 0, "SystemTime")
+
+
+def decode(definition, data):
+    return definition.compile_decoder()(BufferReader(data))
+
+
+def decode_numeric(definition, data):
+    return definition.compile_decoder(NUMERIC_VALUES)(BufferReader(data))
+
+
+def decode_scaled(definition, data):
+    return definition.compile_decoder(SCALED_VALUES)(BufferReader(data))
+
+
+class TestDataDictionary(TestCase):
+    def setUp(self):
+        self.data_dictionary = DataDictionary([BID, ASK, BID_SIZE, SYSTEM_TIME])
+
+    def test_decoders_are_indexed_by_fid(self):
+        decoders = self.data_dictionary.field_decoders
+        self.assertEqual(6, len(decoders))
+        self.assertEqual("Bid", decoders[0][0])
+        self.assertEqual("Ask", decoders[1][0])
+        self.assertEqual("BidSize", decoders[3][0])
+        self.assertEqual(
+            "1.23456", decoders[0][1](BufferReader(encode_varint(1234560)))
+        )
+
+    def test_disabled_fields_have_no_name(self):
+        self.assertIsNone(self.data_dictionary.field_decoders[5][0])
+
+    def test_undefined_fid_gap_raises_error(self):
+        with self.assertRaises(PricingError):
+            self.data_dictionary.field_decoders[2][1](BufferReader(b"\x00"))
+
+    def test_update_recompiles_only_changed_fields(self):
+        bid_decoder = self.data_dictionary.field_decoders[0]
+        ask_decoder = self.data_dictionary.field_decoders[1]
+        new_ask = FieldDefMessage(1, read_double_fixed8, decode_varint, 4, "Ask")
+        self.data_dictionary.update(
+            [FieldDefMessage(0, read_double_fixed8, decode_varint, 6, "Bid"), new_ask]
+        )
+        self.assertIs(bid_decoder, self.data_dictionary.field_decoders[0])
+        self.assertIsNot(ask_decoder, self.data_dictionary.field_decoders[1])
+        self.assertIs(new_ask, self.data_dictionary.definition(1))
+
+    def test_update_adds_new_fields(self):
+        self.data_dictionary.update(
+            [FieldDefMessage(9, read_double_fixed8, decode_zigzag, 4, "NetChange")]
+        )
+        self.assertEqual(5, len(self.data_dictionary))
+        self.assertEqual("NetChange", self.data_dictionary.field_decoders[9][0])
+
+    def test_disabled_fields_are_skipped(self):
+        reader = BufferReader(encode_varint(1582651285000) + b"\x01")
+        self.assertIsNone(self.data_dictionary.field_decoders[5][1](reader))
+        self.assertEqual(1, reader.remaining())
+
+
+class TestProjectedDecoders(TestCase):
+    def setUp(self):
+        self.data_dictionary = DataDictionary([BID, ASK, BID_SIZE, SYSTEM_TIME])
+
+    def test_no_selection_uses_all_decoders(self):
+        self.assertIs(
+            self.data_dictionary.field_decoders,
+            self.data_dictionary.projected_decoders(None),
+        )
+
+    def test_fields_not_selected_are_skipped(self):
+        decoders = self.data_dictionary.projected_decoders(frozenset(["Ask"]))
+        self.assertEqual(
+            [None, "Ask", None, None, None, None], [d[0] for d in decoders]
+        )
+        reader = BufferReader(encode_varint(1500000) + encode_varint(1600000))
+        self.assertIsNone(decoders[0][1](reader))
+        self.assertEqual("1.6", decoders[1][1](reader))
+        self.assertEqual(0, reader.remaining())
+
+    def test_undefined_fid_gap_still_raises_error(self):
+        decoders = self.data_dictionary.projected_decoders(frozenset(["Ask"]))
+        with self.assertRaises(PricingError):
+            decoders[2][1](BufferReader(b"\x00"))
+
+    def test_projections_are_cached_until_update(self):
+        fields = frozenset(["Bid"])
+        decoders = self.data_dictionary.projected_decoders(fields)
+        self.assertIs(decoders, self.data_dictionary.projected_decoders(fields))
+        self.data_dictionary.update(
+            [FieldDefMessage(1, read_double_fixed8, decode_varint, 4, "Ask")]
+        )
+        self.assertIsNot(decoders, self.data_dictionary.projected_decoders(fields))
+
+
+class TestCompiledSkippers(TestCase):
+    def assert_skips(self, definition, data):
+        reader = BufferReader(data + b"\xff")
+        self.assertIsNone(definition.compile_skipper()(reader))
+        self.assertEqual(len(data), reader.position)
+
+    def test_skip_varint_and_zigzag_encodings(self):
+        self.assert_skips(BID, encode_varint(1234567890))
+        definition = FieldDefMessage(9, read_double_fixed8, decode_zigzag, 4, "X")
+        self.assert_skips(definition, encode_varint(encode_zigzag(-25)))
+
+    def test_skip_fixed_encodings(self):
+        fixed2 = FieldDefMessage(9, read_int_fixed4, read_fixed2, 0, "X")
+        fixed8 = FieldDefMessage(9, read_double_fixed8, read_fixed8, 0, "X")
+        self.assert_skips(fixed2, b"\x01\x02")
+        self.assert_skips(fixed8, b"\x3f\xf4\x00\x00\x00\x00\x00\x00")
+
+    def test_skip_by_type_with_no_encoding(self):
+        double = FieldDefMessage(9, read_double_fixed8, None, 0, "X")
+        integer = FieldDefMessage(9, read_int_fixed4, None, 0, "X")
+        self.assert_skips(double, b"\x3f\xf4\x00\x00\x00\x00\x00\x00")
+        self.assert_skips(integer, b"\x00\x00\x01\x02")
+
+    def test_skip_strings_and_byte_arrays(self):
+        string = FieldDefMessage(9, decode_string, decode_string, 0, "X")
+        array = FieldDefMessage(9, read_long_fixed8, read_byte_array, 0, "X")
+        self.assert_skips(string, encode_string("EURUSD"))
+        self.assert_skips(array, encode_varint(3) + b"abc")
+
+
+class TestCompiledDecoders(TestCase):
+    def test_double_with_varint_encoding(self):
+        self.assertEqual("1.5", decode(BID, encode_varint(1500000)))
+
+    def test_double_with_zigzag_encoding(self):
+        definition = FieldDefMessage(9, read_double_fixed8, decode_zigzag, 4, "X")
+        self.assertEqual(
+            "-0.0025", decode(definition, encode_varint(encode_zigzag(-25)))
+        )
+
+    def test_double_with_fixed8_encoding(self):
+        definition = FieldDefMessage(9, read_double_fixed8, read_fixed8, 0, "X")
+        self.assertEqual(
+            "1.25", decode(definition, b"\x3f\xf4\x00\x00\x00\x00\x00\x00")
+        )
+
+    def test_double_with_fixed4_encoding(self):
+        definition = FieldDefMessage(9, read_double_fixed8, read_fixed4, 0, "X")
+        self.assertEqual("1.25", decode(definition, b"\x3f\xa0\x00\x00"))
+
+    def test_double_with_no_encoding(self):
+        definition = FieldDefMessage(9, read_double_fixed8, None, 0, "X")
+        self.assertEqual(1.25, decode(definition, b"\x3f\xf4\x00\x00\x00\x00\x00\x00"))
+
+    def test_long_with_varint_encoding(self):
+        definition = FieldDefMessage(9, read_long_fixed8, decode_varint, 2, "X")
+        self.assertEqual("500", decode(definition, encode_varint(5)))
+
+    def test_long_with_zigzag_encoding(self):
+        definition = FieldDefMessage(9, read_long_fixed8, decode_zigzag, 0, "X")
+        self.assertEqual("-7", decode(definition, encode_varint(encode_zigzag(-7))))
+
+    def test_int_with_fixed4_encoding(self):
+        definition = FieldDefMessage(9, read_int_fixed4, read_fixed4, 0, "X")
+        self.assertEqual("258", decode(definition, b"\x00\x00\x01\x02"))
+
+    def test_long_with_no_encoding(self):
+        definition = FieldDefMessage(9, read_long_fixed8, None, 0, "X")
+        self.assertEqual(
+            "3000", decode(definition, b"\x00\x00\x00\x00\x00\x00\x0b\xb8")
+        )
+
+    def test_string(self):
+        definition = FieldDefMessage(9, decode_string, decode_string, 0, "X")
+        self.assertEqual("EUR", decode(definition, encode_string("EUR")))
+
+
+class TestNumericDecoders(TestCase):
+    def test_double_with_varint_encoding(self):
+        self.assertEqual(1.5, decode_numeric(BID, encode_varint(1500000)))
+        self.assertEqual(
+            ScaledValue(1500000, 6), decode_scaled(BID, encode_varint(1500000))
+        )
+
+    def test_double_with_zigzag_encoding(self):
+        definition = FieldDefMessage(9, read_double_fixed8, decode_zigzag, 4, "X")
+        data = encode_varint(encode_zigzag(-25))
+        self.assertEqual(-0.0025, decode_numeric(definition, data))
+        self.assertEqual(ScaledValue(-25, 4), decode_scaled(definition, data))
+
+    def test_double_with_fixed_encodings(self):
+        fixed8 = FieldDefMessage(9, read_double_fixed8, read_fixed8, 0, "X")
+        fixed4 = FieldDefMessage(9, read_double_fixed8, read_fixed4, 0, "X")
+        self.assertEqual(
+            1.25, decode_numeric(fixed8, b"\x3f\xf4\x00\x00\x00\x00\x00\x00")
+        )
+        self.assertEqual(1.25, decode_scaled(fixed4, b"\x3f\xa0\x00\x00"))
+
+    def test_long_values_are_int(self):
+        varint = FieldDefMessage(9, read_long_fixed8, decode_varint, 2, "X")
+        zigzag = FieldDefMessage(9, read_long_fixed8, decode_zigzag, 0, "X")
+        fixed4 = FieldDefMessage(9, read_int_fixed4, read_fixed4, 0, "X")
+        self.assertEqual(500, decode_numeric(varint, encode_varint(5)))
+        self.assertEqual(-7, decode_scaled(zigzag, encode_varint(encode_zigzag(-7))))
+        self.assertEqual(258, decode_numeric(fixed4, b"\x00\x00\x01\x02"))
+
+    def test_strings_are_unchanged(self):
+        definition = FieldDefMessage(9, decode_string, decode_string, 0, "X")
+        self.assertEqual("EUR", decode_numeric(definition, encode_string("EUR")))
+
+    def test_data_dictionary_compiles_numeric_decoders(self):
+        data_dictionary = DataDictionary([BID], NUMERIC_VALUES)
+        name, decoder = data_dictionary.field_decoders[0]
+        self.assertEqual(1.23456, decoder(BufferReader(encode_varint(1234560))))
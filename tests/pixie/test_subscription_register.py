@@ -1,7 +1,11 @@
 from unittest import TestCase
 
 from bidfx import Subject
-from bidfx.pricing._pixie.subscription_register import SubscriptionRegister
+from bidfx.pricing._pixie.control_operations import ControlOperations
+from bidfx.pricing._pixie.subscription_register import (
+    SubscriptionRegister,
+    SubjectIndex,
+)
 
 SUBJECT1 = Subject.parse_string("Source=A,Symbol=EURGBP")
 SUBJECT2 = Subject.parse_string("Source=A,Symbol=GBPAUD")
@@ -63,3 +67,163 @@ class TestCurrentSubscriptionSet(TestCase):
     def test_unsubscribe_when_not_present_is_not_an_error(self):
         self.register.unsubscribe(SUBJECT1)
         self.assertEqual(None, self.register.subscription_sync())
+
+    def test_subscribe_many(self):
+        self.register.subscribe_many([SUBJECT3, SUBJECT1, SUBJECT2])
+        self.assertListEqual(
+            [SUBJECT1, SUBJECT2, SUBJECT3], self.register.subscription_sync().subjects
+        )
+
+    def test_unsubscribe_many(self):
+        self.register.subscribe_many([SUBJECT1, SUBJECT2, SUBJECT3, SUBJECT4])
+        self.register.subscription_sync()
+        self.register.unsubscribe_many([SUBJECT2, SUBJECT4, SUBJECT5])
+        sync = self.register.subscription_sync()
+        self.assertEqual(3, sync.edition)
+        self.assertListEqual([SUBJECT1, SUBJECT3], sync.subjects)
+
+
+class TestIncrementalSubscriptionSync(TestCase):
+    def setUp(self):
+        self.register = SubscriptionRegister()
+        self.register.subscribe(SUBJECT2)
+        self.register.subscribe(SUBJECT4)
+        self.initial_sync = self.register.subscription_sync()
+
+    def _edition_subjects(self, edition):
+        subjects, size = self.register.subjects_for_edition(edition)
+        return subjects[:size]
+
+    def test_additions_are_appended_to_previous_edition(self):
+        self.register.subscribe(SUBJECT5)
+        self.register.subscribe(SUBJECT1)
+        sync = self.register.subscription_sync()
+        self.assertEqual(self.initial_sync.edition + 1, sync.edition)
+        self.assertListEqual([SUBJECT2, SUBJECT4, SUBJECT1, SUBJECT5], sync.subjects)
+        self.assertFalse(sync.is_unchanged)
+
+    def test_removals_preserve_the_order_of_remaining_subjects(self):
+        self.register.subscribe(SUBJECT1)
+        self.register.subscription_sync()
+        self.register.unsubscribe(SUBJECT4)
+        self.register.subscribe(SUBJECT3)
+        sync = self.register.subscription_sync()
+        self.assertListEqual([SUBJECT2, SUBJECT1, SUBJECT3], sync.subjects)
+
+    def test_refresh_is_sent_as_unchanged_edition_control(self):
+        self.register.refresh(SUBJECT4)
+        sync = self.register.subscription_sync()
+        self.assertEqual(self.initial_sync.edition, sync.edition)
+        self.assertTrue(sync.is_unchanged)
+        self.assertTrue(sync.is_controls)
+        self.assertListEqual([], sync.subjects)
+        self.assertListEqual([(1, ControlOperations.REFRESH)], sync.sid_list)
+        self.assertIsNone(self.register.subscription_sync())
+
+    def test_toggle_is_sent_as_unchanged_edition_control(self):
+        self.register.toggle(SUBJECT2)
+        self.register.refresh(SUBJECT4)
+        sync = self.register.subscription_sync()
+        self.assertTrue(sync.is_unchanged)
+        self.assertListEqual(
+            [(0, ControlOperations.TOGGLE), (1, ControlOperations.REFRESH)],
+            sync.sid_list,
+        )
+
+    def test_controls_of_unsubscribed_subjects_are_dropped(self):
+        self.register.refresh(SUBJECT5)
+        self.assertIsNone(self.register.subscription_sync())
+
+    def test_controls_are_sent_with_a_new_edition(self):
+        self.register.subscribe(SUBJECT5)
+        self.register.refresh(SUBJECT5)
+        sync = self.register.subscription_sync()
+        self.assertEqual(self.initial_sync.edition + 1, sync.edition)
+        self.assertFalse(sync.is_unchanged)
+        self.assertTrue(sync.is_controls)
+        self.assertListEqual([(2, ControlOperations.REFRESH)], sync.sid_list)
+
+    def test_subject_ids_of_edition_are_preserved(self):
+        self.register.subscribe(SUBJECT1)
+        sync = self.register.subscription_sync()
+        self.assertListEqual(
+            [SUBJECT2, SUBJECT4, SUBJECT1],
+            self._edition_subjects(sync.edition),
+        )
+
+    def test_subjects_are_encoded_once(self):
+        encoded = self.initial_sync.subject_encoder(SUBJECT2)
+        self.register.subscribe(SUBJECT1)
+        sync = self.register.subscription_sync()
+        self.assertIs(encoded, sync.subject_encoder(SUBJECT2))
+
+    def test_encodings_of_removed_subjects_are_discarded(self):
+        encoded = self.initial_sync.subject_encoder(SUBJECT2)
+        self.register.unsubscribe(SUBJECT2)
+        self.register.subscription_sync()
+        self.register.subscribe(SUBJECT2)
+        sync = self.register.subscription_sync()
+        self.assertEqual(encoded, sync.subject_encoder(SUBJECT2))
+        self.assertIsNot(encoded, sync.subject_encoder(SUBJECT2))
+
+    def test_append_editions_share_their_subjects(self):
+        self.register.subscribe(SUBJECT1)
+        sync = self.register.subscription_sync()
+        self.assertListEqual(
+            [SUBJECT2, SUBJECT4],
+            self._edition_subjects(self.initial_sync.edition),
+        )
+        self.assertListEqual(
+            [SUBJECT2, SUBJECT4, SUBJECT1],
+            self._edition_subjects(sync.edition),
+        )
+
+    def test_append_editions_share_one_list(self):
+        subjects, size = self.register.subjects_for_edition(self.initial_sync.edition)
+        self.register.subscribe(SUBJECT1)
+        sync = self.register.subscription_sync()
+        self.assertIs(subjects, self.register.subjects_for_edition(sync.edition)[0])
+        self.assertEqual(2, size)
+
+    def test_reset_returns_subjects_in_order(self):
+        self.register.subscribe(SUBJECT5)
+        self.register.subscribe(SUBJECT1)
+        self.register.unsubscribe(SUBJECT4)
+        self.assertListEqual(
+            [SUBJECT1, SUBJECT2, SUBJECT5], self.register.reset_and_get_subjects()
+        )
+        sync = self.register.subscription_sync()
+        self.assertEqual(2, sync.edition)
+        self.assertListEqual([SUBJECT1, SUBJECT2, SUBJECT5], sync.subjects)
+
+
+class TestSubjectIndex(TestCase):
+    def setUp(self):
+        self.index = SubjectIndex()
+
+    def test_iterates_in_subject_order(self):
+        for subject in (SUBJECT5, SUBJECT3, SUBJECT1, SUBJECT4):
+            self.index.add(subject)
+        self.assertListEqual([SUBJECT1, SUBJECT4, SUBJECT3, SUBJECT5], list(self.index))
+        self.assertEqual(4, len(self.index))
+
+    def test_add_is_idempotent(self):
+        self.index.add(SUBJECT1)
+        self.index.add(SUBJECT1)
+        self.assertEqual(1, len(self.index))
+
+    def test_discard(self):
+        self.index.add(SUBJECT1)
+        self.index.add(SUBJECT2)
+        self.index.discard(SUBJECT1)
+        self.index.discard(SUBJECT3)
+        self.assertNotIn(SUBJECT1, self.index)
+        self.assertIn(SUBJECT2, self.index)
+        self.assertListEqual([SUBJECT2], list(self.index))
+
+    def test_order_keys_are_cached(self):
+        key = self.index.order_key(SUBJECT1)
+        self.assertIs(key, self.index.order_key(SUBJECT1))
+        self.assertListEqual(
+            [SUBJECT1, SUBJECT3], self.index.sorted([SUBJECT3, SUBJECT1])
+        )
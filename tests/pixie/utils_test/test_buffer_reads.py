@@ -1,5 +1,6 @@
 import unittest
 
+from bidfx.pricing._pixie.util.buffer_reader import BufferReader
 from bidfx.pricing._pixie.util.buffer_reads import *
 
 
@@ -7,54 +8,60 @@ class TestBufferReads(unittest.TestCase):
     def test_read_int_fixed4(self):
         self.assertEqual(
             12345,
-            read_int_fixed4(bytearray(int.to_bytes(12345, byteorder="big", length=4))),
+            read_int_fixed4(
+                BufferReader(int.to_bytes(12345, byteorder="big", length=4))
+            ),
         )
 
     def test_read_byte(self):
-        self.assertEqual(b"1", read_byte(bytearray(b"1",)))
+        self.assertEqual(b"1", read_byte(BufferReader(b"1")))
 
     def test_read_double_fixed8(self):
         self.assertEqual(
-            12345.123, read_double_fixed8(bytearray(struct.pack(">d", 12345.123)))
+            12345.123, read_double_fixed8(BufferReader(struct.pack(">d", 12345.123)))
         )
 
     def test_read_long_fixed8(self):
         self.assertEqual(
             123123123123123123,
             read_long_fixed8(
-                bytearray(int.to_bytes(123123123123123123, byteorder="big", length=8))
+                BufferReader(
+                    int.to_bytes(123123123123123123, byteorder="big", length=8)
+                )
             ),
         )
 
     def test_read_fixed1(self):
         self.assertEqual(
             bytearray(b"\x01"),
-            read_fixed1(bytearray(b"\x01\x02\x99\x99\x99\x99\x99\x99")),
+            read_fixed1(BufferReader(b"\x01\x02\x99\x99\x99\x99\x99\x99")),
         )
 
     def test_read_fixed2(self):
         self.assertEqual(
             bytearray(b"\x01\x02"),
-            read_fixed2(bytearray(b"\x01\x02\x99\x99\x99\x99\x99\x99")),
+            read_fixed2(BufferReader(b"\x01\x02\x99\x99\x99\x99\x99\x99")),
         )
 
     def test_read_fixed3(self):
         self.assertEqual(
             bytearray(b"\x01\x02\x03"),
-            read_fixed3(bytearray(b"\x01\x02\x03\x99\x99\x99\x99\x99\x99")),
+            read_fixed3(BufferReader(b"\x01\x02\x03\x99\x99\x99\x99\x99\x99")),
         )
 
     def test_read_fixed4(self):
         self.assertEqual(
             bytearray(b"\x01\x02\x03\x04"),
-            read_fixed4(bytearray(b"\x01\x02\x03\x04\x99\x99\x99\x99\x99\x99")),
+            read_fixed4(BufferReader(b"\x01\x02\x03\x04\x99\x99\x99\x99\x99\x99")),
         )
 
     def test_read_fixed8(self):
         self.assertEqual(
             bytearray(b"\x01\x02\x03\x04\x01\x02\x03\x04"),
             read_fixed8(
-                bytearray(b"\x01\x02\x03\x04\x01\x02\x03\x04\x99\x99\x99\x99\x99\x99")
+                BufferReader(
+                    b"\x01\x02\x03\x04\x01\x02\x03\x04\x99\x99\x99\x99\x99\x99"
+                )
             ),
         )
 
@@ -64,7 +71,7 @@ class TestBufferReads(unittest.TestCase):
                 b"\x01\x02\x03\x04\x01\x02\x03\x04\x01\x02\x03\x04\x01\x02\x03\x04"
             ),
             read_fixed16(
-                bytearray(
+                BufferReader(
                     b"\x01\x02\x03\x04\x01\x02\x03\x04\x01\x02\x03\x04\x01\x02\x03\x04"
                 )
             ),
@@ -72,5 +79,20 @@ class TestBufferReads(unittest.TestCase):
 
     def test_read_array(self):
         self.assertEqual(
-            bytearray(b"1234"), read_byte_array(bytearray(b"\x0412345678"))
+            bytearray(b"1234"), read_byte_array(BufferReader(b"\x0412345678"))
         )
+
+    def test_reads_advance_the_cursor_without_shifting_the_buffer(self):
+        data = bytearray(b"\x01\x02\x03\x04\x05\x06")
+        reader = BufferReader(data)
+        self.assertEqual(b"\x01", read_byte(reader))
+        self.assertEqual(bytearray(b"\x02\x03"), read_fixed2(reader))
+        self.assertEqual(3, reader.position)
+        self.assertEqual(3, reader.remaining())
+        self.assertEqual(bytearray(b"\x01\x02\x03\x04\x05\x06"), data)
+
+    def test_read_remaining(self):
+        reader = BufferReader(b"\x01\x02\x03\x04")
+        read_byte(reader)
+        self.assertEqual(b"\x02\x03\x04", reader.read_remaining())
+        self.assertEqual(0, reader.remaining())
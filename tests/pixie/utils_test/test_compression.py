@@ -21,3 +21,19 @@ class TestCompression(unittest.TestCase):
         compressed = self.compressor.compress(text)
         decompressed = self.decompressor.decompress(compressed)
         self.assertEqual(decompressed, text)
+
+    def test_compression_level(self):
+        text = "asd asdfsad gssfsg qwewqeqweqw sffsfdfsd".encode("ascii") * 10
+        compressed = Compressor(0).compress(text)
+        self.assertTrue(len(compressed) > len(text))
+        self.assertEqual(text, self.decompressor.decompress(compressed))
+
+    def test_streaming_compression_reuses_the_window(self):
+        text = "AssetClass=Fx,BuySideAccount=GIVE_UP_ACCT,User=smartcorp_api".encode(
+            "ascii"
+        )
+        first = self.compressor.compress(text)
+        second = self.compressor.compress(text)
+        self.assertTrue(len(second) < len(first))
+        self.assertEqual(text, self.decompressor.decompress(first))
+        self.assertEqual(text, self.decompressor.decompress(second))
@@ -0,0 +1,93 @@
+import socket
+import unittest
+
+from bidfx.pricing._pixie.util.frame_reader import FrameReader
+from bidfx.pricing._pixie.util.varint import encode_varint
+
+
+def frame(msg_type, body):
+    return encode_varint(len(body) + 1) + msg_type + body
+
+
+class ChunkedSocket:
+    def __init__(self, *chunks):
+        self.chunks = list(chunks)
+        self.reads = 0
+
+    def recv_into(self, view):
+        self.reads += 1
+        if not self.chunks:
+            return 0
+        chunk = self.chunks.pop(0)
+        size = min(len(chunk), len(view))
+        view[:size] = chunk[:size]
+        if size < len(chunk):
+            self.chunks.insert(0, chunk[size:])
+        return size
+
+
+class NonBlockingSocket(ChunkedSocket):
+    def recv_into(self, view):
+        if not self.chunks:
+            raise BlockingIOError()
+        return super().recv_into(view)
+
+
+class TestFrameReader(unittest.TestCase):
+    def test_reads_a_single_frame(self):
+        reader = FrameReader(ChunkedSocket(frame(b"H", b"")))
+        msg_type, body = reader.read_frame()
+        self.assertEqual(b"H", msg_type)
+        self.assertEqual(0, body.remaining())
+
+    def test_reads_many_frames_from_one_receive(self):
+        opened_socket = ChunkedSocket(
+            frame(b"P", b"first") + frame(b"H", b"") + frame(b"D", b"third")
+        )
+        reader = FrameReader(opened_socket)
+        self.assertEqual((b"P", b"first"), self._read(reader))
+        self.assertEqual((b"H", b""), self._read(reader))
+        self.assertEqual((b"D", b"third"), self._read(reader))
+        self.assertEqual(1, opened_socket.reads)
+
+    def test_reads_frames_split_across_receives(self):
+        data = frame(b"P", b"0123456789" * 20) + frame(b"W", b"welcome")
+        chunks = [data[i : i + 7] for i in range(0, len(data), 7)]
+        reader = FrameReader(ChunkedSocket(*chunks))
+        self.assertEqual((b"P", b"0123456789" * 20), self._read(reader))
+        self.assertEqual((b"W", b"welcome"), self._read(reader))
+
+    def test_grows_buffer_to_fit_a_large_frame(self):
+        body = bytes(range(256)) * 40
+        reader = FrameReader(ChunkedSocket(frame(b"P", body), frame(b"H", b"")), 16)
+        self.assertEqual((b"P", body), self._read(reader))
+        self.assertEqual((b"H", b""), self._read(reader))
+
+    def test_raises_error_at_end_of_stream(self):
+        data = frame(b"P", b"partial")
+        reader = FrameReader(ChunkedSocket(data[:4]))
+        with self.assertRaises(socket.error):
+            reader.read_frame()
+
+    def test_reads_available_frames_without_blocking(self):
+        data = frame(b"P", b"first") + frame(b"H", b"") + frame(b"D", b"third")
+        opened_socket = NonBlockingSocket(data[:8])
+        reader = FrameReader(opened_socket)
+        self.assertListEqual([(b"P", b"first")], self._read_available(reader))
+        opened_socket.chunks.append(data[8:])
+        self.assertListEqual(
+            [(b"H", b""), (b"D", b"third")], self._read_available(reader)
+        )
+        self.assertListEqual([], self._read_available(reader))
+
+    @staticmethod
+    def _read_available(reader):
+        return [
+            (msg_type, bytes(body.read_remaining()))
+            for msg_type, body in reader.read_available_frames()
+        ]
+
+    @staticmethod
+    def _read(reader):
+        msg_type, body = reader.read_frame()
+        return msg_type, bytes(body.read_remaining())
@@ -1,6 +1,7 @@
 import unittest
 from unittest import mock
 
+from bidfx.pricing._pixie.util.buffer_reader import BufferReader
 from bidfx.pricing._pixie.util.varint import *
 
 
@@ -31,17 +32,17 @@ class TestVarintNumbers(unittest.TestCase):
 class TestTwoWayEncodeDecode(unittest.TestCase):
     def test_encode_decode_first_1000_ints(self):
         for n in range(1000):
-            self.assertEqual(n, decode_varint(encode_varint(n)))
+            self.assertEqual(n, decode_varint(BufferReader(encode_varint(n))))
 
     def test_encode_decode_powers_of_10(self):
-        self.assertEqual(1, decode_varint(encode_varint(1)))
-        self.assertEqual(10, decode_varint(encode_varint(10)))
-        self.assertEqual(100, decode_varint(encode_varint(100)))
-        self.assertEqual(1000, decode_varint(encode_varint(1000)))
-        self.assertEqual(10000, decode_varint(encode_varint(10000)))
-        self.assertEqual(100000, decode_varint(encode_varint(100000)))
-        self.assertEqual(1000000, decode_varint(encode_varint(1000000)))
-        self.assertEqual(10000000, decode_varint(encode_varint(10000000)))
+        self.assertEqual(1, decode_varint(BufferReader(encode_varint(1))))
+        self.assertEqual(10, decode_varint(BufferReader(encode_varint(10))))
+        self.assertEqual(100, decode_varint(BufferReader(encode_varint(100))))
+        self.assertEqual(1000, decode_varint(BufferReader(encode_varint(1000))))
+        self.assertEqual(10000, decode_varint(BufferReader(encode_varint(10000))))
+        self.assertEqual(100000, decode_varint(BufferReader(encode_varint(100000))))
+        self.assertEqual(1000000, decode_varint(BufferReader(encode_varint(1000000))))
+        self.assertEqual(10000000, decode_varint(BufferReader(encode_varint(10000000))))
 
 
 class TestStrings(unittest.TestCase):
@@ -52,16 +53,16 @@ class TestStrings(unittest.TestCase):
         self.assertEqual(bytearray(b"\x01"), encode_string(""))
 
     def test_decode_null_string(self):
-        self.assertEqual(None, decode_string(bytearray(b"\x00")))
+        self.assertEqual(None, decode_string(BufferReader(b"\x00")))
 
     def test_decode_blank_string(self):
-        self.assertEqual("", decode_string(bytearray(b"\x01")))
+        self.assertEqual("", decode_string(BufferReader(b"\x01")))
 
     def test_decode_string(self):
-        self.assertEqual("x", decode_string(bytearray(b"\x02x")))
-        self.assertEqual("test", decode_string(bytearray(b"\x05test")))
+        self.assertEqual("x", decode_string(BufferReader(b"\x02x")))
+        self.assertEqual("test", decode_string(BufferReader(b"\x05test")))
         self.assertEqual(
-            "testing 1, 2, 3", decode_string(bytearray(b"\x10testing 1, 2, 3"))
+            "testing 1, 2, 3", decode_string(BufferReader(b"\x10testing 1, 2, 3"))
         )
 
     def test_encode_string(self):
@@ -75,12 +76,15 @@ class TestStrings(unittest.TestCase):
         s = "test π"
         encoded = b"\x08test \xcf\x80"
         self.assertEqual(encoded, encode_string(s))
-        self.assertEqual(s, decode_string(bytearray(encoded)))
+        self.assertEqual(s, decode_string(BufferReader(encoded)))
 
     def test_decode_encode_string(self):
-        self.assertEqual(decode_string(encode_string("test string")), "test string")
         self.assertEqual(
-            decode_string(encode_string("test string123")), "test string123"
+            decode_string(BufferReader(encode_string("test string"))), "test string"
+        )
+        self.assertEqual(
+            decode_string(BufferReader(encode_string("test string123"))),
+            "test string123",
         )
 
     def test_string_array(self):
@@ -88,11 +92,14 @@ class TestStrings(unittest.TestCase):
 
     def test_varint_decode_encode_string_array(self):
         self.assertListEqual(
-            decode_strings_list(encode_strings_list(["one", "two"])), ["one", "two"]
+            decode_strings_list(BufferReader(encode_strings_list(["one", "two"]))),
+            ["one", "two"],
         )
         self.assertListEqual(
             decode_strings_list(
-                encode_strings_list(["on123e", "twoewer", "on123e", "twoewer"])
+                BufferReader(
+                    encode_strings_list(["on123e", "twoewer", "on123e", "twoewer"])
+                )
             ),
             ["on123e", "twoewer", "on123e", "twoewer"],
         )
@@ -0,0 +1,170 @@
+import asyncio
+import threading
+from configparser import ConfigParser
+from unittest import TestCase
+
+from bidfx import (
+    AsyncPricingAPI,
+    AsyncSession,
+    EventStream,
+    PriceBatchEvent,
+    PriceEvent,
+    PricingError,
+    ProviderEvent,
+    ProviderStatus,
+    Subject,
+    SubscriptionEvent,
+    SubscriptionStatus,
+)
+
+SUBJECT1 = Subject.parse_string("Source=A,Symbol=EURGBP")
+SUBJECT2 = Subject.parse_string("Source=A,Symbol=GBPAUD")
+
+
+def disabled_config():
+    config = ConfigParser()
+    config.read_string(
+        "[DEFAULT]\nusername = user\ndefault_account = ACCT\ndisable = true\n"
+        "[Exclusive Pricing]\n[Shared Pricing]\n"
+    )
+    return config
+
+
+class TestAsyncPricingAPI(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.pricing = AsyncPricingAPI(disabled_config())
+        self.callbacks = self.pricing._pricing.callbacks
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(asyncio.wait_for(coroutine, 5))
+
+    def publish_from_thread(self, *publications):
+        def publish():
+            for fn, event in publications:
+                fn(event)
+
+        thread = threading.Thread(target=publish)
+        thread.start()
+        return thread
+
+    def test_events_are_delivered_on_the_loop(self):
+        async def consume():
+            await self.pricing.start()
+            async with self.pricing.events() as events:
+                self.publish_from_thread(
+                    (self.callbacks.price_event_fn, PriceEvent(SUBJECT1, {}, True)),
+                    (
+                        self.callbacks.provider_event_fn,
+                        ProviderEvent("Pixie-1", ProviderStatus.READY, ""),
+                    ),
+                )
+                return [await events.__anext__(), await events.__anext__()]
+
+        received = self.run_async(consume())
+        self.assertEqual(SUBJECT1, received[0].subject)
+        self.assertEqual(ProviderStatus.READY, received[1].status)
+
+    def test_events_can_be_filtered_by_subject(self):
+        async def consume():
+            await self.pricing.start()
+            async with self.pricing.events(SUBJECT2) as events:
+                self.publish_from_thread(
+                    (self.callbacks.price_event_fn, PriceEvent(SUBJECT1, {}, True)),
+                    (
+                        self.callbacks.provider_event_fn,
+                        ProviderEvent("Pixie-1", ProviderStatus.READY, ""),
+                    ),
+                    (self.callbacks.price_event_fn, PriceEvent(SUBJECT2, {}, True)),
+                )
+                return await events.__anext__()
+
+        self.assertEqual(SUBJECT2, self.run_async(consume()).subject)
+
+    def test_batches_are_delivered_as_events(self):
+        async def consume():
+            await self.pricing.start()
+            async with self.pricing.events() as events:
+                batch = PriceBatchEvent(
+                    [PriceEvent(SUBJECT1, {}, True), PriceEvent(SUBJECT2, {}, True)]
+                )
+                self.publish_from_thread((self.callbacks.price_batch_fn, batch))
+                return [(await events.__anext__()).subject for _ in range(2)]
+
+        self.assertListEqual([SUBJECT1, SUBJECT2], self.run_async(consume()))
+
+    def test_iteration_ends_when_stopped(self):
+        async def consume():
+            await self.pricing.start()
+            events = self.pricing.events()
+            self.loop.call_soon(asyncio.ensure_future, self.pricing.stop())
+            return [event async for event in events]
+
+        self.assertListEqual([], self.run_async(consume()))
+
+    def test_closed_streams_are_removed(self):
+        async def consume():
+            async with self.pricing.events(SUBJECT1):
+                pass
+
+        self.run_async(consume())
+        self.assertEqual({}, self.pricing._subject_streams)
+
+
+class TestEventStream(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def consume(self, stream):
+        stream.close()
+
+        async def consume():
+            return [event async for event in stream]
+
+        return self.loop.run_until_complete(asyncio.wait_for(consume(), 5))
+
+    def test_full_stream_drops_the_oldest_event(self):
+        stream = EventStream(max_size=2)
+        for i in range(5):
+            stream._put(PriceEvent(SUBJECT1, {"Bid": i}, True))
+        self.assertEqual(3, stream.dropped)
+        self.assertListEqual([3, 4], [e.price["Bid"] for e in self.consume(stream)])
+
+    def test_full_stream_conflates_price_updates_of_a_subject(self):
+        stream = EventStream(max_size=2, overflow="conflate")
+        stream._put(PriceEvent(SUBJECT1, {"Bid": 1, "Ask": 2}, True))
+        stream._put(PriceEvent(SUBJECT2, {"Bid": 5}, True))
+        stream._put(PriceEvent(SUBJECT1, {"Ask": 3}, False))
+        stream._put(PriceEvent(SUBJECT2, {"Bid": 6}, False))
+        self.assertEqual(2, stream.conflated)
+        self.assertEqual(0, stream.dropped)
+        events = self.consume(stream)
+        self.assertDictEqual({"Bid": 1, "Ask": 3}, events[0].price)
+        self.assertTrue(events[0].full)
+        self.assertDictEqual({"Bid": 6}, events[1].price)
+
+    def test_prices_are_not_conflated_across_a_status_event(self):
+        stream = EventStream(max_size=2, overflow="conflate")
+        stream._put(PriceEvent(SUBJECT1, {"Bid": 1}, True))
+        stream._put(SubscriptionEvent(SUBJECT1, SubscriptionStatus.STALE, "down"))
+        stream._put(PriceEvent(SUBJECT1, {"Bid": 2}, True))
+        self.assertEqual(1, stream.dropped)
+        events = self.consume(stream)
+        self.assertEqual(SubscriptionStatus.STALE, events[0].status)
+        self.assertEqual(2, events[1].price["Bid"])
+
+    def test_unsupported_overflow_policy(self):
+        with self.assertRaises(PricingError):
+            EventStream(overflow="block")
+
+
+class TestAsyncSession(TestCase):
+    def test_pricing_is_async(self):
+        session = AsyncSession(disabled_config())
+        self.assertIsInstance(session.pricing, AsyncPricingAPI)
@@ -0,0 +1,165 @@
+from configparser import ConfigParser
+from unittest import TestCase
+
+from bidfx import (
+    BestPriceAggregator,
+    Callbacks,
+    PriceBatchEvent,
+    PriceEvent,
+    PricingAPI,
+    Subject,
+    SubscriptionEvent,
+    SubscriptionStatus,
+)
+
+
+def lp_subject(provider, symbol="EURUSD", quantity="1000000"):
+    return Subject.parse_string(
+        f"AssetClass=Fx,DealType=Spot,LiquidityProvider={provider},Quantity={quantity},"
+        f"Symbol={symbol},Tenor=Spot"
+    )
+
+
+DBFX = lp_subject("DBFX")
+CSFX = lp_subject("CSFX")
+RBCFX = lp_subject("RBCFX")
+KEY = ("EURUSD", "1000000", "Spot", "Spot")
+
+
+class TestBestPriceAggregator(TestCase):
+    def setUp(self):
+        self.callbacks = Callbacks()
+        self.published = []
+        self.best = []
+        self.callbacks.price_event_fn = self.published.append
+        self.callbacks.subscription_event_fn = self.published.append
+        self.callbacks.best_price_fn = self.best.append
+        self.aggregator = BestPriceAggregator(self.callbacks)
+
+    def quote(self, subject, bid, ask, full=True, **fields):
+        price = dict(fields)
+        if bid is not None:
+            price["Bid"] = bid
+        if ask is not None:
+            price["Ask"] = ask
+        self.aggregator.price_event_fn(PriceEvent(subject, price, full))
+
+    def top(self, event=None):
+        event = event or self.best[-1]
+        return event.bid, event.bid_provider, event.ask, event.ask_provider
+
+    def test_subjects_are_keyed_by_instrument(self):
+        self.assertEqual(KEY, BestPriceAggregator.key_of(DBFX))
+        self.assertEqual(
+            BestPriceAggregator.key_of(DBFX), BestPriceAggregator.key_of(CSFX)
+        )
+        self.assertIsNone(
+            BestPriceAggregator.key_of(Subject.parse_string("Source=A,Symbol=EURGBP"))
+        )
+
+    def test_best_bid_and_ask_come_from_different_providers(self):
+        self.quote(DBFX, "1.1000", "1.1004", BidSize="1000000")
+        self.quote(CSFX, "1.1001", "1.1005")
+        self.quote(RBCFX, "1.0999", "1.1003")
+        self.assertEqual((1.1001, "CSFX", 1.1003, "RBCFX"), self.top())
+        self.assertEqual(3, len(self.published))
+        best = self.aggregator.best(KEY)
+        self.assertEqual((1.1001, "CSFX", 1.1003, "RBCFX"), self.top(best))
+
+    def test_events_are_published_only_when_the_top_changes(self):
+        self.quote(DBFX, "1.1000", "1.1004")
+        self.quote(CSFX, "1.0990", "1.1010")
+        self.quote(CSFX, "1.0995", "1.1008")
+        self.assertEqual(1, len(self.best))
+        self.quote(CSFX, "1.1002", "1.1008")
+        self.assertEqual(2, len(self.best))
+        self.assertEqual((1.1002, "CSFX", 1.1004, "DBFX"), self.top())
+
+    def test_equal_prices_keep_the_first_provider(self):
+        self.quote(DBFX, "1.1000", "1.1004")
+        self.quote(CSFX, "1.1000", "1.1004")
+        self.assertEqual(1, len(self.best))
+        self.assertEqual("DBFX", self.best[-1].bid_provider)
+
+    def test_partial_updates_are_merged_with_the_quote(self):
+        self.quote(DBFX, "1.1000", "1.1004", BidSize="1000000")
+        self.quote(CSFX, "1.0990", "1.1010")
+        self.quote(DBFX, None, "1.1003", full=False)
+        self.assertEqual((1.1, "DBFX", 1.1003, "DBFX"), self.top())
+        self.assertEqual(1000000.0, self.best[-1].bid_size)
+        self.quote(DBFX, None, None, full=False, BidSize="2000000")
+        self.assertEqual(2000000.0, self.best[-1].bid_size)
+
+    def test_falling_best_price_is_replaced_by_the_next_best(self):
+        self.quote(DBFX, "1.1000", "1.1004")
+        self.quote(CSFX, "1.0998", "1.1006")
+        self.quote(RBCFX, "1.0996", "1.1008")
+        self.quote(DBFX, "1.0990", "1.1010")
+        self.assertEqual((1.0998, "CSFX", 1.1006, "CSFX"), self.top())
+
+    def test_stale_quotes_are_withdrawn(self):
+        self.quote(DBFX, "1.1000", "1.1004")
+        self.quote(CSFX, "1.0998", "1.1006")
+        event = SubscriptionEvent(DBFX, SubscriptionStatus.STALE, "down")
+        self.aggregator.subscription_event_fn(event)
+        self.assertIs(event, self.published[-1])
+        self.assertEqual((1.0998, "CSFX", 1.1006, "CSFX"), self.top())
+        self.quote(DBFX, "1.1000", "1.1004")
+        self.assertEqual((1.1, "DBFX", 1.1004, "DBFX"), self.top())
+
+    def test_full_update_without_a_side_withdraws_it(self):
+        self.quote(DBFX, "1.1000", "1.1004")
+        self.quote(CSFX, "1.0998", "1.1006")
+        self.quote(DBFX, None, "1.1004")
+        self.assertEqual((1.0998, "CSFX", 1.1004, "DBFX"), self.top())
+
+    def test_withdrawing_the_last_quote_clears_the_book(self):
+        self.quote(DBFX, "1.1000", "1.1004")
+        self.aggregator.discard(DBFX)
+        self.assertEqual((None, None, None, None), self.top())
+        self.assertIsNone(self.aggregator.best(KEY))
+        self.assertNotIn(KEY, self.aggregator)
+
+    def test_batches_are_aggregated_and_published(self):
+        other = lp_subject("DBFX", quantity="5000000")
+        batch = PriceBatchEvent(
+            [
+                PriceEvent(DBFX, {"Bid": "1.1", "Ask": "1.2"}, True),
+                PriceEvent(other, {"Bid": "1.0", "Ask": "1.3"}, True),
+            ]
+        )
+        self.aggregator.price_batch_fn(batch)
+        self.assertListEqual(batch.events, self.published)
+        self.assertEqual(2, len(self.aggregator))
+        self.assertEqual(
+            1.0, self.aggregator.best(BestPriceAggregator.key_of(other)).bid
+        )
+
+    def test_many_updates_keep_the_heaps_bounded(self):
+        subjects = [lp_subject(f"LP{i}") for i in range(17)]
+        for tick in range(1000):
+            for i, subject in enumerate(subjects):
+                self.quote(subject, str(1 + (tick + i) % 17), str(20 + (tick * i) % 17))
+        book = self.aggregator._books[KEY]
+        self.assertLessEqual(len(book.bids.heap), 2 * 17 + 9)
+        self.assertEqual(17.0, self.best[-1].bid)
+        self.assertEqual(20.0, self.best[-1].ask)
+
+
+class TestPricingAPIBestPrices(TestCase):
+    def test_best_prices_are_enabled_by_config(self):
+        config = ConfigParser()
+        config.read_string(
+            "[DEFAULT]\nusername = user\ndefault_account = ACCT\ndisable = true\n"
+            "best_price = true\n[Exclusive Pricing]\n[Shared Pricing]\n"
+        )
+        pricing = PricingAPI(config)
+        best = []
+        pricing.callbacks.best_price_fn = best.append
+        self.assertIs(pricing.best_prices, pricing._provider_callbacks)
+        pricing.best_prices.price_event_fn(
+            PriceEvent(DBFX, {"Bid": "1.1", "Ask": "1.2"}, True)
+        )
+        self.assertEqual("DBFX", best[-1].bid_provider)
+        pricing.unsubscribe(DBFX)
+        self.assertIsNone(best[-1].bid)
@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+from bidfx import Callbacks, PriceBatchEvent, PriceEvent, Subject
+from bidfx.pricing._callback_stage import CallbackStage
+
+SUBJECT1 = Subject.parse_string("Source=A,Symbol=EURGBP")
+SUBJECT2 = Subject.parse_string("Source=A,Symbol=GBPAUD")
+
+
+class RecordingStage(CallbackStage):
+    def __init__(self, callbacks, published):
+        super().__init__(callbacks)
+        self.published = published
+
+    def _before_publish(self, events, batch):
+        self.published.append(("before", len(events), batch))
+        return len(events)
+
+    def _after_publish(self, events, applied):
+        self.published.append(("after", applied))
+
+
+class TestCallbackStage(TestCase):
+    def setUp(self):
+        self.callbacks = Callbacks()
+        self.published = []
+        self.callbacks.price_event_fn = self.published.append
+        self.stage = RecordingStage(self.callbacks, self.published)
+
+    def test_price_event_is_applied_around_its_publication(self):
+        event = PriceEvent(SUBJECT1, {"Bid": 1}, True)
+        self.stage.price_event_fn(event)
+        self.assertListEqual(
+            [("before", 1, None), event, ("after", 1)], self.published
+        )
+
+    def test_batch_is_published_as_events_without_a_batch_callback(self):
+        events = [
+            PriceEvent(SUBJECT1, {"Bid": 1}, True),
+            PriceEvent(SUBJECT2, {"Bid": 2}, True),
+        ]
+        batch = PriceBatchEvent(events)
+        self.stage.price_batch_fn(batch)
+        self.assertListEqual(
+            [("before", 2, batch)] + events + [("after", 2)], self.published
+        )
+
+    def test_batch_is_published_whole_to_a_batch_callback(self):
+        self.callbacks.price_batch_fn = self.published.append
+        batch = PriceBatchEvent([PriceEvent(SUBJECT1, {"Bid": 1}, True)])
+        self.stage.price_batch_fn(batch)
+        self.assertListEqual(
+            [("before", 1, batch), batch, ("after", 1)], self.published
+        )
+
+    def test_other_callbacks_are_forwarded(self):
+        self.callbacks.provider_event_fn = print
+        self.callbacks.best_price_fn = repr
+        self.callbacks.depth_event_fn = str
+        self.assertIs(print, self.stage.provider_event_fn)
+        self.assertIs(repr, self.stage.best_price_fn)
+        self.assertIs(str, self.stage.depth_event_fn)
@@ -0,0 +1,173 @@
+import math
+from configparser import ConfigParser
+from unittest import TestCase
+
+from bidfx import (
+    BestPriceAggregator,
+    Callbacks,
+    DepthBookCache,
+    PriceBatchEvent,
+    PriceEvent,
+    PricingAPI,
+    Subject,
+    SubscriptionEvent,
+    SubscriptionStatus,
+)
+
+BOOK = Subject.parse_string(
+    "AssetClass=Fx,DealType=Spot,Level=2,LiquidityProvider=FXTS,Rows=3,Symbol=EURUSD,Tenor=Spot"
+)
+UNSIZED_BOOK = Subject.parse_string(
+    "AssetClass=Fx,DealType=Spot,Level=2,LiquidityProvider=FXTS,Symbol=GBPUSD,Tenor=Spot"
+)
+QUOTE = Subject.parse_string(
+    "AssetClass=Fx,DealType=Spot,Level=1,LiquidityProvider=DBFX,Symbol=EURUSD,Tenor=Spot"
+)
+
+FULL_BOOK = {
+    "BidLevels": "2",
+    "AskLevels": "2",
+    "Bid1": "1.1000",
+    "BidSize1": "1000000",
+    "BidFirm1": "DBFX",
+    "Bid2": "1.0999",
+    "BidSize2": "3000000",
+    "BidFirm2": "CSFX",
+    "Ask1": "1.1002",
+    "AskSize1": "2000000",
+    "AskFirm1": "RBCFX",
+    "Ask2": "1.1003",
+    "AskSize2": "5000000",
+    "AskFirm2": "DBFX",
+}
+
+
+class TestDepthBookCache(TestCase):
+    def setUp(self):
+        self.callbacks = Callbacks()
+        self.published = []
+        self.depth = []
+        self.callbacks.price_event_fn = self.published.append
+        self.callbacks.subscription_event_fn = self.published.append
+        self.callbacks.depth_event_fn = self.depth.append
+        self.cache = DepthBookCache(self.callbacks, rows=5)
+
+    def test_full_update_builds_the_book(self):
+        self.cache.price_event_fn(PriceEvent(BOOK, FULL_BOOK, True))
+        book = self.cache.book(BOOK)
+        self.assertEqual(3, book.bids.capacity)
+        self.assertListEqual(
+            [(1.1, 1000000.0, "DBFX"), (1.0999, 3000000.0, "CSFX")], book.bids.top()
+        )
+        self.assertListEqual([(1.1002, 2000000.0, "RBCFX")], book.asks.top(1))
+        self.assertEqual(7000000.0, book.asks.cumulative_size())
+        self.assertEqual(2000000.0, book.asks.cumulative_size(1))
+        self.assertEqual(2, book.bids.depth)
+        self.assertEqual(1, len(self.published))
+        self.assertListEqual([0, 1], self.depth[-1].bid_changes)
+        self.assertListEqual([0, 1], self.depth[-1].ask_changes)
+        self.assertIs(BOOK, self.depth[-1].subject)
+
+    def test_partial_update_is_applied_in_place_and_notifies_changed_levels(self):
+        self.cache.price_event_fn(PriceEvent(BOOK, FULL_BOOK, True))
+        book = self.cache.book(BOOK)
+        prices = book.bids.prices
+        self.cache.price_event_fn(
+            PriceEvent(BOOK, {"BidSize2": "4000000", "Ask1": "1.1002"}, False)
+        )
+        self.assertIs(prices, book.bids.prices)
+        self.assertEqual(4000000.0, book.bids.sizes[1])
+        self.assertListEqual([1], self.depth[-1].bid_changes)
+        self.assertListEqual([], self.depth[-1].ask_changes)
+
+    def test_unchanged_levels_publish_no_depth_event(self):
+        self.cache.price_event_fn(PriceEvent(BOOK, FULL_BOOK, True))
+        self.cache.price_event_fn(PriceEvent(BOOK, {"Bid1": "1.1000"}, False))
+        self.cache.price_event_fn(PriceEvent(BOOK, FULL_BOOK, True))
+        self.assertEqual(1, len(self.depth))
+        self.assertEqual(3, len(self.published))
+
+    def test_full_update_clears_the_levels_it_omits(self):
+        self.cache.price_event_fn(PriceEvent(BOOK, FULL_BOOK, True))
+        self.cache.price_event_fn(
+            PriceEvent(
+                BOOK,
+                {"Bid1": "1.1000", "BidSize1": "1000000", "BidFirm1": "DBFX"},
+                True,
+            )
+        )
+        book = self.cache.book(BOOK)
+        self.assertEqual(1, book.bids.depth)
+        self.assertEqual(0, book.asks.depth)
+        self.assertListEqual([1], self.depth[-1].bid_changes)
+        self.assertListEqual([0, 1], self.depth[-1].ask_changes)
+
+    def test_fewer_levels_clear_the_deeper_levels(self):
+        self.cache.price_event_fn(PriceEvent(BOOK, FULL_BOOK, True))
+        self.cache.price_event_fn(PriceEvent(BOOK, {"AskLevels": "1"}, False))
+        book = self.cache.book(BOOK)
+        self.assertEqual(1, book.asks.depth)
+        self.assertTrue(math.isnan(book.asks.sizes[1]))
+        self.assertIsNone(book.asks.firms[1])
+        self.assertListEqual([1], self.depth[-1].ask_changes)
+
+    def test_levels_beyond_the_capacity_are_ignored(self):
+        self.cache.price_event_fn(PriceEvent(BOOK, {"Bid4": "1.0990"}, True))
+        self.assertEqual(0, self.cache.book(BOOK).bids.depth)
+        self.assertEqual(0, len(self.depth))
+
+    def test_books_without_rows_use_the_configured_capacity(self):
+        self.cache.price_event_fn(PriceEvent(UNSIZED_BOOK, {"Bid5": "1.2"}, True))
+        self.assertEqual(5, self.cache.book(UNSIZED_BOOK).bids.capacity)
+
+    def test_non_book_subjects_are_ignored(self):
+        self.cache.price_event_fn(PriceEvent(QUOTE, {"Bid": "1.1"}, True))
+        self.assertNotIn(QUOTE, self.cache)
+        self.assertEqual(1, len(self.published))
+
+    def test_batches_update_books_before_publishing_depth_events(self):
+        batches = []
+        self.callbacks.price_batch_fn = batches.append
+        batch = PriceBatchEvent([PriceEvent(BOOK, FULL_BOOK, True)])
+        self.cache.price_batch_fn(batch)
+        self.assertListEqual([batch], batches)
+        self.assertEqual(1, len(self.depth))
+
+    def test_status_change_clears_the_book(self):
+        self.cache.price_event_fn(PriceEvent(BOOK, FULL_BOOK, True))
+        event = SubscriptionEvent(BOOK, SubscriptionStatus.STALE, "down")
+        self.cache.subscription_event_fn(event)
+        self.assertIs(event, self.published[-1])
+        self.assertEqual(0, self.cache.book(BOOK).bids.depth)
+        self.assertListEqual([0, 1], self.depth[-1].bid_changes)
+
+    def test_discard(self):
+        self.cache.price_event_fn(PriceEvent(BOOK, FULL_BOOK, True))
+        self.cache.discard(BOOK)
+        self.assertIsNone(self.cache.book(BOOK))
+        self.assertEqual(0, len(self.cache))
+
+    def test_book_subjects_are_not_aggregated_for_best_prices(self):
+        self.assertIsNone(BestPriceAggregator.key_of(BOOK))
+
+
+class TestPricingAPIDepthBooks(TestCase):
+    def test_depth_books_are_enabled_by_config(self):
+        config = ConfigParser()
+        config.read_string(
+            "[DEFAULT]\nusername = user\ndefault_account = ACCT\ndisable = true\n"
+            "depth_books = true\nbest_price = true\n[Exclusive Pricing]\n[Shared Pricing]\n"
+        )
+        pricing = PricingAPI(config)
+        depth = []
+        best = []
+        pricing.callbacks.depth_event_fn = depth.append
+        pricing.callbacks.best_price_fn = best.append
+        pricing._provider_callbacks.price_event_fn(PriceEvent(BOOK, FULL_BOOK, True))
+        pricing._provider_callbacks.price_event_fn(
+            PriceEvent(QUOTE, {"Bid": "1.1", "Ask": "1.2"}, True)
+        )
+        self.assertEqual(1, len(depth))
+        self.assertEqual(1, len(best))
+        pricing.unsubscribe(BOOK)
+        self.assertNotIn(BOOK, pricing.depth_books)
@@ -0,0 +1,260 @@
+import threading
+from configparser import ConfigParser
+from unittest import TestCase
+
+from bidfx import (
+    Callbacks,
+    CallbackDispatcher,
+    PriceBatchEvent,
+    PriceEvent,
+    PricingError,
+    ProviderEvent,
+    ProviderStatus,
+    Subject,
+    SubscriptionEvent,
+    SubscriptionStatus,
+)
+from bidfx.pricing.dispatcher import dispatcher_from_config
+
+SUBJECT1 = Subject.parse_string("Source=A,Symbol=EURGBP")
+SUBJECT2 = Subject.parse_string("Source=A,Symbol=GBPAUD")
+
+
+class Recorder:
+    def __init__(self, expected=0):
+        self.events = []
+        self.done = threading.Event()
+        self.expected = expected
+
+    def __call__(self, event):
+        self.events.append(event)
+        if len(self.events) >= self.expected:
+            self.done.set()
+
+
+class TestCallbackDispatcher(TestCase):
+    def setUp(self):
+        self.callbacks = Callbacks()
+
+    def tearDown(self):
+        self.dispatcher.stop()
+
+    def test_events_are_published_by_a_worker_thread(self):
+        recorder = Recorder(expected=1)
+        self.callbacks.price_event_fn = lambda e: recorder(threading.current_thread())
+        self.dispatcher = CallbackDispatcher(self.callbacks)
+        self.dispatcher.start()
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": "1"}, True))
+        self.assertTrue(recorder.done.wait(5))
+        self.assertIsNot(threading.current_thread(), recorder.events[0])
+
+    def test_events_of_a_subject_are_published_in_order(self):
+        recorder = Recorder(expected=200)
+        self.callbacks.price_event_fn = recorder
+        self.dispatcher = CallbackDispatcher(self.callbacks, threads=4)
+        self.dispatcher.start()
+        for i in range(100):
+            self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": i}, False))
+            self.dispatcher.price_event_fn(PriceEvent(SUBJECT2, {"Bid": i}, False))
+        self.assertTrue(recorder.done.wait(5))
+        for subject in (SUBJECT1, SUBJECT2):
+            self.assertListEqual(
+                list(range(100)),
+                [e.price["Bid"] for e in recorder.events if e.subject == subject],
+            )
+
+    def test_drop_oldest_policy(self):
+        recorder = Recorder()
+        self.callbacks.price_event_fn = recorder
+        self.dispatcher = CallbackDispatcher(
+            self.callbacks, queue_size=2, overflow="drop_oldest"
+        )
+        for i in range(5):
+            self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": i}, True))
+        self.assertEqual(2, self.dispatcher.queue_depth)
+        self.assertEqual(3, self.dispatcher.dropped_count)
+        self._drain()
+        self.assertListEqual([3, 4], [e.price["Bid"] for e in recorder.events])
+
+    def test_block_policy_drops_the_oldest_while_not_running(self):
+        recorder = Recorder()
+        self.callbacks.price_event_fn = recorder
+        self.dispatcher = CallbackDispatcher(self.callbacks, queue_size=2)
+        for i in range(5):
+            self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": i}, True))
+        self.assertEqual(2, self.dispatcher.queue_depth)
+        self.assertEqual(3, self.dispatcher.dropped_count)
+        self._drain()
+        self.assertListEqual([3, 4], [e.price["Bid"] for e in recorder.events])
+
+    def test_conflate_policy_merges_partial_updates_of_a_subject(self):
+        recorder = Recorder()
+        self.callbacks.price_event_fn = recorder
+        self.dispatcher = CallbackDispatcher(
+            self.callbacks, queue_size=2, overflow="conflate"
+        )
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1, "Ask": 2}, True))
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT2, {"Bid": 5}, True))
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Ask": 3}, False))
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 4}, False))
+        self.assertEqual(2, self.dispatcher.queue_depth)
+        self.assertEqual(2, self.dispatcher.conflated_count)
+        self._drain()
+        self.assertEqual({"Bid": 4, "Ask": 3}, recorder.events[0].price)
+        self.assertTrue(recorder.events[0].full)
+        self.assertEqual({"Bid": 5}, recorder.events[1].price)
+
+    def test_conflate_policy_replaces_with_a_full_update(self):
+        recorder = Recorder()
+        self.callbacks.price_event_fn = recorder
+        self.dispatcher = CallbackDispatcher(
+            self.callbacks, queue_size=1, overflow="conflate"
+        )
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1, "Ask": 2}, True))
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 3}, True))
+        self._drain()
+        self.assertEqual({"Bid": 3}, recorder.events[0].price)
+
+    def test_batches_are_split_by_worker(self):
+        recorder = Recorder()
+        self.callbacks.price_batch_fn = recorder
+        self.dispatcher = CallbackDispatcher(self.callbacks, threads=2)
+        events = [PriceEvent(s, {}, True) for s in (SUBJECT1, SUBJECT2, SUBJECT1)]
+        self.dispatcher.price_batch_fn(PriceBatchEvent(events, 2, 7, 1000))
+        self._drain()
+        published = [e for batch in recorder.events for e in batch]
+        self.assertEqual(3, len(published))
+        self.assertTrue(all(batch.revision == 7 for batch in recorder.events))
+
+    def test_batch_fn_is_only_offered_when_set(self):
+        self.dispatcher = CallbackDispatcher(self.callbacks)
+        self.assertIsNone(self.dispatcher.price_batch_fn)
+        self.callbacks.price_batch_fn = print
+        self.assertIsNotNone(self.dispatcher.price_batch_fn)
+
+    def test_failing_callback_does_not_stop_the_worker(self):
+        recorder = Recorder(expected=1)
+        self.callbacks.price_event_fn = lambda e: 1 / 0
+        self.callbacks.provider_event_fn = recorder
+        self.dispatcher = CallbackDispatcher(self.callbacks)
+        self.dispatcher.start()
+        with self.assertLogs("bidfx.pricing.dispatcher"):
+            self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {}, True))
+            self.dispatcher.provider_event_fn(
+                ProviderEvent("Pixie-1", ProviderStatus.READY, "")
+            )
+            self.assertTrue(recorder.done.wait(5))
+
+    def test_unsupported_overflow_policy(self):
+        self.dispatcher = CallbackDispatcher(self.callbacks)
+        with self.assertRaises(PricingError):
+            CallbackDispatcher(self.callbacks, overflow="spill")
+
+    def _drain(self):
+        for queue in self.dispatcher._queues:
+            while len(queue):
+                entry = queue.take()
+                entry[0](entry[1])
+
+
+class TestConflatingDelivery(TestCase):
+    def setUp(self):
+        self.callbacks = Callbacks()
+        self.dispatcher = CallbackDispatcher(self.callbacks, conflate=True)
+
+    def tearDown(self):
+        self.dispatcher.stop()
+
+    def test_updates_are_merged_while_the_consumer_is_busy(self):
+        gate = threading.Event()
+        recorder = Recorder(expected=3)
+
+        def on_price_event(event):
+            gate.wait(5)
+            recorder(event)
+
+        self.callbacks.price_event_fn = on_price_event
+        self.dispatcher.start()
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1, "Ask": 1}, True))
+        self._wait_for_empty_queue()
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 2}, False))
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT2, {"Bid": 5}, True))
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Ask": 3}, False))
+        self.assertEqual(2, self.dispatcher.queue_depth)
+        self.assertEqual(1, self.dispatcher.conflated_count)
+        gate.set()
+        self.assertTrue(recorder.done.wait(5))
+        self.assertEqual({"Bid": 2, "Ask": 3}, recorder.events[1].price)
+        self.assertFalse(recorder.events[1].full)
+        self.assertEqual(SUBJECT2, recorder.events[2].subject)
+
+    def test_partial_updates_are_merged_into_a_full_image(self):
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1, "Ask": 1}, True))
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 2}, False))
+        recorder = self._start_and_record(expected=1)
+        self.assertEqual({"Bid": 2, "Ask": 1}, recorder.events[0].price)
+        self.assertTrue(recorder.events[0].full)
+
+    def test_prices_are_not_merged_across_a_status_event(self):
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1}, True))
+        self.dispatcher.subscription_event_fn(
+            SubscriptionEvent(SUBJECT1, SubscriptionStatus.STALE, "")
+        )
+        self.dispatcher.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 2}, True))
+        self.assertEqual(3, self.dispatcher.queue_depth)
+        self.assertEqual(0, self.dispatcher.conflated_count)
+
+    def test_batches_are_conflated_and_report_the_conflation_latency(self):
+        self.callbacks.price_batch_fn = Recorder(expected=1)
+        events = [
+            PriceEvent(SUBJECT1, {"Bid": 1}, True),
+            PriceEvent(SUBJECT2, {"Bid": 5}, True),
+            PriceEvent(SUBJECT1, {"Bid": 2}, False),
+        ]
+        self.dispatcher.price_batch_fn(PriceBatchEvent(events, 2, 7, 1000, 30))
+        self.dispatcher.start()
+        self.assertTrue(self.callbacks.price_batch_fn.done.wait(5))
+        batch = self.callbacks.price_batch_fn.events[0]
+        self.assertEqual(2, len(batch))
+        self.assertEqual({"Bid": 2}, batch.events[0].price)
+        self.assertEqual(30, batch.conflation_latency)
+        self.assertEqual(30, self.dispatcher.conflation_latency)
+
+    def test_batch_fn_is_always_offered(self):
+        self.assertIsNotNone(self.dispatcher.price_batch_fn)
+
+    def _start_and_record(self, expected):
+        recorder = Recorder(expected)
+        self.callbacks.price_event_fn = recorder
+        self.dispatcher.start()
+        self.assertTrue(recorder.done.wait(5))
+        return recorder
+
+    def _wait_for_empty_queue(self):
+        for _ in range(500):
+            if not self.dispatcher.queue_depth:
+                return
+            threading.Event().wait(0.01)
+
+
+class TestDispatcherFromConfig(TestCase):
+    def setUp(self):
+        self.config = ConfigParser()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(dispatcher_from_config(self.config["DEFAULT"], Callbacks()))
+
+    def test_enabled_by_dispatch_threads(self):
+        self.config.read_string(
+            "[DEFAULT]\ndispatch_threads = 2\ndispatch_overflow = Conflate\n"
+        )
+        dispatcher = dispatcher_from_config(self.config["DEFAULT"], Callbacks())
+        self.assertEqual(2, len(dispatcher._queues))
+        self.assertFalse(dispatcher._conflate)
+
+    def test_conflating_delivery(self):
+        self.config.read_string(
+            "[DEFAULT]\ndispatch_threads = 1\ndispatch_conflate = yes\n"
+        )
+        dispatcher = dispatcher_from_config(self.config["DEFAULT"], Callbacks())
+        self.assertTrue(dispatcher._conflate)
@@ -3,6 +3,7 @@ from unittest import TestCase
 from bidfx import Subject
 from bidfx.pricing import (
     PriceEvent,
+    PriceBatchEvent,
     SubscriptionEvent,
     SubscriptionStatus,
     ProviderEvent,
@@ -71,6 +72,35 @@ class TestPriceEvent(TestCase):
         )
 
 
+class TestPriceBatchEvent(TestCase):
+    def setUp(self):
+        self.events = [PriceEvent(SUBJECT, PRICE, True), PriceEvent(SUBJECT, {}, False)]
+        self.batch = PriceBatchEvent(self.events, 4, 7, 1542372218934)
+
+    def test_get_events(self):
+        self.assertEqual(self.events, self.batch.events)
+        self.assertEqual(self.events, list(self.batch))
+        self.assertEqual(2, len(self.batch))
+
+    def test_get_sync_metadata(self):
+        self.assertEqual(4, self.batch.edition)
+        self.assertEqual(7, self.batch.revision)
+        self.assertEqual(1542372218934, self.batch.revision_time)
+
+    def test_metadata_defaults_to_none(self):
+        batch = PriceBatchEvent(self.events)
+        self.assertIsNone(batch.edition)
+        self.assertIsNone(batch.revision)
+        self.assertIsNone(batch.revision_time)
+        self.assertIsNone(batch.conflation_latency)
+
+    def test_string(self):
+        self.assertEqual(
+            "PriceBatchEvent of 2 edition:4 revision:7 revision time:1542372218934",
+            str(self.batch),
+        )
+
+
 class TestSubscriptionEvent(TestCase):
     def setUp(self):
         self.event = SubscriptionEvent(SUBJECT, SubscriptionStatus.STALE, "line down")
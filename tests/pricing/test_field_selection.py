@@ -0,0 +1,39 @@
+import unittest
+
+from bidfx import Subject
+from bidfx.pricing._field_selection import FieldSelection
+
+EURUSD = Subject.parse_string(
+    "AssetClass=Fx,Exchange=OTC,Level=1,Source=Indi,Symbol=EURUSD"
+)
+USDJPY = Subject.parse_string(
+    "AssetClass=Fx,Exchange=OTC,Level=1,Source=Indi,Symbol=USDJPY"
+)
+
+
+class TestFieldSelection(unittest.TestCase):
+    def setUp(self):
+        self.selection = FieldSelection()
+
+    def test_all_fields_are_selected_by_default(self):
+        self.assertTrue(self.selection.is_empty())
+        self.assertIsNone(self.selection.fields_for(EURUSD))
+
+    def test_global_selection(self):
+        self.selection.select(["Bid", "Ask"])
+        self.assertFalse(self.selection.is_empty())
+        self.assertEqual(frozenset(["Bid", "Ask"]), self.selection.fields_for(EURUSD))
+
+    def test_subject_selection_takes_precedence(self):
+        self.selection.select(["Bid", "Ask"])
+        self.selection.select(["Bid"], EURUSD)
+        self.assertEqual(frozenset(["Bid"]), self.selection.fields_for(EURUSD))
+        self.assertEqual(frozenset(["Bid", "Ask"]), self.selection.fields_for(USDJPY))
+
+    def test_clear_selections(self):
+        self.selection.select(["Bid"])
+        self.selection.select(["Ask"], EURUSD)
+        self.selection.select(None, EURUSD)
+        self.assertEqual(frozenset(["Bid"]), self.selection.fields_for(EURUSD))
+        self.selection.select(None)
+        self.assertTrue(self.selection.is_empty())
@@ -0,0 +1,95 @@
+import threading
+from unittest import TestCase
+
+from bidfx.pricing._message_writer import MessageWriter
+
+
+class BlockingConnection:
+    """Records each write, holding up the first until released."""
+
+    def __init__(self, expected_writes):
+        self.writes = []
+        self.release = threading.Event()
+        self.done = threading.Event()
+        self.expected_writes = expected_writes
+
+    def write(self, messages):
+        if not self.writes:
+            self.release.wait(5)
+        self.writes.append(messages)
+        if len(self.writes) >= self.expected_writes:
+            self.done.set()
+
+
+class TestMessageWriter(TestCase):
+    def setUp(self):
+        self.errors = []
+
+    def tearDown(self):
+        self.writer.stop()
+
+    def test_messages_queued_during_a_write_are_written_together(self):
+        connection = BlockingConnection(expected_writes=2)
+        self.writer = MessageWriter("Test", connection.write, self.errors.append)
+        self.writer.start()
+        self.writer.send("a")
+        self._wait_for_empty_queue()
+        self.writer.send("b")
+        self.writer.send("c")
+        connection.release.set()
+        self.assertTrue(connection.done.wait(5))
+        self.assertListEqual([["a"], ["b", "c"]], connection.writes)
+        self.assertEqual(3, self.writer.messages)
+        self.assertEqual(2, self.writer.writes)
+
+    def test_queued_messages_of_the_same_kind_are_replaced(self):
+        connection = BlockingConnection(expected_writes=2)
+        self.writer = MessageWriter(
+            "Test",
+            connection.write,
+            self.errors.append,
+            kind_of=lambda m: m.rstrip("0123456789") if m != "sync" else None,
+        )
+        self.writer.start()
+        self.writer.send("sync")
+        self._wait_for_empty_queue()
+        for message in ("ack1", "heartbeat", "sync", "ack2", "heartbeat", "ack3"):
+            self.writer.send(message)
+        connection.release.set()
+        self.assertTrue(connection.done.wait(5))
+        self.assertListEqual(["ack3", "heartbeat", "sync"], connection.writes[1])
+        self.assertEqual(3, self.writer.superseded)
+
+    def test_latency_is_measured(self):
+        connection = BlockingConnection(expected_writes=1)
+        connection.release.set()
+        self.writer = MessageWriter("Test", connection.write, self.errors.append)
+        self.writer.start()
+        self.writer.send("a")
+        self.assertTrue(connection.done.wait(5))
+        self._wait_for(lambda: self.writer.writes == 1)
+        self.assertGreater(self.writer.last_latency, 0)
+        self.assertEqual(self.writer.last_latency, self.writer.max_latency)
+        self.assertEqual(self.writer.last_latency, self.writer.mean_latency)
+        self.assertIn("wrote 1 messages in 1 writes", str(self.writer))
+
+    def test_write_error_is_reported_and_stops_the_writer(self):
+        def fail(messages):
+            raise OSError("broken pipe")
+
+        self.writer = MessageWriter("Test", fail, self.errors.append)
+        self.writer.start()
+        with self.assertLogs("bidfx.pricing.writer"):
+            self.writer.send("a")
+            self._wait_for(lambda: self.errors)
+        self.assertEqual("broken pipe", str(self.errors[0]))
+
+    def _wait_for_empty_queue(self):
+        self._wait_for(lambda: not self.writer._queue)
+
+    @staticmethod
+    def _wait_for(condition):
+        for _ in range(500):
+            if condition():
+                return
+            threading.Event().wait(0.01)
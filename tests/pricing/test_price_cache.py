@@ -0,0 +1,115 @@
+from configparser import ConfigParser
+from unittest import TestCase
+
+from bidfx import (
+    Callbacks,
+    PriceBatchEvent,
+    PriceCache,
+    PriceEvent,
+    PricingAPI,
+    PricingError,
+    Subject,
+    SubscriptionEvent,
+    SubscriptionStatus,
+)
+
+SUBJECT1 = Subject.parse_string("Source=A,Symbol=EURGBP")
+SUBJECT2 = Subject.parse_string("Source=A,Symbol=GBPAUD")
+
+
+def disabled_config(price_cache):
+    config = ConfigParser()
+    config.read_string(
+        f"[DEFAULT]\nusername = user\ndefault_account = ACCT\ndisable = true\n"
+        f"price_cache = {price_cache}\n[Exclusive Pricing]\n[Shared Pricing]\n"
+    )
+    return config
+
+
+class TestPriceCache(TestCase):
+    def setUp(self):
+        self.callbacks = Callbacks()
+        self.published = []
+        self.callbacks.price_event_fn = self.published.append
+        self.callbacks.subscription_event_fn = self.published.append
+        self.cache = PriceCache(self.callbacks)
+
+    def test_partial_updates_are_merged_into_the_full_image(self):
+        self.cache.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1, "Ask": 2}, True))
+        self.cache.price_event_fn(PriceEvent(SUBJECT1, {"Ask": 3}, False))
+        self.assertDictEqual({"Bid": 1, "Ask": 3}, dict(self.cache.snapshot(SUBJECT1)))
+
+    def test_full_image_replaces_the_cached_image(self):
+        self.cache.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1, "Ask": 2}, True))
+        self.cache.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 4}, True))
+        self.assertDictEqual({"Bid": 4}, dict(self.cache.snapshot(SUBJECT1)))
+
+    def test_snapshot_is_read_only_and_never_changes(self):
+        self.cache.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1}, True))
+        snapshot = self.cache.snapshot(SUBJECT1)
+        self.cache.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 2}, False))
+        self.assertEqual(1, snapshot["Bid"])
+        with self.assertRaises(TypeError):
+            snapshot["Bid"] = 3
+
+    def test_cached_image_is_independent_of_the_event(self):
+        price = {"Bid": 1}
+        self.cache.price_event_fn(PriceEvent(SUBJECT1, price, True))
+        price["Bid"] = 2
+        self.assertEqual(1, self.cache.snapshot(SUBJECT1)["Bid"])
+
+    def test_no_snapshot_without_a_price(self):
+        self.assertIsNone(self.cache.snapshot(SUBJECT1))
+        self.assertNotIn(SUBJECT1, self.cache)
+
+    def test_batches_are_cached_and_published(self):
+        batch = PriceBatchEvent(
+            [
+                PriceEvent(SUBJECT1, {"Bid": 1}, True),
+                PriceEvent(SUBJECT2, {"Bid": 2}, True),
+            ]
+        )
+        self.cache.price_batch_fn(batch)
+        snapshots = self.cache.snapshot_all()
+        self.assertEqual({SUBJECT1, SUBJECT2}, set(snapshots))
+        self.assertEqual(2, snapshots[SUBJECT2]["Bid"])
+        self.assertListEqual(batch.events, self.published)
+
+    def test_batches_are_published_to_the_batch_callback_when_set(self):
+        batches = []
+        self.callbacks.price_batch_fn = batches.append
+        batch = PriceBatchEvent([PriceEvent(SUBJECT1, {"Bid": 1}, True)])
+        self.cache.price_batch_fn(batch)
+        self.assertListEqual([batch], batches)
+        self.assertListEqual([], self.published)
+
+    def test_status_change_drops_the_image(self):
+        self.cache.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1}, True))
+        event = SubscriptionEvent(SUBJECT1, SubscriptionStatus.STALE, "down")
+        self.cache.subscription_event_fn(event)
+        self.assertIsNone(self.cache.snapshot(SUBJECT1))
+        self.assertIs(event, self.published[-1])
+
+    def test_discard(self):
+        self.cache.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1}, True))
+        self.cache.discard(SUBJECT1)
+        self.cache.discard(SUBJECT2)
+        self.assertEqual(0, len(self.cache))
+
+
+class TestPricingAPISnapshot(TestCase):
+    def test_price_cache_is_enabled_by_config(self):
+        pricing = PricingAPI(disabled_config("true"))
+        self.assertIsInstance(pricing.price_cache, PriceCache)
+        self.assertIs(pricing.price_cache, pricing._provider_callbacks)
+        pricing.price_cache.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1}, True))
+        self.assertEqual(1, pricing.snapshot(SUBJECT1)["Bid"])
+        self.assertEqual([SUBJECT1], list(pricing.snapshot_all()))
+        pricing.unsubscribe(SUBJECT1)
+        self.assertIsNone(pricing.snapshot(SUBJECT1))
+
+    def test_snapshot_requires_the_price_cache(self):
+        pricing = PricingAPI(disabled_config("false"))
+        self.assertIsNone(pricing.price_cache)
+        with self.assertRaises(PricingError):
+            pricing.snapshot(SUBJECT1)
@@ -0,0 +1,44 @@
+import unittest
+from configparser import ConfigParser
+
+from bidfx import PricingError, ScaledValue
+from bidfx.pricing._price_values import (
+    price_values_from_config,
+    number_from_text,
+    scaled_from_text,
+)
+
+
+class TestPriceValues(unittest.TestCase):
+    def test_string_values_are_the_default(self):
+        self.assertEqual("string", price_values_from_config(self._section()))
+
+    def test_price_values_from_config(self):
+        self.assertEqual("numeric", price_values_from_config(self._section("numeric")))
+        self.assertEqual("scaled", price_values_from_config(self._section("Scaled")))
+
+    def test_unsupported_price_values_from_config(self):
+        with self.assertRaises(PricingError):
+            price_values_from_config(self._section("decimal"))
+
+    def test_number_from_text(self):
+        self.assertEqual(1000, number_from_text("1000"))
+        self.assertIsInstance(number_from_text("1000"), int)
+        self.assertEqual(100.5, number_from_text("100.5"))
+        self.assertEqual(-0.25, number_from_text("-0.25"))
+        self.assertEqual("n/a", number_from_text("n/a"))
+
+    def test_scaled_from_text(self):
+        self.assertEqual(ScaledValue(1005, 1), scaled_from_text("100.5"))
+        self.assertEqual(ScaledValue(-25, 2), scaled_from_text("-0.25"))
+        self.assertEqual(ScaledValue(123450, 5), scaled_from_text("1.23450"))
+        self.assertEqual(1000, scaled_from_text("1000"))
+        self.assertEqual(1.5e-7, scaled_from_text("1.5E-7"))
+
+    @staticmethod
+    def _section(price_values=None):
+        config = ConfigParser()
+        config["Shared Pricing"] = {}
+        if price_values:
+            config["Shared Pricing"]["price_values"] = price_values
+        return config["Shared Pricing"]
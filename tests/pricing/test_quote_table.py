@@ -0,0 +1,168 @@
+import math
+from configparser import ConfigParser
+from unittest import TestCase, skipIf
+
+from bidfx import (
+    Callbacks,
+    PriceBatchEvent,
+    PriceEvent,
+    PricingAPI,
+    PricingError,
+    QuoteTable,
+    ScaledValue,
+    Subject,
+    SubscriptionEvent,
+    SubscriptionStatus,
+)
+from bidfx.pricing.quote_table import numpy
+
+SUBJECT1 = Subject.parse_string("Source=A,Symbol=EURGBP")
+SUBJECT2 = Subject.parse_string("Source=A,Symbol=GBPAUD")
+SUBJECT3 = Subject.parse_string("Source=A,Symbol=USDJPY")
+
+
+@skipIf(numpy is None, "NumPy is not installed")
+class TestQuoteTable(TestCase):
+    def setUp(self):
+        self.callbacks = Callbacks()
+        self.published = []
+        self.callbacks.price_event_fn = self.published.append
+        self.callbacks.subscription_event_fn = self.published.append
+        self.table = QuoteTable(
+            self.callbacks, ["Bid", "Ask"], ["OriginTime"], capacity=2
+        )
+
+    def test_subjects_are_assigned_rows(self):
+        self.assertEqual(0, self.table.add(SUBJECT1))
+        self.assertEqual(1, self.table.add(SUBJECT2))
+        self.assertEqual(0, self.table.add(SUBJECT1))
+        self.assertEqual(1, self.table.row(SUBJECT2))
+        self.assertListEqual([SUBJECT1, SUBJECT2], self.table.subjects())
+
+    def test_prices_are_written_into_the_columns(self):
+        self.table.add(SUBJECT1)
+        self.table.add(SUBJECT2)
+        self.table.price_event_fn(
+            PriceEvent(SUBJECT2, {"Bid": "1.5", "Ask": 1.7, "OriginTime": 123}, True)
+        )
+        self.table.price_event_fn(
+            PriceEvent(SUBJECT1, {"Bid": ScaledValue(11, 1)}, True)
+        )
+        bids = self.table.column("Bid")
+        self.assertListEqual([1.1, 1.5], bids.tolist())
+        self.assertTrue(math.isnan(self.table.column("Ask")[0]))
+        self.assertListEqual([0, 123], self.table.column("OriginTime").tolist())
+        self.assertEqual(numpy.int64, self.table.column("OriginTime").dtype)
+        self.assertEqual(2, len(self.published))
+
+    def test_partial_updates_keep_other_values_and_full_updates_clear_them(self):
+        self.table.add(SUBJECT1)
+        self.table.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1, "Ask": 2}, True))
+        self.table.price_event_fn(PriceEvent(SUBJECT1, {"Ask": 3}, False))
+        self.assertListEqual([1.0, 3.0], self._row(SUBJECT1))
+        self.table.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 4}, True))
+        self.assertEqual(4.0, self._row(SUBJECT1)[0])
+        self.assertTrue(math.isnan(self._row(SUBJECT1)[1]))
+
+    def test_columns_are_zero_copy_views(self):
+        self.table.add(SUBJECT1)
+        bids = self.table.column("Bid")
+        self.table.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1}, True))
+        self.assertEqual(1.0, bids[0])
+
+    def test_copy_is_independent_of_later_updates(self):
+        self.table.add(SUBJECT1)
+        self.table.price_batch_fn(
+            PriceBatchEvent([PriceEvent(SUBJECT1, {"Bid": 1, "Ask": 2}, True)])
+        )
+        subjects, columns = self.table.copy(["Bid"])
+        self.table.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 5}, False))
+        self.assertListEqual([SUBJECT1], subjects)
+        self.assertListEqual(["Bid"], list(columns))
+        self.assertEqual(1.0, columns["Bid"][0])
+
+    def test_rows_of_removed_subjects_are_cleared_and_recycled(self):
+        self.table.add(SUBJECT1)
+        self.table.add(SUBJECT2)
+        self.table.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1}, True))
+        self.table.remove(SUBJECT1)
+        self.assertIsNone(self.table.row(SUBJECT1))
+        self.assertListEqual([None, SUBJECT2], self.table.subjects())
+        self.assertEqual(0, self.table.add(SUBJECT3))
+        self.assertTrue(math.isnan(self.table.column("Bid")[0]))
+        self.assertEqual(2, len(self.table))
+
+    def test_columns_grow_beyond_the_initial_capacity(self):
+        self.table.add(SUBJECT1)
+        self.table.add(SUBJECT2)
+        self.table.price_event_fn(PriceEvent(SUBJECT2, {"Bid": 2}, True))
+        self.assertEqual(2, self.table.add(SUBJECT3))
+        self.table.price_event_fn(PriceEvent(SUBJECT3, {"Bid": 3}, True))
+        self.assertListEqual([2.0, 3.0], self.table.column("Bid")[1:].tolist())
+
+    def test_prices_of_subjects_without_rows_are_ignored(self):
+        self.table.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1}, True))
+        self.assertEqual(0, len(self.table.column("Bid")))
+        self.assertEqual(1, len(self.published))
+
+    def test_non_numeric_values_clear_the_cell(self):
+        self.table.add(SUBJECT1)
+        self.table.price_event_fn(
+            PriceEvent(SUBJECT1, {"Bid": 1, "OriginTime": 5}, True)
+        )
+        with self.assertLogs("bidfx.pricing.quote_table", "DEBUG"):
+            self.table.price_event_fn(
+                PriceEvent(SUBJECT1, {"Bid": "n/a", "OriginTime": "n/a"}, False)
+            )
+        self.assertTrue(math.isnan(self.table.column("Bid")[0]))
+        self.assertEqual(0, self.table.column("OriginTime")[0])
+
+    def test_status_change_clears_the_row(self):
+        self.table.add(SUBJECT1)
+        self.table.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1}, True))
+        self.table.subscription_event_fn(
+            SubscriptionEvent(SUBJECT1, SubscriptionStatus.STALE, "down")
+        )
+        self.assertTrue(math.isnan(self.table.column("Bid")[0]))
+        self.assertIn(SUBJECT1, self.table)
+
+    def _row(self, subject):
+        row = self.table.row(subject)
+        return [self.table.column(field)[row] for field in ("Bid", "Ask")]
+
+
+@skipIf(numpy is None, "NumPy is not installed")
+class TestPricingAPIQuoteTable(TestCase):
+    def test_quote_table_is_enabled_by_config(self):
+        config = ConfigParser()
+        config.read_string(
+            "[DEFAULT]\nusername = user\ndefault_account = ACCT\ndisable = true\n"
+            "quote_table_fields = Bid, Ask\n[Exclusive Pricing]\n[Shared Pricing]\n"
+        )
+        pricing = PricingAPI(config)
+        table = pricing.quote_table
+        self.assertListEqual(["Bid", "Ask"], table.fields)
+        self.assertIs(table, pricing._provider_callbacks)
+        pricing.subscribe_many([SUBJECT1, SUBJECT2])
+        self.assertEqual(1, table.row(SUBJECT2))
+        pricing.unsubscribe(SUBJECT1)
+        self.assertNotIn(SUBJECT1, table)
+
+    def test_subjects_rejected_by_the_provider_have_no_rows(self):
+        config = ConfigParser()
+        config.read_string(
+            "[DEFAULT]\nusername = user\ndefault_account = ACCT\ndisable = true\n"
+            "quote_table_fields = Bid\n[Exclusive Pricing]\n[Shared Pricing]\n"
+        )
+        pricing = PricingAPI(config)
+
+        def reject(subjects):
+            raise PricingError("rejected")
+
+        pricing._puffin_provider.subscribe = reject
+        pricing._puffin_provider.subscribe_many = reject
+        with self.assertRaises(PricingError):
+            pricing.subscribe(SUBJECT1)
+        with self.assertRaises(PricingError):
+            pricing.subscribe_many([SUBJECT2])
+        self.assertEqual(0, len(pricing.quote_table))
@@ -0,0 +1,111 @@
+import socket
+import threading
+import time
+from unittest import TestCase
+
+from bidfx.pricing._reactor import Reactor, shared_reactor
+
+
+class Connection:
+    """Records what the reactor reads from one end of a socket pair."""
+
+    def __init__(self, reactor, name="Test"):
+        self.client, self.server = socket.socketpair()
+        self.received = bytearray()
+        self.readable = threading.Event()
+        self.closed = threading.Event()
+        self.error = None
+        self.channel = reactor.register(
+            name, self.client, self._on_readable, self._on_closed
+        )
+
+    def _on_readable(self):
+        while True:
+            try:
+                data = self.client.recv(4096)
+            except BlockingIOError:
+                return
+            if not data:
+                raise ConnectionResetError("end of socket stream")
+            self.received += data
+            self.readable.set()
+
+    def _on_closed(self, error):
+        self.error = error
+        self.closed.set()
+
+    def receive(self, size):
+        self.server.settimeout(5)
+        data = bytearray()
+        while len(data) < size:
+            data += self.server.recv(size - len(data))
+        return bytes(data)
+
+
+class TestReactor(TestCase):
+    def setUp(self):
+        self.reactor = Reactor()
+        self.connections = []
+
+    def tearDown(self):
+        for connection in self.connections:
+            connection.server.close()
+            connection.channel.close()
+
+    def connect(self, name="Test"):
+        connection = Connection(self.reactor, name)
+        self.connections.append(connection)
+        return connection
+
+    def test_reads_many_connections_from_one_thread(self):
+        connections = [self.connect(f"Test-{i}") for i in range(10)]
+        for i, connection in enumerate(connections):
+            connection.server.sendall(b"price %d" % i)
+        for i, connection in enumerate(connections):
+            self.assertTrue(connection.readable.wait(5))
+            self.assertEqual(b"price %d" % i, bytes(connection.received))
+        reactor_threads = [
+            t for t in threading.enumerate() if t.name == "bidfx-reactor"
+        ]
+        self.assertIn(self.reactor._thread, reactor_threads)
+
+    def test_writes_from_any_thread_are_sent_in_order(self):
+        connection = self.connect()
+        writers = [
+            threading.Thread(target=connection.channel.write, args=(b"%d," % i,))
+            for i in range(5)
+        ]
+        for writer in writers:
+            writer.start()
+            writer.join()
+        self.assertEqual(b"0,1,2,3,4,", connection.receive(10))
+
+    def test_large_writes_wait_for_the_socket_to_be_writable(self):
+        connection = self.connect()
+        data = bytes(range(256)) * 8192
+        connection.channel.write(data)
+        self.assertEqual(data, connection.receive(len(data)))
+        # The reactor counts the bytes only after send() returns, which can be after they arrive.
+        deadline = time.monotonic() + 5
+        while (
+            connection.channel.bytes_written < len(data)
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.001)
+        self.assertEqual(len(data), connection.channel.bytes_written)
+
+    def test_end_of_stream_closes_the_channel(self):
+        connection = self.connect()
+        connection.server.close()
+        self.assertTrue(connection.closed.wait(5))
+        self.assertEqual("end of socket stream", str(connection.error))
+
+    def test_close_reports_the_reason(self):
+        connection = self.connect()
+        connection.channel.close(TimeoutError("silent"))
+        self.assertTrue(connection.closed.wait(5))
+        self.assertEqual("silent", str(connection.error))
+        connection.channel.write(b"ignored")
+
+    def test_reactor_is_shared(self):
+        self.assertIs(shared_reactor(), shared_reactor())
@@ -0,0 +1,25 @@
+import unittest
+
+from bidfx import ScaledValue
+
+
+class TestScaledValue(unittest.TestCase):
+    def test_float_conversion(self):
+        self.assertEqual(1.23456, float(ScaledValue(1234560, 6)))
+        self.assertEqual(-0.0025, float(ScaledValue(-25, 4)))
+        self.assertEqual(100.0, float(ScaledValue(100, 0)))
+
+    def test_str_is_exact_decimal(self):
+        self.assertEqual("1.234560", str(ScaledValue(1234560, 6)))
+        self.assertEqual("-0.0025", str(ScaledValue(-25, 4)))
+        self.assertEqual("0.5", str(ScaledValue(5, 1)))
+        self.assertEqual("100", str(ScaledValue(100, 0)))
+
+    def test_equality_and_hash(self):
+        self.assertEqual(ScaledValue(15, 1), ScaledValue(15, 1))
+        self.assertNotEqual(ScaledValue(15, 1), ScaledValue(150, 2))
+        self.assertNotEqual(ScaledValue(15, 1), 1.5)
+        self.assertEqual(hash(ScaledValue(15, 1)), hash(ScaledValue(15, 1)))
+
+    def test_repr(self):
+        self.assertEqual("ScaledValue(15, 1)", repr(ScaledValue(15, 1)))
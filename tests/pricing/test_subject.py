@@ -1,3 +1,6 @@
+import copy
+import gc
+import pickle
 from unittest import TestCase
 
 from bidfx import Subject
@@ -250,3 +253,61 @@ class TestSubjectFlatten(TestCase):
                 "AssetClass=Fx,Currency=GBP,Quantity=10000.00,Symbol=GBPJPY"
             ).flatten(),
         )
+
+
+class TestSubjectCaching(TestCase):
+    def setUp(self):
+        self.subject = Subject.parse_string(
+            "AssetClass=Fx,Currency=GBP,Quantity=10000.00,Symbol=GBPJPY"
+        )
+
+    def test_string_form_is_computed_once(self):
+        self.assertIs(str(self.subject), str(self.subject))
+
+    def test_hash_matches_equal_subject(self):
+        subject2 = Subject.parse_string(str(self.subject))
+        self.assertEqual(hash(self.subject), hash(subject2))
+        self.assertEqual(self.subject, subject2)
+
+    def test_subjects_with_the_same_keys_share_their_key_positions(self):
+        subject2 = Subject.parse_string(
+            "AssetClass=Fx,Currency=USD,Quantity=50000.00,Symbol=USDJPY"
+        )
+        self.assertIs(self.subject._positions, subject2._positions)
+        self.assertEqual("USDJPY", subject2[Subject.SYMBOL])
+
+    def test_first_of_repeated_keys_is_found(self):
+        subject = Subject((("Symbol", "GBPJPY"), ("Symbol", "EURUSD")))
+        self.assertEqual("GBPJPY", subject[Subject.SYMBOL])
+
+    def test_attributes_cannot_be_added(self):
+        with self.assertRaises(AttributeError):
+            self.subject.extra = 1
+
+
+class TestSubjectInterning(TestCase):
+    def test_equal_subjects_are_the_same_instance(self):
+        subject = Subject.parse_string("AssetClass=Fx,Currency=GBP,Symbol=GBPJPY")
+        self.assertIs(
+            subject,
+            Subject.from_dict(
+                {"Symbol": "GBPJPY", "Currency": "GBP", "AssetClass": "Fx"}
+            ),
+        )
+
+    def test_components_may_be_given_as_a_list(self):
+        subject = Subject([("AssetClass", "Fx"), ("Symbol", "GBPJPY")])
+        self.assertIs(subject, Subject.parse_string("AssetClass=Fx,Symbol=GBPJPY"))
+
+    def test_unused_subjects_are_released(self):
+        subject = Subject.parse_string("AssetClass=Fx,Symbol=XAUXAG")
+        self.assertIn(subject._components, Subject._interned)
+        components = subject._components
+        del subject
+        gc.collect()
+        self.assertNotIn(components, Subject._interned)
+
+    def test_unpickled_subject_is_interned(self):
+        subject = Subject.parse_string("AssetClass=Fx,Symbol=GBPJPY")
+        self.assertIs(subject, pickle.loads(pickle.dumps(subject)))
+        self.assertIs(subject, copy.deepcopy(subject))
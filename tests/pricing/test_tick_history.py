@@ -0,0 +1,118 @@
+import math
+from configparser import ConfigParser
+from unittest import TestCase, mock
+
+from bidfx import (
+    Callbacks,
+    PriceBatchEvent,
+    PriceEvent,
+    PricingAPI,
+    Subject,
+    TickHistory,
+)
+
+SUBJECT1 = Subject.parse_string("Source=A,Symbol=EURGBP")
+SUBJECT2 = Subject.parse_string("Source=A,Symbol=GBPAUD")
+
+
+class TestTickHistory(TestCase):
+    def setUp(self):
+        self.callbacks = Callbacks()
+        self.published = []
+        self.callbacks.price_event_fn = self.published.append
+        self.history = TickHistory(self.callbacks, ["Bid", "Ask"], size=4)
+        self.now = 1000.0
+
+    def tick(self, subject, price, full=False):
+        with mock.patch("bidfx.pricing.tick_history.time.time", return_value=self.now):
+            self.history.price_event_fn(PriceEvent(subject, price, full))
+        self.now += 1
+
+    def test_ticks_are_recorded_and_published(self):
+        self.tick(SUBJECT1, {"Bid": "1.5", "Ask": 1.6}, True)
+        window = self.history.last(SUBJECT1)
+        self.assertListEqual([1.5], window["Bid"].tolist())
+        self.assertListEqual([1.6], window["Ask"].tolist())
+        self.assertListEqual([1000.0], window[TickHistory.RECEIVE_TIME].tolist())
+        self.assertEqual(1, len(self.published))
+
+    def test_partial_updates_carry_forward_missing_fields(self):
+        self.tick(SUBJECT1, {"Bid": 1, "Ask": 2}, True)
+        self.tick(SUBJECT1, {"Ask": 3})
+        self.tick(SUBJECT1, {"Bid": 4}, True)
+        window = self.history.last(SUBJECT1)
+        self.assertListEqual([1.0, 1.0, 4.0], window["Bid"].tolist())
+        self.assertListEqual([2.0, 3.0], window["Ask"].tolist()[:2])
+        self.assertTrue(math.isnan(window["Ask"][2]))
+
+    def test_oldest_ticks_are_overwritten(self):
+        for bid in range(6):
+            self.tick(SUBJECT1, {"Bid": bid})
+        self.assertEqual(4, self.history.count(SUBJECT1))
+        self.assertListEqual(
+            [2.0, 3.0, 4.0, 5.0], self.history.last(SUBJECT1)["Bid"].tolist()
+        )
+        self.assertListEqual([4.0, 5.0], self.history.last(SUBJECT1, 2)["Bid"].tolist())
+
+    def test_since_timestamp(self):
+        for bid in range(6):
+            self.tick(SUBJECT1, {"Bid": bid})
+        window = self.history.since(SUBJECT1, 1003.0, ["Bid", TickHistory.RECEIVE_TIME])
+        self.assertListEqual([3.0, 4.0, 5.0], window["Bid"].tolist())
+        self.assertListEqual(
+            [1003.0, 1004.0, 1005.0], window[TickHistory.RECEIVE_TIME].tolist()
+        )
+        self.assertEqual(0, len(self.history.since(SUBJECT1, 2000.0)["Bid"]))
+        self.assertEqual(4, len(self.history.since(SUBJECT1, 0.0)["Bid"]))
+
+    def test_batches_record_pixie_revisions(self):
+        batch = PriceBatchEvent(
+            [
+                PriceEvent(SUBJECT1, {"Bid": 1}, True),
+                PriceEvent(SUBJECT2, {"Bid": 2}, True),
+            ],
+            edition=1,
+            revision=7,
+            revision_time=1234,
+        )
+        self.history.price_batch_fn(batch)
+        window = self.history.last(SUBJECT2)
+        self.assertListEqual([7], window[TickHistory.REVISION].tolist())
+        self.assertListEqual([1234], window[TickHistory.REVISION_TIME].tolist())
+        self.assertListEqual(batch.events, self.published)
+
+    def test_unknown_subject_has_an_empty_window(self):
+        window = self.history.last(SUBJECT1, 10)
+        self.assertEqual(0, len(window["Bid"]))
+        self.assertEqual(0, self.history.count(SUBJECT1))
+
+    def test_memory_is_capped(self):
+        ring_bytes = 4 * 8 * 5
+        history = TickHistory(
+            self.callbacks, ["Bid", "Ask"], size=4, max_bytes=ring_bytes
+        )
+        with self.assertLogs("bidfx.pricing.history"):
+            history.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1}, True))
+            history.price_event_fn(PriceEvent(SUBJECT2, {"Bid": 2}, True))
+        self.assertListEqual([SUBJECT1], history.subjects())
+        self.assertEqual(ring_bytes, history.memory_used)
+        history.discard(SUBJECT1)
+        history.price_event_fn(PriceEvent(SUBJECT2, {"Bid": 2}, True))
+        self.assertListEqual([SUBJECT2], history.subjects())
+
+
+class TestPricingAPITickHistory(TestCase):
+    def test_tick_history_is_enabled_by_config(self):
+        config = ConfigParser()
+        config.read_string(
+            "[DEFAULT]\nusername = user\ndefault_account = ACCT\ndisable = true\n"
+            "tick_history_fields = Bid,Ask\ntick_history_size = 10\n"
+            "[Exclusive Pricing]\n[Shared Pricing]\n"
+        )
+        pricing = PricingAPI(config)
+        history = pricing.tick_history
+        self.assertIs(history, pricing._provider_callbacks)
+        self.assertListEqual(["Bid", "Ask"], history.fields)
+        history.price_event_fn(PriceEvent(SUBJECT1, {"Bid": 1}, True))
+        pricing.unsubscribe(SUBJECT1)
+        self.assertNotIn(SUBJECT1, history)
@@ -0,0 +1,87 @@
+import threading
+from unittest import TestCase
+
+from bidfx.pricing._timer_wheel import TimerWheel, shared_timer_wheel
+
+
+class TestTimerWheel(TestCase):
+    def setUp(self):
+        self.wheel = TimerWheel(tick=0.01, slots=8)
+
+    def tearDown(self):
+        self.wheel.stop()
+
+    def test_task_runs_once_after_delay(self):
+        fired = threading.Event()
+        calls = []
+
+        def task():
+            calls.append(1)
+            fired.set()
+
+        self.wheel.schedule(0.02, task)
+        self.assertTrue(fired.wait(5))
+        threading.Event().wait(0.1)
+        self.assertEqual(1, len(calls))
+
+    def test_delay_beyond_one_turn_of_the_wheel(self):
+        fired = threading.Event()
+        started = self.wheel.schedule(0.001, lambda: None)
+        self.wheel.schedule(0.2, fired.set)
+        self.assertFalse(fired.wait(0.1))
+        self.assertTrue(fired.wait(5))
+        started.cancel()
+
+    def test_repeating_task_runs_until_cancelled(self):
+        calls = []
+        done = threading.Event()
+
+        def task():
+            calls.append(1)
+            if len(calls) == 3:
+                done.set()
+
+        timer = self.wheel.schedule(0.01, task, interval=0.01)
+        self.assertTrue(done.wait(5))
+        timer.cancel()
+        count = len(calls)
+        threading.Event().wait(0.1)
+        self.assertLessEqual(len(calls), count + 1)
+
+    def test_cancelled_task_does_not_run(self):
+        fired = threading.Event()
+        self.wheel.schedule(0.05, fired.set).cancel()
+        self.assertFalse(fired.wait(0.2))
+
+    def test_failing_task_is_logged_and_the_wheel_keeps_running(self):
+        fired = threading.Event()
+
+        def fail():
+            raise ValueError("failed")
+
+        with self.assertLogs("bidfx.pricing.timer"):
+            self.wheel.schedule(0.01, fail)
+            self.wheel.schedule(0.05, fired.set)
+            self.assertTrue(fired.wait(5))
+
+    def test_stop_ends_the_thread_and_drops_the_timers(self):
+        fired = threading.Event()
+        self.wheel.schedule(0.05, fired.set)
+        thread = self.wheel._thread
+        self.wheel.stop()
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(fired.wait(0.1))
+        self.wheel.schedule(0.01, fired.set)
+        self.assertTrue(fired.wait(5))
+
+    def test_thread_ends_once_no_timers_are_left(self):
+        fired = threading.Event()
+        self.wheel.schedule(0.01, fired.set)
+        thread = self.wheel._thread
+        self.assertTrue(fired.wait(5))
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(self.wheel._thread)
+
+    def test_wheel_is_shared(self):
+        self.assertIs(shared_timer_wheel(), shared_timer_wheel())
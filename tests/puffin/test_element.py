@@ -247,6 +247,25 @@ class TestExtractPrice(unittest.TestCase):
             price,
         )
 
+    def test_extract_price_of_selected_fields(self):
+        message = (
+            Element("Update")
+            .set(
+                "Subject",
+                "AssetClass=FixedIncome,Exchange=SGC,Level=1,Source=Lynx,Symbol=DE000A14KK32",
+            )
+            .nest(
+                Element("Price")
+                .set("Bid", "100.5")
+                .set("Ask", "102.5")
+                .set("Status", "OK")
+                .set("BidSize", "1000")
+                .set("AskSize", "3000")
+            )
+        )
+        price = message.extract_price(frozenset(["Bid", "Ask", "Status"]))
+        self.assertDictEqual({"Bid": "100.5", "Ask": "102.5"}, price)
+
 
 class DummySocket:
     def __init__(self, bytes_):
@@ -76,3 +76,32 @@ class TestCompression(unittest.TestCase):
             b"\x83\x81\x82\x01",
             self.opened_socket.collected(),
         )
+
+
+class TestBufferedWrites(unittest.TestCase):
+    def setUp(self):
+        self.opened_socket = DummySocket()
+        self.compressor = MessageCompressor(self.opened_socket)
+
+    def test_each_message_is_sent_in_a_single_write(self):
+        self.compressor.compress_message(
+            Element("Subscribe").set(
+                "Subject",
+                "AssetClass=Fx,Exchange=OTC,Level=1,Source=DBFX,Symbol=GBPUSD",
+            )
+        )
+        self.compressor.compress_message(Element("Heartbeat"))
+        self.assertEqual(2, len(self.opened_socket._collection))
+
+    def test_unflushed_messages_are_held_until_flush(self):
+        self.compressor.compress_message(Element("Heartbeat"), flush=False)
+        self.compressor.compress_message(Element("Heartbeat"), flush=False)
+        self.assertEqual(b"", self.opened_socket.collected())
+        self.compressor.flush()
+        self.assertEqual([b"\x02Heartbeat\x01\x80\x01"], self.opened_socket._collection)
+
+    def test_flush_with_nothing_buffered_does_not_write(self):
+        self.compressor.flush()
+        self.compressor.compress_message(Element("Heartbeat"))
+        self.compressor.flush()
+        self.assertEqual([b"\x02Heartbeat\x01"], self.opened_socket._collection)
@@ -1,5 +1,8 @@
+import socket
 import unittest
 
+from bidfx import PricingError, ScaledValue
+
 from bidfx.pricing._puffin.message_decompressor import MessageDecompressor
 from bidfx.pricing._puffin.element import Element
 
@@ -40,6 +43,48 @@ class TestDecompression(unittest.TestCase):
             decompressor.decompress_message(),
         )
 
+    def test_drained_function_is_called_before_each_socket_read(self):
+        opened_socket = DummySocket(b"\x02Heartbeat\x00\x80", b"\x00")
+        drained = []
+        decompressor = MessageDecompressor(
+            opened_socket, on_drained=lambda: drained.append(True)
+        )
+        self.assertEqual(Element("Heartbeat"), decompressor.decompress_message())
+        self.assertEqual(1, len(drained))
+        self.assertEqual(Element("Heartbeat"), decompressor.decompress_message())
+        self.assertEqual(2, len(drained))
+
+    def test_tokens_split_across_socket_reads(self):
+        opened_socket = DummySocket(
+            b"\x02Heart", b"beat\x04Inter", b"val\x05", b"1000\x00\x80\x81", b"\x82\x00"
+        )
+        decompressor = MessageDecompressor(opened_socket)
+        expected = Element("Heartbeat").set("Interval", "1000")
+        self.assertEqual(expected, decompressor.decompress_message())
+        self.assertEqual(expected, decompressor.decompress_message())
+
+    def test_text_longer_than_the_buffer(self):
+        text = "Symbol=" + "X" * 100
+        opened_socket = DummySocket(
+            b"\x02Status\x04Text\x08" + text[:20].encode("ascii"),
+            text[20:60].encode("ascii"),
+            text[60:].encode("ascii") + b"\x00",
+        )
+        decompressor = MessageDecompressor(opened_socket, buffer_size=64)
+        self.assertEqual(
+            Element("Status").set("Text", text), decompressor.decompress_message()
+        )
+
+    def test_plain_text_in_place_of_token_type_is_an_error(self):
+        decompressor = MessageDecompressor(DummySocket(b"Heartbeat\x00"))
+        with self.assertRaises(PricingError):
+            decompressor.decompress_message()
+
+    def test_end_of_stream(self):
+        decompressor = MessageDecompressor(DummySocket(b"\x02Heartbeat"))
+        with self.assertRaises(socket.error):
+            decompressor.decompress_message()
+
     def test_fragmented_single_price_update(self):
         opened_socket = DummySocket(
             b"\x02Update\x04Subject\x08AssetClass=FixedIncome,Exchange=SGC,Level=1,Source=Lynx,Symbol=DE000A14KK32",
@@ -90,6 +135,51 @@ class TestDecompression(unittest.TestCase):
         self.assertEqual(expected, decompressor.decompress_message())
         self.assertEqual(expected, decompressor.decompress_message())
 
+    def test_numeric_price_values(self):
+        opened_socket = DummySocket(
+            b"\x02Update\x04Subject\x08AssetClass=FixedIncome,Exchange=SGC,Level=1,Source=Lynx,Symbol=DE000A14KK32",
+            b"\x02Price\x04Bid\x06100.5\x04Ask\x06102.5\x04BidSize\x051000\x04AskSize\x053000",
+            b"\x04Name\x08Vodafone plc\x01\x00"
+            b"\x80\x81\x82\x83\x84\x85\x86\x87\x88\x89\x8A\x8B\x8C\x8D\x01\x00",
+        )
+        decompressor = MessageDecompressor(opened_socket, "numeric")
+        expected = (
+            Element("Update")
+            .set(
+                "Subject",
+                "AssetClass=FixedIncome,Exchange=SGC,Level=1,Source=Lynx,Symbol=DE000A14KK32",
+            )
+            .nest(
+                Element("Price")
+                .set("Bid", 100.5)
+                .set("Ask", 102.5)
+                .set("BidSize", 1000)
+                .set("AskSize", 3000)
+                .set("Name", "Vodafone plc")
+            )
+        )
+        self.assertEqual(expected, decompressor.decompress_message())
+        self.assertEqual(expected, decompressor.decompress_message())
+
+    def test_scaled_price_values(self):
+        opened_socket = DummySocket(
+            b"\x02Update\x04Subject\x08AssetClass=FixedIncome,Exchange=SGC,Level=1,Source=Lynx,Symbol=DE000A14KK32",
+            b"\x02Price\x04Bid\x06100.5\x04Ask\x06102.5\x04BidSize\x051000\x04AskSize\x053000",
+            b"\x04Name\x08Vodafone plc\x01\x00",
+        )
+        decompressor = MessageDecompressor(opened_socket, "scaled")
+        price = decompressor.decompress_message().extract_price()
+        self.assertEqual(
+            {
+                "Bid": ScaledValue(1005, 1),
+                "Ask": ScaledValue(1025, 1),
+                "BidSize": 1000,
+                "AskSize": 3000,
+                "Name": "Vodafone plc",
+            },
+            price,
+        )
+
     def test_depth_price_update(self):
         opened_socket = DummySocket(
             b"\x02Set\x04Subject\x08AssetClass=Equity,Exchange=LSE,Level=Depth,Source=ComStock,Symbol=E:VOD"
@@ -0,0 +1,36 @@
+from configparser import ConfigParser
+from unittest import TestCase
+
+from bidfx import Callbacks, PriceBatchEvent, PriceEvent, ProviderEvent, Subject
+from bidfx.pricing._puffin.puffin_provider import PuffinProvider
+
+SUBJECT1 = Subject.parse_string("Source=A,Symbol=EURGBP")
+
+
+class DisconnectedDecompressor:
+    def decompress_message(self):
+        raise ConnectionResetError("end of socket stream")
+
+
+class TestPuffinProvider(TestCase):
+    def setUp(self):
+        config = ConfigParser()
+        config.read_string(
+            "[Shared Pricing]\nhost = localhost\nusername = user\npassword = pass\n"
+        )
+        self.published = []
+        self.callbacks = Callbacks()
+        self.callbacks.price_batch_fn = self.published.append
+        self.callbacks.provider_event_fn = self.published.append
+        self.provider = PuffinProvider(config["Shared Pricing"], self.callbacks)
+
+    def test_buffered_prices_are_published_before_the_provider_goes_down(self):
+        event = PriceEvent(SUBJECT1, {"Bid": 1}, True)
+        self.provider._price_batch = [event]
+        self.provider._decompressor = DisconnectedDecompressor()
+        self.provider._running = True
+        self.provider._price_server_read_loop()
+        self.assertIsInstance(self.published[0], PriceBatchEvent)
+        self.assertListEqual([event], self.published[0].events)
+        self.assertIsInstance(self.published[1], ProviderEvent)
+        self.assertEqual([], self.provider._price_batch)